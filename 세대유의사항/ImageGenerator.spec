@@ -12,28 +12,25 @@ a = Analysis(
     hiddenimports=[
         'src.utils.company_colors',  # 새로 추가된 색상 관리 모듈
         'src.core.excel_to_json',
+        'src.core.excel_loader',
         'src.core.json_to_image', 
         'src.core.local_file_manager',
         'src.core.position_settings',
+        'src.core.notice_document',
+        'src.core.output_profiles',
+        'src.core.template_cache',
+        'src.core.output_sink',
+        'src.core.incremental_render',
+        'src.core.render_cache',
+        'src.core.batch_runner',
+        'src.core.preview',
         'src.gui.gui_app',
         'src.utils.text_utils',
-        'pandas',
-        'pandas._libs',
-        'pandas._libs.tslibs',
-        'pandas._libs.tslibs.base',
-        'pandas._libs.tslibs.timedeltas',
-        'pandas._libs.tslibs.np_datetime',
-        'pandas._libs.tslibs.nattype',
-        'pandas._libs.tslibs.timezones',
-        'numpy',
-        'numpy.core',
-        'numpy.core.multiarray',
-        'numpy.core.numeric',
-        'numpy.core.umath',
-        'numpy.core._multiarray_umath',
-        'numpy.fft',
-        'numpy.linalg',
-        'numpy.random',
+        'src.utils.text_measure',
+        'src.utils.line_estimator',
+        'src.utils.tracing',
+        'src.utils.progress',
+        'src.utils.startup_timing',
         'PIL',
         'openpyxl',
         'io',
@@ -51,7 +48,8 @@ a = Analysis(
     excludes=[
         'matplotlib',  # 불필요한 대용량 모듈 제외
         'scipy',
-        'numpy.testing',
+        'pandas',  # 엑셀은 openpyxl로 직접 읽음 (pandas/numpy 불필요)
+        'numpy',
         'pytest'
     ],
     noarchive=False,
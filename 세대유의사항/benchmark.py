@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+주의사항 이미지 생성기 - 성능 측정 실행 파일
+
+합성 엑셀(10/100/1,000/5,000행)로 엑셀 읽기 → 위치 계산 → 이미지 렌더링 전체를 측정하고
+기준값 파일(기본: config/benchmark_baseline.json)과 비교합니다. 회귀가 있으면 종료 코드 1.
+
+Usage:
+    python benchmark.py --fonts assets/fonts --save-baseline      # 기준값 저장
+    python benchmark.py --fonts assets/fonts                      # 기준값과 비교
+    python benchmark.py --sizes 10 100 --templates 호반 계룡       # 일부만 측정
+    python benchmark.py --templates all --repeat 3                # 모든 템플릿, 3회 중 최솟값
+"""
+
+import argparse
+import os
+import sys
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, project_root)
+
+from src.core.benchmark import BENCHMARK_SIZES, DEFAULT_TOLERANCES, BenchmarkSuite
+from src.core.local_file_manager import LocalFileManager
+from src.core.output_profiles import get_profile_names
+
+DEFAULT_BASELINE_PATH = os.path.join(project_root, 'config', 'benchmark_baseline.json')
+
+# 템플릿을 지정하지 않았을 때 측정할 템플릿
+DEFAULT_TEMPLATE = '호반'
+
+
+def parse_args(argv=None):
+    """명령줄 인자 파싱"""
+    parser = argparse.ArgumentParser(description="합성 엑셀로 이미지 생성 전체 과정의 성능을 측정합니다.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(BENCHMARK_SIZES),
+                        help=f"측정할 행 수 (기본값: {' '.join(map(str, BENCHMARK_SIZES))})")
+    parser.add_argument('--templates', nargs='+', default=[DEFAULT_TEMPLATE],
+                        help=f"측정할 템플릿 이름 (assets/templates, 'all'이면 전체, 기본값: {DEFAULT_TEMPLATE})")
+    parser.add_argument('--fonts', help="폰트 폴더 (기본값: assets/fonts)")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE_PATH,
+                        help="기준값 파일 (기본값: config/benchmark_baseline.json)")
+    parser.add_argument('--save-baseline', action='store_true', help="측정 결과를 기준값 파일로 저장 (비교하지 않음)")
+    parser.add_argument('--repeat', type=int, default=1, help="측정 반복 횟수 - 항목별 최솟값 사용 (기본값: 1)")
+    parser.add_argument('--seed', type=int, default=0, help="합성 데이터 seed (기본값: 0)")
+    parser.add_argument('--time-tolerance', type=float, default=DEFAULT_TOLERANCES['seconds'],
+                        help=f"시간 허용 증가 비율 (기본값: {DEFAULT_TOLERANCES['seconds']})")
+    parser.add_argument('--chunk-height', type=int, default=2000, help="청크 높이 (기본값: 2000px)")
+    parser.add_argument('--no-split', action='store_true', help="청크 분할 없이 전체 이미지만 저장")
+    parser.add_argument('--stream', action='store_true', help="청크 단위 스트리밍 렌더링")
+    parser.add_argument('-p', '--profile', default='default', choices=get_profile_names(),
+                        help="출력 형식 프로파일 (기본값: default)")
+    return parser.parse_args(argv)
+
+
+def resolve_templates(names):
+    """템플릿 이름 목록 → {이름: 경로}"""
+    file_manager = LocalFileManager()
+    if names == ['all']:
+        names = file_manager.get_available_templates()
+
+    template_paths = {}
+    for name in names:
+        path = file_manager.find_template_file_path(name)
+        if not path:
+            raise FileNotFoundError(f"템플릿을 찾을 수 없습니다: {name}")
+        template_paths[name] = path
+    return template_paths
+
+
+def main(argv=None):
+    """메인 함수"""
+    args = parse_args(argv)
+
+    try:
+        template_paths = resolve_templates(args.templates)
+    except FileNotFoundError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 2
+
+    suite = BenchmarkSuite(
+        template_paths,
+        sizes=args.sizes,
+        fonts_path=args.fonts,
+        repeat=args.repeat,
+        seed=args.seed,
+        render_options={
+            'split_chunks': not args.no_split,
+            'chunk_height': args.chunk_height,
+            'output_profile': args.profile,
+            'streaming': args.stream
+        },
+        tolerances={'seconds': args.time_tolerance}
+    )
+
+    print(f"측정: 템플릿 {len(template_paths)}개 × 행 수 {args.sizes} (반복 {suite.repeat}회)")
+    results = suite.run()
+
+    if args.save_baseline:
+        suite.save_baseline(args.baseline, results)
+        print(f"기준값 저장: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"기준값 파일이 없어 비교하지 않습니다: {args.baseline} (--save-baseline으로 저장)")
+        return 0
+
+    try:
+        baseline = suite.load_baseline(args.baseline)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"❌ 기준값 파일을 읽을 수 없습니다: {e}", file=sys.stderr)
+        return 2
+
+    missing = [name for name in results if name not in baseline]
+    if missing:
+        print(f"기준값에 없는 측정 (비교 생략): {', '.join(missing)}")
+
+    regressions = suite.compare(results, baseline)
+    if regressions:
+        print(f"❌ 성능 회귀 {len(regressions)}건:")
+        for regression in regressions:
+            print(f"  - {regression}")
+        return 1
+
+    print("✅ 기준값 대비 회귀 없음")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+주의사항 이미지 생성기 - 명령줄(배치) 실행 파일
+
+GUI(tkinter) 없이 여러 엑셀 파일을 한 번에 처리합니다.
+
+Usage:
+    python cli.py 파일1.xlsx 파일2.xlsx --company 호반 -o output
+    python cli.py --manifest jobs.csv -o output --workers 4
+
+매니페스트(CSV) 형식:
+    excel,company,template
+    data/호반_1동.xlsx,호반,
+    data/계룡.xlsx,계룡,templates/계룡_수정본.jpg
+"""
+
+import argparse
+import logging
+import multiprocessing
+import os
+import sys
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, project_root)
+
+from src.core.batch_runner import BatchJob, BatchRunner, load_manifest
+from src.core.output_profiles import get_profile_names, summarize_encode_stats
+from src.core.output_sink import DEFAULT_ZIP_COMPRESSION, ZIP_COMPRESSIONS
+from src.utils.tracing import create_file_sink, disable_tracing, enable_tracing
+
+
+def parse_args(argv=None):
+    """명령줄 인자 파싱"""
+    parser = argparse.ArgumentParser(
+        description="엑셀 파일로 주의사항 이미지를 일괄 생성합니다 (GUI 없음)."
+    )
+    parser.add_argument('excel_files', nargs='*', help="처리할 엑셀 파일 경로")
+    parser.add_argument('-m', '--manifest', help="작업 목록 CSV 파일 (헤더: excel,company,template)")
+    parser.add_argument('-c', '--company', help="건설사명 (엑셀 파일 인자에 공통 적용)")
+    parser.add_argument('-t', '--template', help="템플릿 이름 또는 템플릿 이미지 경로 (엑셀 파일 인자에 공통 적용)")
+    parser.add_argument('-o', '--output', default=os.path.join(project_root, 'output'),
+                        help="결과 저장 디렉토리 (기본값: 프로젝트 output 폴더)")
+    parser.add_argument('--chunk-height', type=int, default=2000, help="청크 높이 (기본값: 2000px)")
+    parser.add_argument('--no-split', action='store_true', help="청크 분할 없이 전체 이미지만 저장")
+    parser.add_argument('--stream', action='store_true',
+                        help="청크 단위 스트리밍 렌더링 (전체 이미지 없이 청크만 저장, 긴 시트의 메모리 사용량 제한)")
+    parser.add_argument('-p', '--profile', default='default', choices=get_profile_names(),
+                        help="출력 형식 프로파일 (기본값: default)")
+    parser.add_argument('--zip', action='store_true',
+                        help="작업별 결과를 '{건설사명}_{타임스탬프}.zip' 하나로 저장 (이미지 파일을 따로 만들지 않음)")
+    parser.add_argument('--zip-compression', default=DEFAULT_ZIP_COMPRESSION, choices=list(ZIP_COMPRESSIONS),
+                        help="ZIP 압축 방식 (기본값: store - 이미 압축된 이미지는 그대로 저장)")
+    parser.add_argument('--cache', action='store_true',
+                        help="렌더링 결과 캐시 사용 (같은 입력이면 저장된 이미지를 그대로 출력, 기본 폴더: 사용자 캐시 폴더의 ImageGenerator/renders)")
+    parser.add_argument('--cache-dir', help="렌더링 결과 캐시 폴더 (지정하면 --cache 없이도 캐시 사용)")
+    parser.add_argument('-j', '--workers', type=int, default=1,
+                        help="동시에 실행할 프로세스 수 (기본값: 1, 0이면 CPU 코어 수)")
+    parser.add_argument('--stop-on-error', action='store_true', help="오류 발생 시 나머지 작업 중단")
+    parser.add_argument('--list-templates', action='store_true', help="사용 가능한 템플릿 목록 출력 후 종료")
+    parser.add_argument('--trace', metavar='FILE',
+                        help="단계별 시간 기록 파일 (.jsonl이면 JSON Lines, 그 외는 Chrome 추적 형식 .json) "
+                             "- 현재 프로세스의 구간만 기록되므로 -j 1에서 사용")
+    parser.add_argument('-v', '--verbose', action='store_true', help="레이어/청크별 상세 로그 출력")
+    parser.add_argument('-q', '--quiet', action='store_true', help="경고와 결과 요약만 출력")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """메인 함수"""
+    args = parse_args(argv)
+
+    if args.verbose:
+        log_level = logging.DEBUG
+    elif args.quiet:
+        log_level = logging.WARNING
+    else:
+        log_level = logging.INFO
+    logging.basicConfig(level=log_level, format='%(message)s')
+
+    if args.list_templates:
+        from src.core.local_file_manager import LocalFileManager
+        for template in LocalFileManager().get_available_templates():
+            print(template)
+        return 0
+
+    jobs = []
+    if args.manifest:
+        jobs.extend(load_manifest(args.manifest))
+    for excel_file in args.excel_files:
+        jobs.append(BatchJob(excel_file, args.company, args.template))
+
+    if not jobs:
+        print("처리할 엑셀 파일이 없습니다. 엑셀 파일 경로 또는 --manifest를 지정하세요.", file=sys.stderr)
+        return 2
+
+    cache_dir = args.cache_dir
+    if args.cache and not cache_dir:
+        from src.core.local_file_manager import LocalFileManager
+        cache_dir = LocalFileManager().cache_path
+
+    runner = BatchRunner(
+        args.output,
+        split_chunks=not args.no_split,
+        chunk_height=args.chunk_height,
+        output_profile=args.profile,
+        streaming=args.stream,
+        zip_output=args.zip,
+        zip_compression=args.zip_compression,
+        render_cache_dir=cache_dir
+    )
+    if args.trace:
+        if args.workers != 1:
+            print("⚠️ --trace는 현재 프로세스의 구간만 기록합니다 (워커 프로세스 구간은 제외, -j 1 권장)", file=sys.stderr)
+        tracer = enable_tracing(create_file_sink(args.trace))
+    try:
+        results = runner.run(jobs, stop_on_error=args.stop_on_error, workers=args.workers)
+    finally:
+        if args.trace:
+            disable_tracing()
+            print(tracer.summary())
+            print(f"단계별 시간 기록: {args.trace}")
+
+    failed = [result for result in results if 'error' in result]
+    total_files = sum(len(result['files']) for result in results)
+    encode_stats = [record for result in results for record in result.get('encode_stats', [])]
+    if encode_stats:
+        print(f"\n출력 형식 {summarize_encode_stats(encode_stats)}")
+    print(f"\n완료: 작업 {len(results) - len(failed)}/{len(jobs)}개 성공, 이미지 {total_files}개 저장 → {args.output}")
+    if cache_dir:
+        cached_jobs = sum(1 for result in results
+                          if result.get('encode_stats') and all(record.get('cached') for record in result['encode_stats']))
+        print(f"  렌더링 캐시: 작업 {cached_jobs}개 캐시 사용 ({cache_dir})")
+    for result in results:
+        if result.get('archive'):
+            print(f"  ZIP: {os.path.basename(result['archive'])} ({len(result['files'])}개 이미지)")
+    for result in failed:
+        print(f"  실패: {result['job'].excel_file_path} - {result['error']}", file=sys.stderr)
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    # 패키징된 실행 파일에서 프로세스 풀 사용 시 필요
+    multiprocessing.freeze_support()
+    sys.exit(main())
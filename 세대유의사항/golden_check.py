@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+주의사항 이미지 생성기 - 골든 이미지 회귀 검사 실행 파일
+
+고정된 시트 모음(short/medium/edge) × assets/templates의 템플릿을 렌더링하여 결과 이미지 픽셀 해시를
+골든 파일(기본: config/golden/golden_hashes.json)과 비교합니다. 다르면 비교 이미지를 저장하고 종료 코드 1.
+같은 실행에서 JsonToImage.generate_image_from_json 시간도 측정하여 골든 저장 시간과 함께 보고합니다.
+
+Usage:
+    python golden_check.py --fonts assets/fonts --save --store-images   # 골든 저장 (이미지 포함)
+    python golden_check.py --fonts assets/fonts                         # 골든과 비교
+    python golden_check.py --templates 호반 계룡 --sheets edge           # 일부만 검사
+    python golden_check.py --modes canvas streaming incremental cached  # 모든 렌더링 방식 검사
+"""
+
+import argparse
+import os
+import sys
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, project_root)
+
+from src.core.golden_images import CORPUS, DEFAULT_MODES, RENDER_MODES, GoldenImageHarness
+from src.core.local_file_manager import LocalFileManager
+
+DEFAULT_GOLDEN_DIR = os.path.join(project_root, 'config', 'golden')
+DEFAULT_DIFF_DIR = os.path.join(project_root, 'output', 'golden_diff')
+
+
+def parse_args(argv=None):
+    """명령줄 인자 파싱"""
+    parser = argparse.ArgumentParser(description="고정된 시트 모음 × 템플릿 렌더링 결과를 골든 이미지와 비교합니다.")
+    parser.add_argument('--save', action='store_true', help="현재 결과를 골든으로 저장 (비교하지 않음)")
+    parser.add_argument('--store-images', action='store_true',
+                        help="--save 시 골든 이미지도 저장 (이후 비교 이미지의 기준)")
+    parser.add_argument('--golden-dir', default=DEFAULT_GOLDEN_DIR, help="골든 폴더 (기본값: config/golden)")
+    parser.add_argument('--templates', nargs='+', default=['all'],
+                        help="검사할 템플릿 이름 (assets/templates, 기본값: all)")
+    parser.add_argument('--sheets', nargs='+', choices=list(CORPUS), default=list(CORPUS),
+                        help=f"검사할 시트 (기본값: {' '.join(CORPUS)})")
+    parser.add_argument('--modes', nargs='+', choices=RENDER_MODES, default=list(DEFAULT_MODES),
+                        help=f"검사할 렌더링 방식 (canvas는 항상 포함, 기본값: {' '.join(DEFAULT_MODES)})")
+    parser.add_argument('--fonts', help="폰트 폴더 (기본값: assets/fonts)")
+    parser.add_argument('--chunk-height', type=int, default=2000, help="청크 높이 (기본값: 2000px)")
+    parser.add_argument('--diff-dir', default=DEFAULT_DIFF_DIR, help="비교 이미지 저장 폴더 (기본값: output/golden_diff)")
+    parser.add_argument('--time-tolerance', type=float,
+                        help="골든 저장 시간 대비 허용 증가 비율 - 지정하면 초과 시 실패 (기본값: 보고만)")
+    return parser.parse_args(argv)
+
+
+def resolve_templates(names):
+    """템플릿 이름 목록 → {이름: 경로}"""
+    file_manager = LocalFileManager()
+    if names == ['all']:
+        names = file_manager.get_available_templates()
+
+    template_paths = {}
+    for name in names:
+        path = file_manager.find_template_file_path(name)
+        if not path:
+            raise FileNotFoundError(f"템플릿을 찾을 수 없습니다: {name}")
+        template_paths[name] = path
+    return template_paths
+
+
+def main(argv=None):
+    """메인 함수"""
+    args = parse_args(argv)
+
+    try:
+        template_paths = resolve_templates(args.templates)
+    except FileNotFoundError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 2
+
+    harness = GoldenImageHarness(
+        args.golden_dir,
+        template_paths,
+        sheets=args.sheets,
+        modes=args.modes,
+        fonts_path=args.fonts,
+        chunk_height=args.chunk_height,
+        diff_dir=args.diff_dir
+    )
+
+    if not args.save:
+        try:
+            golden = harness.load_golden()
+        except (OSError, ValueError, KeyError) as e:
+            print(f"❌ 골든 파일을 읽을 수 없습니다: {e}", file=sys.stderr)
+            return 2
+        if golden is None:
+            print(f"골든 파일이 없어 렌더링 방식끼리만 비교합니다: {harness.golden_path} (--save로 저장)")
+
+    print(f"검사: 시트 {len(harness.sheets)}개 × 템플릿 {len(template_paths)}개 × 방식 {', '.join(harness.modes)}")
+    report = harness.run(save=args.save, store_images=args.store_images)
+
+    print("렌더링 시간 합계 (generate_image_from_json)")
+    for mode, total in harness.summarize_timings(report).items():
+        line = f"  {mode:<12} {total['seconds']:8.2f}s"
+        if total['golden_seconds']:
+            line += f"  (골든 {total['golden_seconds']:.2f}s → {total['compared_seconds']:.2f}s)"
+        print(line)
+
+    if args.save:
+        print(f"골든 저장: {harness.golden_path}")
+        return 0
+
+    missing = [name for name in report['cases'] if report['golden'] and name not in report['golden']['cases']]
+    if missing:
+        print(f"골든에 없는 케이스 (렌더링 방식끼리만 비교): {', '.join(missing)}")
+
+    failures = list(report['failures'])
+    if args.time_tolerance is not None:
+        failures.extend(harness.compare_timings(report, args.time_tolerance))
+    if failures:
+        print(f"❌ 골든 불일치 {len(failures)}건:")
+        for failure in failures:
+            print(f"  - {failure}")
+        return 1
+
+    print("✅ 골든 이미지와 일치")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -4,29 +4,67 @@
 
 Usage:
     python main.py
+    python main.py --startup-report   # 시작 시간 보고서 출력 (창은 그대로 유지)
+    python main.py --startup-check    # 보고서 출력 후 종료, 예산 초과 시 종료 코드 1
+
+시작 예산(초)은 환경 변수 IMAGE_GENERATOR_STARTUP_BUDGET으로 변경할 수 있습니다.
 """
 
+import time
+
+# 시작 시간 측정 기준점 (다른 임포트보다 먼저)
+_startup_origin = time.perf_counter()
+
+import logging
 import sys
 import os
-import tkinter as tk
 
 # 프로젝트 루트를 Python 경로에 추가
 project_root = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, project_root)
 
-from src.gui.gui_app import ImageGeneratorApp
+from src.utils.startup_timing import StartupTimer
+
+startup_timer = StartupTimer(origin=_startup_origin)
+tk = startup_timer.timed_import('tkinter')
+gui_app = startup_timer.timed_import('src.gui.gui_app')
+
+
+def wait_and_report(root, app, exit_after):
+    """백그라운드 로딩 완료 후 시작 시간 보고서 출력"""
+    def poll():
+        if not app.background_ready.is_set():
+            root.after(50, poll)
+            return
+        print(startup_timer.report())
+        if exit_after:
+            root.destroy()
+    poll()
 
 
 def main():
     """메인 함수"""
+    startup_report = '--startup-report' in sys.argv
+    startup_check = '--startup-check' in sys.argv
+    # 렌더링 모듈 로그(진행 요약, 경고)를 콘솔에 출력 - 레이어/청크별 상세 로그(DEBUG)는 제외
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
     try:
         root = tk.Tk()
-        app = ImageGeneratorApp(root)
+        startup_timer.mark('tk_root_created')
+        app = gui_app.ImageGeneratorApp(root, startup_timer=startup_timer)
+        startup_timer.mark('app_initialized')
+        if startup_report or startup_check:
+            wait_and_report(root, app, exit_after=startup_check)
         root.mainloop()
     except Exception as e:
         print(f"애플리케이션 실행 중 오류 발생: {e}")
         input("아무 키나 눌러서 종료...")
+        return 1
+
+    if startup_check:
+        return 0 if startup_timer.within_budget() else 1
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
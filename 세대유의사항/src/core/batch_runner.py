@@ -0,0 +1,414 @@
+"""
+일괄 처리(배치) 실행 모듈
+GUI 없이 여러 엑셀 파일을 연속으로 처리하여 이미지를 생성합니다.
+
+tkinter를 임포트하지 않으므로 헤드리스 빌드 에이전트에서도 실행할 수 있습니다.
+"""
+
+import csv
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from .local_file_manager import LocalFileManager
+from .output_sink import DEFAULT_ZIP_COMPRESSION, DirectorySink, ZipSink
+from .render_cache import RenderCache
+from .position_settings import PositionSettings
+from ..utils.tracing import span
+
+
+class BatchJob:
+    """배치 작업 하나 (엑셀 파일 + 건설사 + 템플릿)"""
+
+    def __init__(self, excel_file_path: str, company_name: Optional[str] = None, template: Optional[str] = None):
+        """
+        Args:
+            excel_file_path: 엑셀 파일 경로
+            company_name: 건설사명 (테마 색상 및 파일명에 사용)
+            template: 템플릿 이름(건설사명) 또는 템플릿 이미지 파일 경로
+        """
+        self.excel_file_path = excel_file_path
+        self.company_name = (company_name or '').strip() or None
+        self.template = (template or '').strip() or None
+
+    def __repr__(self):
+        return f"BatchJob({self.excel_file_path!r}, company={self.company_name!r}, template={self.template!r})"
+
+
+def load_manifest(manifest_path: str) -> List[BatchJob]:
+    """
+    매니페스트(CSV) 파일에서 배치 작업 목록 읽기
+
+    CSV 헤더는 excel, company, template 입니다 (template은 생략 가능).
+    상대 경로는 매니페스트 파일 위치를 기준으로 해석합니다.
+
+    Args:
+        manifest_path: 매니페스트 CSV 파일 경로
+
+    Returns:
+        BatchJob 목록
+    """
+    if not os.path.exists(manifest_path):
+        raise FileNotFoundError(f"매니페스트 파일을 찾을 수 없습니다: {manifest_path}")
+
+    base_dir = os.path.dirname(os.path.abspath(manifest_path))
+
+    def resolve(path):
+        if path and not os.path.isabs(path):
+            return os.path.join(base_dir, path)
+        return path
+
+    jobs = []
+    # utf-8-sig: 엑셀에서 저장한 CSV의 BOM 처리
+    with open(manifest_path, 'r', encoding='utf-8-sig', newline='') as f:
+        reader = csv.DictReader(f)
+        if not reader.fieldnames or 'excel' not in reader.fieldnames:
+            raise ValueError("매니페스트에 'excel' 컬럼이 필요합니다. (헤더: excel,company,template)")
+
+        for line_num, row in enumerate(reader, 2):
+            excel_path = (row.get('excel') or '').strip()
+            if not excel_path:
+                continue
+
+            template = (row.get('template') or '').strip()
+            # 경로 형태(확장자 포함)일 때만 파일 경로로 해석, 아니면 템플릿 이름으로 사용
+            if template and os.path.splitext(template)[1]:
+                template = resolve(template)
+
+            jobs.append(BatchJob(resolve(excel_path), row.get('company'), template))
+
+    return jobs
+
+
+class BatchRunner:
+    """엑셀 → 이미지 생성 파이프라인을 GUI 없이 실행하는 클래스"""
+
+    def __init__(self, output_dir: str, file_manager: Optional[LocalFileManager] = None,
+                 position_settings: Optional[PositionSettings] = None,
+                 split_chunks: bool = True, chunk_height: int = 2000, log=print,
+                 output_profile: str = 'default', streaming: bool = False,
+                 zip_output: bool = False, zip_compression: str = DEFAULT_ZIP_COMPRESSION,
+                 render_cache_dir: Optional[str] = None, encode_workers: Optional[int] = None):
+        """
+        Args:
+            output_dir: 결과 이미지 저장 디렉토리
+            file_manager: 파일 관리자 (기본값: 새 LocalFileManager)
+            position_settings: 위치 설정 (기본값: 새 PositionSettings)
+            split_chunks: 청크 분할 저장 여부
+            chunk_height: 청크 높이 (픽셀)
+            log: 로그 출력 함수
+            output_profile: 출력 형식 프로파일 이름 (output_profiles.OUTPUT_PROFILES 참고)
+            streaming: 청크 단위 스트리밍 렌더링 (전체 이미지 없이 청크만 저장, 메모리 사용량 제한)
+            zip_output: 작업별 결과를 '{건설사명}_{타임스탬프}.zip' 하나로 저장
+            zip_compression: ZIP 압축 방식 ('store' 또는 'deflate')
+            render_cache_dir: 렌더링 결과 캐시 폴더 (None이면 캐시 사용 안 함)
+            encode_workers: 작업당 인코딩 스레드 수 (None이면 JsonToImage 기본값,
+                            병렬 실행 시 워커마다 get_worker_encode_threads로 나눔)
+        """
+        self.output_dir = output_dir
+        self.file_manager = file_manager or LocalFileManager()
+        self.position_settings = position_settings or PositionSettings()
+        self.split_chunks = split_chunks
+        self.chunk_height = chunk_height
+        self.log = log
+        self.output_profile = output_profile
+        self.streaming = streaming
+        self.zip_output = zip_output
+        self.zip_compression = zip_compression
+        self.render_cache_dir = render_cache_dir
+        self.render_cache = RenderCache(render_cache_dir) if render_cache_dir else None
+        self.encode_workers = encode_workers
+        # 이미 사용한 (건설사명, 타임스탬프) - 같은 초에 생성된 작업끼리 파일명이 겹치지 않도록
+        self._used_prefixes = set()
+
+    def preload(self, template_paths=()):
+        """
+        폰트와 템플릿을 미리 로딩 (워커 프로세스 시작 시 1회)
+
+        Args:
+            template_paths: 미리 디코딩할 템플릿 파일 경로 목록
+        """
+        from .template_cache import TemplateCache
+
+        # 레이아웃/렌더링에 쓰이는 폰트를 FontCache에 적재
+        text_utils = self.position_settings.text_utils
+        text_utils.get_font(36, 'bold', 'title')
+        text_utils.get_font(28, 'normal', 'content')
+
+        # 템플릿 디코딩 결과를 TemplateCache에 적재 (같은 템플릿은 프로세스당 1회만 디코딩)
+        for template_path in template_paths:
+            try:
+                TemplateCache.get(template_path)
+            except Exception as e:
+                self.log(f"템플릿 미리 로딩 실패: {template_path} ({e})")
+
+    def resolve_template(self, job: BatchJob) -> str:
+        """작업의 템플릿 이미지 파일 경로 결정"""
+        template = job.template or job.company_name
+        if not template:
+            raise ValueError(f"건설사 또는 템플릿이 지정되지 않았습니다: {job.excel_file_path}")
+
+        if os.path.isfile(template):
+            return template
+
+        template_path = self.file_manager.find_template_file_path(template)
+        if not template_path:
+            raise FileNotFoundError(f"템플릿 파일을 찾을 수 없습니다: {template} (찾은 위치: {self.file_manager.templates_path})")
+        return template_path
+
+    def resolve_construction_name(self, job: BatchJob, template_path: str) -> str:
+        """파일명에 사용할 건설사명 결정 (GUI의 템플릿 직접 선택 규칙과 동일)"""
+        if job.company_name:
+            return job.company_name
+
+        filename_no_ext = os.path.splitext(os.path.basename(template_path))[0]
+        if filename_no_ext.endswith('_템플릿'):
+            return filename_no_ext.replace('_템플릿', '')
+        return filename_no_ext or "사용자지정"
+
+    def next_timestamp(self, construction_name: str) -> str:
+        """파일명용 타임스탬프 생성 (같은 건설사에서 겹치면 1초씩 증가)"""
+        moment = datetime.now()
+        while True:
+            timestamp = moment.strftime("%Y%m%d_%H%M%S")
+            if (construction_name, timestamp) not in self._used_prefixes:
+                self._used_prefixes.add((construction_name, timestamp))
+                return timestamp
+            moment += timedelta(seconds=1)
+
+    def run_job(self, job: BatchJob, timestamp: Optional[str] = None) -> Dict:
+        """
+        배치 작업 하나 실행
+
+        Args:
+            job: 배치 작업
+            timestamp: 파일명용 타임스탬프 (없으면 현재 시각으로 생성)
+
+        Returns:
+            {'job', 'files', 'archive', 'timings', 'encode_stats'} 딕셔너리
+            (files는 최종 저장된 파일 경로 목록 - ZIP 저장 시 ZIP 안의 파일 이름,
+             archive는 ZIP 파일 경로 또는 None, encode_stats는 파일별 인코딩 시간/크기)
+        """
+        with span('job', excel=os.path.basename(job.excel_file_path)):
+            return self._run_job(job, timestamp)
+
+    def _run_job(self, job: BatchJob, timestamp: Optional[str]) -> Dict:
+        # JsonToImage는 PIL을 사용하므로 실제 실행 시점에 임포트
+        from .json_to_image import JsonToImage
+
+        timings = {}
+        started = time.perf_counter()
+
+        template_path = self.resolve_template(job)
+        construction_name = self.resolve_construction_name(job, template_path)
+        company_name = job.company_name or construction_name
+        # 디코딩된 템플릿 타일 (TemplateCache - 같은 템플릿은 다시 디코딩하지 않음)
+        template_source = self.file_manager.get_template_tiles(template_path)
+
+        stage_start = time.perf_counter()
+        document = self.file_manager.process_excel(job.excel_file_path, self.position_settings, company_name)
+        timings['excel'] = time.perf_counter() - stage_start
+
+        # GUI와 같은 이름 규칙으로 출력 폴더(또는 ZIP)에 바로 저장 (임시 폴더 복사 없음)
+        timestamp = timestamp or self.next_timestamp(construction_name)
+
+        def get_filename(result_name):
+            return LocalFileManager.get_output_filename(construction_name, timestamp, result_name)
+
+        if self.zip_output:
+            zip_path = os.path.join(self.output_dir, f"{construction_name}_{timestamp}.zip")
+            output_sink = ZipSink(zip_path, get_filename, self.zip_compression)
+        else:
+            zip_path = None
+            output_sink = DirectorySink(self.output_dir, get_filename)
+
+        stage_start = time.perf_counter()
+        # 실패하면 미완성 ZIP(폴더 저장은 이미 저장한 파일)은 제거됨 (OutputSink.__exit__)
+        with output_sink:
+            image_generator = JsonToImage(
+                document,
+                os.path.join(self.output_dir, 'output.png'),
+                template_source,
+                split_chunks=self.split_chunks,
+                chunk_height=self.chunk_height,
+                fonts_path=self.file_manager.fonts_path,
+                output_dir=self.output_dir,
+                position_settings=self.position_settings,
+                output_profile=self.output_profile,
+                streaming=self.streaming,
+                output_sink=output_sink,
+                render_cache=self.render_cache,
+                encode_workers=self.encode_workers
+            )
+            # 렌더링과 저장(인코딩)이 함께 진행되므로 'render'에 저장 시간 포함
+            saved_files = image_generator.generate_image_from_json()
+            if not saved_files:
+                raise RuntimeError(f"이미지 생성에 실패했습니다: {job.excel_file_path}")
+        timings['render'] = time.perf_counter() - stage_start
+
+        timings['total'] = time.perf_counter() - started
+        return {'job': job, 'files': saved_files, 'archive': zip_path, 'timings': timings,
+                'encode_stats': image_generator.encode_stats}
+
+    def run(self, jobs: List[BatchJob], stop_on_error: bool = False, workers: int = 1) -> List[Dict]:
+        """
+        여러 작업 실행
+
+        Args:
+            jobs: 배치 작업 목록
+            stop_on_error: 오류 발생 시 나머지 작업 중단 여부
+            workers: 동시에 실행할 프로세스 수 (1이면 현재 프로세스에서 순서대로, 0 이하면 CPU 코어 수)
+
+        Returns:
+            작업별 결과 목록 (입력 순서 유지, 실패한 작업은 'error' 키 포함)
+        """
+        if workers is None or workers <= 0:
+            workers = os.cpu_count() or 1
+        workers = min(workers, len(jobs)) if jobs else 1
+        if workers > 1:
+            return self.run_parallel(jobs, workers, stop_on_error)
+
+        results = []
+        for index, job in enumerate(jobs, 1):
+            self.log(f"[{index}/{len(jobs)}] 처리 중: {os.path.basename(job.excel_file_path)}")
+            try:
+                result = self.run_job(job)
+                self.log(f"[{index}/{len(jobs)}] 완료: {len(result['files'])}개 파일 ({result['timings']['total']:.2f}초)")
+            except Exception as e:
+                result = {'job': job, 'files': [], 'timings': {}, 'error': str(e)}
+                self.log(f"[{index}/{len(jobs)}] 실패: {e}")
+                if stop_on_error:
+                    results.append(result)
+                    break
+            results.append(result)
+        return results
+
+    def run_parallel(self, jobs: List[BatchJob], workers: int, stop_on_error: bool = False) -> List[Dict]:
+        """
+        여러 작업을 프로세스 풀에서 병렬 실행
+
+        각 워커는 시작 시 폰트와 템플릿을 한 번만 로딩하고, 작업마다 파일 목록과 단계별 시간을 반환합니다.
+        파일명 타임스탬프는 작업 제출 전에 부모 프로세스에서 정해지므로 결과 이름은 실행 순서와 무관합니다.
+
+        Args:
+            jobs: 배치 작업 목록
+            workers: 워커 프로세스 수
+            stop_on_error: 오류 발생 시 아직 시작하지 않은 작업 취소 여부
+
+        Returns:
+            작업별 결과 목록 (입력 순서 유지, 실패한 작업은 'error' 키 포함)
+        """
+        results = [None] * len(jobs)
+        submissions = []
+
+        # 템플릿/파일명은 부모에서 먼저 결정 (잘못된 작업은 워커로 보내지 않음)
+        template_paths = set()
+        for index, job in enumerate(jobs):
+            try:
+                template_path = self.resolve_template(job)
+                construction_name = self.resolve_construction_name(job, template_path)
+            except Exception as e:
+                results[index] = {'job': job, 'files': [], 'timings': {}, 'error': str(e)}
+                self.log(f"[{index + 1}/{len(jobs)}] 실패: {e}")
+                continue
+            template_paths.add(template_path)
+            submissions.append((index, job, self.next_timestamp(construction_name)))
+
+        init_args = (
+            self.output_dir,
+            self.file_manager.base_path,
+            self.position_settings.get_all_settings(),
+            self.split_chunks,
+            self.chunk_height,
+            self.output_profile,
+            self.streaming,
+            self.zip_output,
+            self.zip_compression,
+            self.render_cache_dir,
+            sorted(template_paths),
+            logging.getLogger().getEffectiveLevel(),
+            get_worker_encode_threads(workers)
+        )
+
+        self.log(f"병렬 처리 시작: 작업 {len(submissions)}개, 워커 {workers}개")
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=init_args) as executor:
+            futures = {
+                executor.submit(_run_worker_job, job, timestamp): index
+                for index, job, timestamp in submissions
+            }
+            for future in as_completed(futures):
+                index = futures[future]
+                job = jobs[index]
+                try:
+                    result = future.result()
+                    self.log(f"[{index + 1}/{len(jobs)}] 완료: {os.path.basename(job.excel_file_path)} - "
+                             f"{len(result['files'])}개 파일 ({result['timings']['total']:.2f}초, PID {result['worker_pid']})")
+                except Exception as e:
+                    result = {'job': job, 'files': [], 'timings': {}, 'error': str(e)}
+                    self.log(f"[{index + 1}/{len(jobs)}] 실패: {os.path.basename(job.excel_file_path)} - {e}")
+                    if stop_on_error:
+                        for pending in futures:
+                            pending.cancel()
+                results[index] = result
+
+        # 취소된 작업 표시
+        for index, result in enumerate(results):
+            if result is None:
+                results[index] = {'job': jobs[index], 'files': [], 'timings': {}, 'error': "취소됨"}
+
+        return results
+
+
+# 워커 프로세스별 BatchRunner (프로세스 풀 initializer에서 생성)
+_worker_runner = None
+
+
+def get_worker_encode_threads(workers: int) -> Optional[int]:
+    """
+    병렬 실행 시 워커 프로세스당 인코딩 스레드 수
+
+    워커마다 JsonToImage 기본값(최대 8개)으로 인코딩 스레드를 만들면 전체 스레드가
+    워커 수 × 8개가 되어 CPU를 나눠 쓰므로, CPU 코어 수를 워커 수로 나눠 사용합니다.
+    """
+    if workers <= 1:
+        return None
+    return max(1, (os.cpu_count() or 1) // workers)
+
+
+def _init_worker(output_dir, base_path, settings, split_chunks, chunk_height, output_profile, streaming,
+                 zip_output, zip_compression, render_cache_dir, template_paths, log_level=logging.WARNING,
+                 encode_workers=None):
+    """워커 프로세스 초기화 - 폰트/템플릿을 한 번만 로딩"""
+    global _worker_runner
+
+    # 부모와 같은 로그 수준 (spawn 방식 프로세스는 로그 설정을 물려받지 않음)
+    logging.basicConfig(level=log_level, format='%(message)s')
+
+    position_settings = PositionSettings()
+    position_settings.update_settings(settings)
+
+    _worker_runner = BatchRunner(
+        output_dir,
+        file_manager=LocalFileManager(base_path),
+        position_settings=position_settings,
+        split_chunks=split_chunks,
+        chunk_height=chunk_height,
+        log=lambda message: None,
+        output_profile=output_profile,
+        streaming=streaming,
+        zip_output=zip_output,
+        zip_compression=zip_compression,
+        render_cache_dir=render_cache_dir,
+        encode_workers=encode_workers
+    )
+    _worker_runner.preload(template_paths)
+
+
+def _run_worker_job(job, timestamp):
+    """워커 프로세스에서 작업 하나 실행"""
+    result = _worker_runner.run_job(job, timestamp)
+    result['worker_pid'] = os.getpid()
+    return result
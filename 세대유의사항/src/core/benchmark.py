@@ -0,0 +1,381 @@
+"""
+전체 파이프라인 성능 측정 모듈
+합성 주의사항 엑셀(10/100/1,000/5,000행)을 만들어 ExelToJson → PositionSettings → JsonToImage
+전체 과정을 실행하고, 단계별 소요 시간/최대 메모리(RSS)/출력 크기를 기준값 파일과 비교합니다.
+
+- 합성 데이터: 한글/영문 혼합 문장, 공백 없는 긴 단어(URL, 붙여 쓴 한글), 여러 줄 셀 포함 (seed 고정)
+- 각 측정은 새 프로세스에서 실행하여 최대 RSS와 템플릿 디코딩 등 첫 실행 비용을 측정마다 따로 기록
+- 기준값보다 허용 범위 이상 느려지거나 커지면 회귀(regression)로 보고
+"""
+
+import contextlib
+import io
+import json
+import multiprocessing
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+
+from .position_settings import PositionSettings
+
+# 기본 측정 행 수
+BENCHMARK_SIZES = (10, 100, 1000, 5000)
+
+# 기준값 파일 형식 버전
+BASELINE_VERSION = 1
+
+# 측정 단계 (보고서 순서)
+STAGES = ('template', 'excel', 'layout', 'render', 'total')
+
+# 허용 범위 (기준값 대비 증가 비율) - 시간은 측정 잡음을 고려해 최소 여유(초)도 둠
+DEFAULT_TOLERANCES = {
+    'seconds': 0.25,
+    'peak_rss': 0.20,
+    'output_bytes': 0.05,
+}
+MIN_SECONDS_SLACK = 0.05
+
+# 합성 데이터 단어 목록
+HANGUL_WORDS = [
+    '화재', '예방을', '위해', '가스밸브를', '반드시', '잠가', '주십시오', '세대', '내부', '전기',
+    '안전', '점검', '발코니', '확장', '부위는', '결로가', '발생할', '수', '있습니다', '환기를',
+    '자주', '하여', '주시기', '바랍니다', '욕실', '배수구', '청소', '공용부', '관리사무소에', '문의',
+]
+LATIN_WORDS = [
+    'LED', 'PVC', 'A/S', 'Wi-Fi', 'IoT', 'KS', 'inspection', 'ventilation', 'No.3', '220V',
+    '1,234㎡', '(주)', 'check', 'system', 'door-lock',
+]
+LONG_WORDS = [
+    '초고층건축물비상대피공간확보및피난유도등작동상태정기점검안내',
+    'https://www.example.co.kr/apartment/notice/maintenance/guide',
+    'Supercalifragilisticexpialidocious_ventilation_system_manual',
+    '세대내부전기분전반누전차단기월1회이상시험버튼작동확인',
+]
+
+
+def make_synthetic_rows(row_count: int, seed: int = 0) -> List[Dict]:
+    """
+    합성 주의사항 행 생성 (같은 seed면 항상 같은 데이터)
+
+    Returns:
+        [{'번호', '제목', '설명'}, ...]
+    """
+    rng = random.Random(seed)
+
+    def sentence(word_count):
+        words = []
+        for _ in range(word_count):
+            pick = rng.random()
+            if pick < 0.05:
+                words.append(rng.choice(LONG_WORDS))
+            elif pick < 0.25:
+                words.append(rng.choice(LATIN_WORDS))
+            else:
+                words.append(rng.choice(HANGUL_WORDS))
+        return ' '.join(words)
+
+    rows = []
+    for index in range(row_count):
+        title = sentence(rng.randint(2, 8))
+        if index % 7 == 3:
+            # 여러 줄 셀 (Alt+Enter 줄바꿈)
+            content = '\n'.join(sentence(rng.randint(4, 12)) for _ in range(rng.randint(2, 4)))
+        else:
+            content = sentence(rng.randint(5, 60))
+        rows.append({'번호': index + 1, '제목': title, '설명': content})
+    return rows
+
+
+def write_workbook(path: str, rows: List[Dict]) -> str:
+    """주의사항 행 목록을 엑셀 파일로 저장 (헤더: 번호/제목/설명)"""
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet('주의사항')
+    sheet.append(['번호', '제목', '설명'])
+    for row in rows:
+        sheet.append([row['번호'], row['제목'], row['설명']])
+    workbook.save(path)
+    return path
+
+
+def write_synthetic_workbook(path: str, row_count: int, seed: int = 0) -> str:
+    """합성 주의사항 엑셀 파일 저장 (헤더: 번호/제목/설명)"""
+    return write_workbook(path, make_synthetic_rows(row_count, seed))
+
+
+def get_peak_rss() -> Optional[int]:
+    """현재 프로세스의 최대 RSS (바이트, 측정할 수 없으면 None)"""
+    try:
+        import resource
+    except ImportError:
+        resource = None
+
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # macOS는 바이트, Linux는 KB 단위
+        return peak if sys.platform == 'darwin' else peak * 1024
+
+    if sys.platform == 'win32':
+        import ctypes
+        from ctypes import wintypes
+
+        class ProcessMemoryCounters(ctypes.Structure):
+            _fields_ = [
+                ('cb', wintypes.DWORD),
+                ('PageFaultCount', wintypes.DWORD),
+                ('PeakWorkingSetSize', ctypes.c_size_t),
+                ('WorkingSetSize', ctypes.c_size_t),
+                ('QuotaPeakPagedPoolUsage', ctypes.c_size_t),
+                ('QuotaPagedPoolUsage', ctypes.c_size_t),
+                ('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t),
+                ('QuotaNonPagedPoolUsage', ctypes.c_size_t),
+                ('PagefileUsage', ctypes.c_size_t),
+                ('PeakPagefileUsage', ctypes.c_size_t),
+            ]
+
+        counters = ProcessMemoryCounters()
+        counters.cb = ctypes.sizeof(counters)
+        process = ctypes.windll.kernel32.GetCurrentProcess()
+        if ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb):
+            return counters.PeakWorkingSetSize
+    return None
+
+
+class _TimedPositionSettings(PositionSettings):
+    """위치 계산 시간을 누적하는 PositionSettings (ExelToJson 안의 레이아웃 단계 측정용)"""
+
+    def __init__(self):
+        super().__init__()
+        self.layout_seconds = 0.0
+
+    def calculate_positions(self, valid_data, image_height=None, template_data=None):
+        started = time.perf_counter()
+        try:
+            return super().calculate_positions(valid_data, image_height, template_data)
+        finally:
+            self.layout_seconds += time.perf_counter() - started
+
+
+def run_case(excel_path: str, template_path: str, output_dir: str, fonts_path: Optional[str] = None,
+             company_name: Optional[str] = None, split_chunks: bool = True, chunk_height: int = 2000,
+             output_profile: str = 'default', streaming: bool = False) -> Dict:
+    """
+    측정 한 건 실행 (현재 프로세스에서)
+
+    Returns:
+        {'stages': {단계: 초}, 'peak_rss', 'output_bytes', 'files', 'layers'}
+        (excel 단계는 레이아웃 계산 시간을 뺀 엑셀 읽기/문서 생성 시간)
+    """
+    from .excel_to_json import ExelToJson
+    from .json_to_image import JsonToImage
+    from .local_file_manager import LocalFileManager
+    from .output_sink import DirectorySink
+
+    file_manager = LocalFileManager()
+    fonts_path = fonts_path or file_manager.fonts_path
+    position_settings = _TimedPositionSettings()
+    position_settings.fonts_path = fonts_path
+    position_settings.text_utils.fonts_path = fonts_path
+
+    stages = {}
+    started = time.perf_counter()
+
+    stage_start = time.perf_counter()
+    template_source = file_manager.get_template_tiles(template_path)
+    stages['template'] = time.perf_counter() - stage_start
+
+    stage_start = time.perf_counter()
+    with open(excel_path, 'rb') as f:
+        excel_file = io.BytesIO(f.read())
+    document = ExelToJson(excel_file, position_settings, company_name=company_name).generate_document()
+    stages['layout'] = position_settings.layout_seconds
+    stages['excel'] = time.perf_counter() - stage_start - stages['layout']
+
+    stage_start = time.perf_counter()
+    with DirectorySink(output_dir) as output_sink:
+        image_generator = JsonToImage(
+            document,
+            os.path.join(output_dir, 'output.png'),
+            template_source,
+            split_chunks=split_chunks,
+            chunk_height=chunk_height,
+            fonts_path=fonts_path,
+            output_dir=output_dir,
+            position_settings=position_settings,
+            output_profile=output_profile,
+            streaming=streaming,
+            output_sink=output_sink
+        )
+        saved_files = image_generator.generate_image_from_json()
+        if not saved_files:
+            raise RuntimeError(f"이미지 생성에 실패했습니다: {excel_path}")
+    stages['render'] = time.perf_counter() - stage_start
+    stages['total'] = time.perf_counter() - started
+
+    return {
+        'stages': stages,
+        'peak_rss': get_peak_rss(),
+        'output_bytes': sum(record['bytes'] or 0 for record in output_sink.records),
+        'files': len(saved_files),
+        'layers': len(document.layers)
+    }
+
+
+def _run_case_quiet(kwargs: Dict) -> Dict:
+    """자식 프로세스에서 측정 실행 (렌더링 로그 숨김)"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return run_case(**kwargs)
+
+
+def run_case_isolated(**kwargs) -> Dict:
+    """새 프로세스에서 측정 한 건 실행 (최대 RSS가 이전 측정의 영향을 받지 않음)"""
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn')) as executor:
+        return executor.submit(_run_case_quiet, kwargs).result()
+
+
+def make_case_name(template_name: str, row_count: int) -> str:
+    """측정 이름 ('호반/1000')"""
+    return f"{template_name}/{row_count}"
+
+
+class BenchmarkSuite:
+    """합성 엑셀 × 템플릿 조합 측정과 기준값 비교"""
+
+    def __init__(self, template_paths: Dict[str, str], sizes=BENCHMARK_SIZES, fonts_path: Optional[str] = None,
+                 repeat: int = 1, seed: int = 0, render_options: Optional[Dict] = None,
+                 tolerances: Optional[Dict[str, float]] = None):
+        """
+        Args:
+            template_paths: {템플릿 이름: 템플릿 파일 경로}
+            sizes: 측정할 행 수 목록
+            fonts_path: 폰트 폴더 (None이면 assets/fonts)
+            repeat: 측정 반복 횟수 (항목별 최솟값 사용)
+            seed: 합성 데이터 seed
+            render_options: run_case에 전달할 렌더링 옵션 (split_chunks, chunk_height, output_profile, streaming)
+            tolerances: 허용 범위 (DEFAULT_TOLERANCES 항목 덮어쓰기)
+        """
+        self.template_paths = template_paths
+        self.sizes = list(sizes)
+        self.fonts_path = fonts_path
+        self.repeat = max(1, repeat)
+        self.seed = seed
+        self.render_options = render_options or {}
+        self.tolerances = dict(DEFAULT_TOLERANCES, **(tolerances or {}))
+
+    def run(self, progress=print) -> Dict[str, Dict]:
+        """
+        전체 측정 실행
+
+        Returns:
+            {측정 이름: {'stages', 'peak_rss', 'output_bytes', 'files', 'layers'}}
+        """
+        results = {}
+        work_dir = tempfile.mkdtemp(prefix='benchmark_')
+        try:
+            workbooks = {}
+            for row_count in self.sizes:
+                workbooks[row_count] = write_synthetic_workbook(
+                    os.path.join(work_dir, f'synthetic_{row_count}.xlsx'), row_count, self.seed)
+
+            for template_name, template_path in self.template_paths.items():
+                for row_count in self.sizes:
+                    name = make_case_name(template_name, row_count)
+                    runs = []
+                    for attempt in range(self.repeat):
+                        output_dir = os.path.join(work_dir, 'output')
+                        shutil.rmtree(output_dir, ignore_errors=True)
+                        runs.append(run_case_isolated(
+                            excel_path=workbooks[row_count],
+                            template_path=template_path,
+                            output_dir=output_dir,
+                            fonts_path=self.fonts_path,
+                            company_name=template_name,
+                            **self.render_options
+                        ))
+                    results[name] = self._merge_runs(runs)
+                    if progress:
+                        progress(self.format_result(name, results[name]))
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+        return results
+
+    @staticmethod
+    def _merge_runs(runs: List[Dict]) -> Dict:
+        """반복 측정 결과를 항목별 최솟값으로 합침"""
+        merged = dict(runs[0])
+        merged['stages'] = {stage: min(run['stages'][stage] for run in runs) for stage in STAGES}
+        rss_values = [run['peak_rss'] for run in runs if run['peak_rss'] is not None]
+        merged['peak_rss'] = min(rss_values) if rss_values else None
+        merged['output_bytes'] = min(run['output_bytes'] for run in runs)
+        return merged
+
+    @staticmethod
+    def format_result(name: str, result: Dict) -> str:
+        """측정 결과 한 줄 요약"""
+        stages = ' '.join(f"{stage} {result['stages'][stage]:.3f}s" for stage in STAGES)
+        rss = f"{result['peak_rss'] / 1024 / 1024:.1f}MB" if result['peak_rss'] is not None else '-'
+        return (f"{name:<28} {stages} | RSS {rss} | 출력 {result['output_bytes'] / 1024:.1f}KB "
+                f"({result['files']}개 파일, 레이어 {result['layers']}개)")
+
+    @staticmethod
+    def save_baseline(path: str, results: Dict[str, Dict]):
+        """측정 결과를 기준값 파일로 저장"""
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        cases = {
+            name: {'stages': result['stages'], 'peak_rss': result['peak_rss'], 'output_bytes': result['output_bytes']}
+            for name, result in results.items()
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'version': BASELINE_VERSION, 'created': time.time(), 'cases': cases},
+                      f, ensure_ascii=False, indent=2)
+
+    @staticmethod
+    def load_baseline(path: str) -> Dict[str, Dict]:
+        """기준값 파일 읽기 (형식 버전이 다르면 ValueError)"""
+        with open(path, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        if baseline.get('version') != BASELINE_VERSION:
+            raise ValueError(f"기준값 파일 형식 버전이 다릅니다: {baseline.get('version')} (필요: {BASELINE_VERSION})")
+        return baseline['cases']
+
+    def compare(self, results: Dict[str, Dict], baseline: Dict[str, Dict]) -> List[str]:
+        """
+        기준값과 비교
+
+        Returns:
+            회귀 목록 (빈 목록이면 통과) - 기준값에 없는 측정은 비교하지 않음
+        """
+        regressions = []
+        for name, result in results.items():
+            base = baseline.get(name)
+            if base is None:
+                continue
+
+            for stage in STAGES:
+                current = result['stages'][stage]
+                previous = base['stages'].get(stage)
+                if previous is None:
+                    continue
+                limit = previous * (1 + self.tolerances['seconds']) + MIN_SECONDS_SLACK
+                if current > limit:
+                    regressions.append(f"{name} {stage}: {current:.3f}s > 기준 {previous:.3f}s "
+                                       f"(허용 {limit:.3f}s)")
+
+            for metric, unit in (('peak_rss', 1024 * 1024), ('output_bytes', 1024)):
+                current = result[metric]
+                previous = base.get(metric)
+                if current is None or previous is None:
+                    continue
+                limit = previous * (1 + self.tolerances[metric])
+                if current > limit:
+                    unit_name = 'MB' if metric == 'peak_rss' else 'KB'
+                    regressions.append(f"{name} {metric}: {current / unit:.1f}{unit_name} > "
+                                       f"기준 {previous / unit:.1f}{unit_name} (허용 {limit / unit:.1f}{unit_name})")
+        return regressions
@@ -0,0 +1,221 @@
+"""
+엑셀 로더 모듈
+워크북을 한 번만 읽고(헤더 없이 원본 행), 메모리에서 헤더 행을 찾아 데이터를 잘라냅니다.
+
+openpyxl read_only 모드로 행을 스트리밍하여 일반 행 레코드(dict)로 변환하므로
+pandas/numpy 없이 동작합니다. 빈 칸/행 처리와 숫자 변환은 기존
+pd.read_excel(header=N) 결과와 같도록 맞춰져 있습니다.
+"""
+
+import io
+import math
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ..utils.progress import get_progress
+from ..utils.tracing import span
+
+# 빈 칸 값 (pandas와 동일하게 NaN 사용 - 기존 텍스트 변환 결과 유지)
+MISSING = float('nan')
+
+# pd.read_excel 기본 결측값 문자열
+NA_STRINGS = frozenset([
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+    '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null'
+])
+
+
+def is_missing(value) -> bool:
+    """빈 칸 여부 (None 또는 NaN)"""
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+def iter_row_records(rows) -> Iterator:
+    """
+    행 레코드 순회 (DataFrame, dict 목록 등 모든 행 반복 가능 객체 지원)
+
+    DataFrame은 iterrows()의 행(Series)을, 그 외에는 원소를 그대로 반환합니다.
+    """
+    if hasattr(rows, 'iterrows'):
+        for _, row in rows.iterrows():
+            yield row
+    else:
+        yield from rows
+
+
+class ExcelLoader:
+    """엑셀 파일 1회 읽기 + 헤더 행 자동 감지"""
+
+    # 헤더 행 후보 (기존 pd.read_excel(header=0/1/2) 시도 순서와 동일)
+    HEADER_ROW_CANDIDATES = (0, 1, 2)
+
+    # 컬럼별 키워드 (먼저 나오는 컬럼이 우선)
+    COLUMN_KEYWORDS = {
+        '번호': ['번호', 'no', 'num', '순서'],
+        '제목': ['제목', 'title', '항목', '내용'],
+        '설명': ['설명', 'desc', '내용', '상세'],
+    }
+
+    def __init__(self, excel_file):
+        """
+        Args:
+            excel_file: 엑셀 파일 경로, bytes 또는 파일 객체
+        """
+        if isinstance(excel_file, (bytes, bytearray)):
+            excel_file = io.BytesIO(excel_file)
+        self.excel_file = excel_file
+        self._raw_rows = None
+
+    @classmethod
+    def find_column_mapping(cls, columns) -> Dict:
+        """컬럼 이름 목록에서 번호/제목/설명 컬럼 매핑"""
+        columns = list(columns)
+        mapping = {}
+        for target, keywords in cls.COLUMN_KEYWORDS.items():
+            for col in columns:
+                col_str = str(col).lower()
+                if any(keyword in col_str for keyword in keywords):
+                    mapping[target] = col
+                    break
+        return mapping
+
+    @staticmethod
+    def convert_cell(cell):
+        """셀 값 변환 (정수로 표현 가능한 숫자는 int, 오류/결측값 문자열은 빈 칸)"""
+        from openpyxl.cell.cell import TYPE_ERROR, TYPE_NUMERIC
+
+        value = cell.value
+        if value is None or cell.data_type == TYPE_ERROR:
+            return MISSING
+        if cell.data_type == TYPE_NUMERIC:
+            int_value = int(value)
+            return int_value if int_value == value else float(value)
+        if isinstance(value, str) and value in NA_STRINGS:
+            return MISSING
+        return value
+
+    def read_raw_rows(self) -> List[List]:
+        """
+        헤더 없이 원본 행 읽기 (파일당 1회만 파싱)
+
+        끝부분 빈 행은 제거하고, 모든 행을 가장 긴 행의 길이에 맞춰 빈 칸으로 채웁니다.
+        """
+        if self._raw_rows is not None:
+            return self._raw_rows
+
+        progress = get_progress()
+        progress.start('excel', 1)
+        with span('excel.read') as read_span:
+            self._raw_rows = self._read_raw_rows()
+            read_span.set(rows=len(self._raw_rows))
+        progress.advance()
+        return self._raw_rows
+
+    def _read_raw_rows(self) -> List[List]:
+        from openpyxl import load_workbook
+
+        if hasattr(self.excel_file, 'seek'):
+            self.excel_file.seek(0)
+        workbook = load_workbook(self.excel_file, read_only=True, data_only=True, keep_links=False)
+        try:
+            # 첫 번째 시트 사용 (pd.read_excel 기본값과 동일)
+            sheet = workbook.worksheets[0]
+            # 잘못 기록된 시트 크기 정보 무시
+            sheet.reset_dimensions()
+
+            rows = []
+            last_row_with_data = -1
+            for row_number, row in enumerate(sheet.rows):
+                values = [self.convert_cell(cell) for cell in row]
+                while values and is_missing(values[-1]):
+                    values.pop()
+                if values:
+                    last_row_with_data = row_number
+                rows.append(values)
+        finally:
+            workbook.close()
+
+        # 마지막 데이터 행 이후의 빈 행 제거
+        rows = rows[:last_row_with_data + 1]
+
+        width = max((len(values) for values in rows), default=0)
+        return [values + [MISSING] * (width - len(values)) for values in rows]
+
+    @staticmethod
+    def make_column_names(header_values) -> List:
+        """
+        헤더 행 값을 컬럼 이름으로 변환
+
+        pd.read_excel(header=N)과 같은 규칙: 빈 칸은 'Unnamed: i',
+        중복 이름은 '이름.1', '이름.2' ...
+        """
+        names = []
+        seen = {}
+        for i, value in enumerate(header_values):
+            name = f'Unnamed: {i}' if is_missing(value) else value
+            count = seen.get(name, 0)
+            seen[name] = count + 1
+            if count:
+                name = f'{name}.{count}'
+            names.append(name)
+        return names
+
+    def detect_header(self) -> Tuple[Optional[int], Dict]:
+        """
+        헤더 행과 컬럼 매핑 감지
+
+        Returns:
+            (헤더 행 번호, 컬럼 매핑) - 찾지 못하면 (None, {})
+        """
+        raw_rows = self.read_raw_rows()
+        with span('excel.header'):
+            for header_row in self.HEADER_ROW_CANDIDATES:
+                if header_row >= len(raw_rows):
+                    break
+                mapping = self.find_column_mapping(self.make_column_names(raw_rows[header_row]))
+                # 필수 컬럼 확인 (최소 번호, 제목 또는 설명)
+                if len(mapping) >= 2:
+                    return header_row, mapping
+            return None, {}
+
+    def load(self) -> Tuple[List[Dict], Dict, int]:
+        """
+        헤더 행 아래 데이터를 행 레코드 목록으로 반환
+
+        Returns:
+            ({컬럼 이름: 값} 목록, 컬럼 매핑, 헤더 행 번호)
+
+        Raises:
+            ValueError: 적절한 컬럼을 찾을 수 없는 경우
+        """
+        header_row, mapping = self.detect_header()
+        if header_row is None:
+            raise ValueError("적절한 컬럼을 찾을 수 없습니다. 엑셀 파일의 컬럼명을 확인해주세요.")
+
+        raw_rows = self.read_raw_rows()
+        columns = self.make_column_names(raw_rows[header_row])
+        records = [dict(zip(columns, values)) for values in raw_rows[header_row + 1:]]
+        return records, mapping, header_row
+
+    @staticmethod
+    def to_layer_records(records: Iterable[Dict], mapping: Dict) -> List[Dict]:
+        """
+        행 레코드를 {'번호', '제목', '설명'} 레코드로 변환
+
+        - 번호 컬럼이 없으면 행 순서(1부터)를 사용
+        - 제목/설명 컬럼 중 하나가 없으면 다른 컬럼 값을 사용
+        - 세 값이 모두 비어 있는 행은 제외
+        """
+        layer_records = []
+        for index, record in enumerate(records):
+            row = {target: record[column] for target, column in mapping.items()}
+            if '번호' not in row:
+                row['번호'] = index + 1
+            if '제목' not in row:
+                row['제목'] = row.get('설명', '제목 없음')
+            if '설명' not in row:
+                row['설명'] = row.get('제목', '설명 없음')
+
+            if all(is_missing(row[key]) for key in ('번호', '제목', '설명')):
+                continue
+            layer_records.append({key: row[key] for key in ('번호', '제목', '설명')})
+        return layer_records
@@ -1,9 +1,13 @@
-import pandas as pd
-import json
 import io
+import logging
+from .excel_loader import ExcelLoader, iter_row_records
 from .position_settings import PositionSettings
+from .notice_document import LayerBox, NoticeDocument, NoticeLayer, TextLayer, TextStyle
 from ..utils.text_utils import TextUtils
 from ..utils.company_colors import CompanyColorManager
+from ..utils.tracing import span
+
+logger = logging.getLogger(__name__)
 
 
 class ExelToJson:
@@ -48,181 +52,119 @@ class ExelToJson:
         return max(1, total_lines)
 
     def create_layer(self, layer_num, title, content, positions):
-        """레이어 생성"""
+        """레이어 생성 (JSON 템플릿 구조)"""
+        return self.create_notice_layer(layer_num, title, content, positions).to_dict()
+
+    def create_notice_layer(self, layer_num, title, content, positions):
+        """레이어 생성 (문서 모델)"""
+        def layer_box(name):
+            return LayerBox(positions[name]['width'], positions[name]['height'],
+                            positions[name]['x'], positions[name]['y'])
+
+        return NoticeLayer(
+            layer_num,
+            number_layer=TextLayer(
+                layer_box('number'),
+                TextStyle('36pt', 'Noto Sans CJK KR', 'bold', self.theme_color, '44pt', '-50'),
+                f"{layer_num:02d}"
+            ),
+            title_layer=TextLayer(
+                layer_box('title'),
+                TextStyle('36pt', 'Noto Sans CJK KR', 'bold', self.theme_color, '48pt', '-50'),
+                title
+            ),
+            content_layer=TextLayer(
+                layer_box('content'),
+                TextStyle('28pt', 'Noto Sans CJK KR', 'regular', [10, 10, 10], '44pt', '-50'),  # #0A0A0A
+                content
+            )
+        )
+
+    def create_layout(self, layout_layers):
+        """
+        계산된 레이아웃 정보 생성
+        
+        계산에 사용된 설정값과 폰트 폴더를 함께 기록하여, JsonToImage가 같은 설정/폰트일 때만
+        재계산 없이 그대로 사용할 수 있도록 합니다.
+        """
         return {
-            'number_layer': {
-                'info': {
-                    'width': positions['number']['width'],
-                    'height': positions['number']['height'],
-                    'x': positions['number']['x'],
-                    'y': positions['number']['y']
-                },
-                'char': {
-                    'font_size': '36pt',
-                    'font_family': 'Noto Sans CJK KR',
-                    'font_weight': 'bold',
-                    'color': self.theme_color,
-                    'text_height': '44pt',
-                    'text_width': '-50'
-                },
-                'text': f"{layer_num:02d}"
-            },
-            'title_layer': {
-                'info': {
-                    'width': positions['title']['width'],
-                    'height': positions['title']['height'],
-                    'x': positions['title']['x'],
-                    'y': positions['title']['y']
-                },
-                'char': {
-                    'font_size': '36pt',
-                    'font_family': 'Noto Sans CJK KR',
-                    'font_weight': 'bold',
-                    'color': self.theme_color,
-                    'text_height': '48pt',
-                    'text_width': '-50'
-                },
-                'text': title
-            },
-            'content_layer': {
-                'info': {
-                    'width': positions['content']['width'],
-                    'height': positions['content']['height'],
-                    'x': positions['content']['x'],
-                    'y': positions['content']['y']
-                },
-                'char': {
-                    'font_size': '28pt',
-                    'font_family': 'Noto Sans CJK KR',
-                    'font_weight': 'regular',
-                    'color': [10, 10, 10],  # #0A0A0A
-                    'text_height': '44pt',
-                    'text_width': '-50'
-                },
-                'text': content
-            }
+            'settings': self.position_settings.get_all_settings(),
+            'fonts_path': self.position_settings.text_utils.fonts_path,
+            'layers': layout_layers
         }
 
+    def collect_layer_rows(self, valid_data):
+        """
+        유효 데이터에서 (레이어 번호, 제목, 내용) 목록 생성
+        
+        같은 번호가 여러 번 나오면 마지막 행을 사용하고, 레이어 번호 순으로 정렬합니다.
+        (JsonToImage가 레이어를 그리는 순서와 동일)
+        """
+        rows_by_num = {}
+        for row in iter_row_records(valid_data):
+            layer_num = int(row['번호'])
+            title = self.text_utils.clean_text_newlines(str(row['제목']))
+            content = self.text_utils.clean_text_newlines(str(row['설명']))
+            rows_by_num[layer_num] = (title, content)
+
+        return [(layer_num, title, content) for layer_num, (title, content) in sorted(rows_by_num.items())]
+
     def calculate_layer_positions(self, valid_data, image_height=None):
         """레이어 위치 계산 (PositionSettings 사용)"""
         return self.position_settings.calculate_positions(valid_data, image_height)
 
-    def find_column_mapping(self, df):
-        """컬럼 이름을 자동으로 매핑"""
-        columns = df.columns.tolist()
-        mapping = {}
-        
-        # 번호 컬럼 찾기
-        for col in columns:
-            col_str = str(col).lower()
-            if any(keyword in col_str for keyword in ['번호', 'no', 'num', '순서']):
-                mapping['번호'] = col
-                break
-        
-        # 제목 컬럼 찾기
-        for col in columns:
-            col_str = str(col).lower()
-            if any(keyword in col_str for keyword in ['제목', 'title', '항목', '내용']):
-                mapping['제목'] = col
-                break
-                
-        # 설명 컬럼 찾기
-        for col in columns:
-            col_str = str(col).lower()
-            if any(keyword in col_str for keyword in ['설명', 'desc', '내용', '상세']):
-                mapping['설명'] = col
-                break
-        
-        return mapping
+    def find_column_mapping(self, columns):
+        """컬럼 이름을 자동으로 매핑 (컬럼 이름 목록 또는 columns 속성을 가진 표)"""
+        return ExcelLoader.find_column_mapping(getattr(columns, 'columns', columns))
 
     def generate_json_from_excel(self):
-        """Excel에서 JSON 생성"""
+        """Excel에서 JSON 생성 (문서 모델을 JSON 문자열로 내보내기)"""
+        return self.generate_document().to_json()
+
+    def generate_document(self):
+        """Excel에서 문서 모델(NoticeDocument) 생성"""
         try:
             # 색상 정보 로깅
             if self.company_name != "기본":
                 color_info = CompanyColorManager.get_color_info(self.company_name)
-                print(f"🎨 건설사 테마 색상 적용: {self.company_name} -> {color_info['hex']} (RGB: {self.theme_color})")
-            # Excel 파일 읽기
-            file_contents = self.excel_file.read()
-            file_like = io.BytesIO(file_contents)
-
-            # 여러 헤더 위치로 시도해보기
-            df = None
-            column_mapping = {}
-
-            for header_row in [0, 1, 2]:
-                try:
-                    temp_df = pd.read_excel(file_like, header=header_row)
-                    file_like.seek(0)  # 파일 포인터 리셋
-
-                    # 컬럼 매핑 시도
-                    temp_mapping = self.find_column_mapping(temp_df)
-
-                    # 필수 컬럼이 모두 있는지 확인
-                    if len(temp_mapping) >= 2:  # 최소 번호, 제목 또는 설명
-                        df = temp_df
-                        column_mapping = temp_mapping
-                        print(f"헤더 행 {header_row}에서 컬럼 매핑 성공: {column_mapping}")
-                        break
-                except Exception as e:
-                    continue
-
-            if df is None or not column_mapping:
-                raise ValueError("적절한 컬럼을 찾을 수 없습니다. 엑셀 파일의 컬럼명을 확인해주세요.")
-
-            # 템플릿 기본 구조
-            template = {
-                'template_name': None,
-                'logo_image': None,
-                'dpi': None,
-                'layers': {}
-            }
-
-            # 컬럼명 변경
-            rename_dict = {v: k for k, v in column_mapping.items()}
-            df = df.rename(columns=rename_dict)
-
-            # 필수 컬럼이 없는 경우 기본값 설정
-            if '번호' not in df.columns:
-                df['번호'] = range(1, len(df) + 1)
-            if '제목' not in df.columns:
-                df['제목'] = df.get('설명', '제목 없음')
-            if '설명' not in df.columns:
-                df['설명'] = df.get('제목', '설명 없음')
-
-            # 유효한 데이터만 필터링
-            available_cols = [col for col in ['번호', '제목', '설명'] if col in df.columns]
-            valid_data = df.dropna(subset=available_cols, how='all')
-
-            # 레이어 위치 계산
-            layer_positions = self.calculate_layer_positions(valid_data)
+                logger.info("🎨 건설사 테마 색상 적용: %s -> %s (RGB: %s)", self.company_name, color_info['hex'], self.theme_color)
+            # Excel 파일 읽기 (1회 스트리밍 파싱 후 메모리에서 헤더 행 감지)
+            records, column_mapping, header_row = ExcelLoader(io.BytesIO(self.excel_file.read())).load()
+            logger.info("헤더 행 %s에서 컬럼 매핑 성공: %s", header_row, column_mapping)
+
+            # 문서 기본 구조
+            document = NoticeDocument()
+
+            # 번호/제목/설명 레코드로 변환 (빈 행 제외, 없는 컬럼은 기본값)
+            valid_data = ExcelLoader.to_layer_records(records, column_mapping)
+
+            # 렌더링 순서(레이어 번호순)대로 정리된 행 목록
+            layer_rows = self.collect_layer_rows(valid_data)
+
+            # 레이어 위치 계산 (작업당 한 번만 수행 - 결과는 layout으로 JsonToImage에 전달됨)
+            layout_data = [{'번호': layer_num, '제목': title, '설명': content} for layer_num, title, content in layer_rows]
+            with span('layout', rows=len(layout_data)):
+                layer_positions = self.calculate_layer_positions(layout_data)
 
             # 각 행에 대해 레이어 생성 (레이어 번호와 위치 인덱스 정확히 매핑)
-            position_dict = {}
-            for position_index, (_, row) in enumerate(valid_data.iterrows()):
-                layer_num = int(row['번호'])
-                position_dict[layer_num] = position_index
-
-            for position_index, (_, row) in enumerate(valid_data.iterrows()):
-                layer_num = int(row['번호'])
-                title = self.text_utils.clean_text_newlines(str(row['제목']))
-                content = self.text_utils.clean_text_newlines(str(row['설명']))
-
-                # 위치 정보 가져오기 (올바른 인덱스 사용)
-                correct_position_index = position_dict[layer_num]
-                if correct_position_index < len(layer_positions):
-                    positions = layer_positions[correct_position_index]
-                    # print(f"🔧 레이어 매핑: 엑셀번호={layer_num}, 위치인덱스={correct_position_index}")
+            # collect_layer_rows가 번호 중복 없이 정렬해 두므로 add_layer(매번 교체/정렬) 대신 한 번에 구성
+            layers = []
+            layout_layers = {}
+            for position_index, (layer_num, title, content) in enumerate(layer_rows):
+                if position_index < len(layer_positions):
+                    positions = layer_positions[position_index]
                 else:
                     raise IndexError(f"레이어 {layer_num}의 위치 정보를 찾을 수 없습니다.")
 
                 layer_key = f'layer{layer_num}'
-                template['layers'][layer_key] = self.create_layer(layer_num, title, content, positions)
+                layers.append(self.create_notice_layer(layer_num, title, content, positions))
+                layout_layers[layer_key] = positions
+            document.layers = sorted(layers, key=lambda layer: layer.number)
 
-            # # JSON 파일로 저장
-            # with open(self.output_file, 'w', encoding='utf-8') as f:
-            #     json.dump(template, f, ensure_ascii=False, indent=4)
+            # 계산된 레이아웃 (줄바꿈 결과 포함) - JsonToImage가 재계산 없이 사용
+            document.layout = self.create_layout(layout_layers)
 
-            return json.dumps(template)
+            # JSON 파일 저장이 필요하면 document.save_json() 사용
+            return document
         except Exception as e:
             raise e
@@ -0,0 +1,430 @@
+"""
+골든 이미지 회귀 검사 모듈
+고정된 시트 모음 × assets/templates의 모든 템플릿을 렌더링하여 결과 이미지 해시를 기준(골든) 파일과 비교하고,
+같은 실행에서 JsonToImage.generate_image_from_json 소요 시간도 함께 측정합니다.
+
+- 해시: 저장된 이미지를 다시 읽은 픽셀 데이터의 SHA-256 (PNG 압축 방식/Pillow 버전과 무관하게 픽셀만 비교)
+- 렌더링 방식별 검사: canvas(전체 캔버스), streaming(청크 스트리밍), incremental(수정 전 시트를 먼저
+  그린 뒤 증분 렌더링), cached(렌더링 캐시 저장 후 캐시에서 출력) - 모두 같은 골든 해시와 비교
+- 다르면 픽셀 단위 비교 이미지(다른 픽셀은 빨간색)를 저장 - 골든 이미지가 저장되어 있으면 그것과,
+  없으면 같은 실행의 canvas 결과와 비교
+"""
+
+import hashlib
+import io
+import json
+import os
+import shutil
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .benchmark import MIN_SECONDS_SLACK, make_synthetic_rows, write_workbook
+
+# 골든 파일 형식 버전
+GOLDEN_VERSION = 1
+GOLDEN_FILE_NAME = 'golden_hashes.json'
+GOLDEN_IMAGES_DIR = 'images'
+
+# 렌더링 방식 (canvas가 기준)
+REFERENCE_MODE = 'canvas'
+RENDER_MODES = ('canvas', 'streaming', 'incremental', 'cached')
+DEFAULT_MODES = ('canvas', 'streaming')
+
+# 비교 이미지에서 같은 픽셀을 흐리게 표시하는 정도 (0 = 원본, 1 = 흰색)
+DIFF_FADE = 0.7
+DIFF_COLOR = (255, 0, 0)
+
+# 경계 사례 시트 (빈 설명, 공백 없는 긴 단어, 여러 줄, 영문만, 건너뛴/중복 번호)
+EDGE_ROWS = [
+    {'번호': 1, '제목': '설명 없음', '설명': ''},
+    {'번호': 2, '제목': '초고층건축물비상대피공간확보및피난유도등작동상태정기점검안내문',
+     '설명': '세대내부전기분전반누전차단기월1회이상시험버튼작동확인' * 3},
+    {'번호': 3, '제목': '여러 줄\n제목', '설명': '첫째 줄\n둘째 줄\n\n넷째 줄 (빈 줄 포함)'},
+    {'번호': 4, '제목': 'English only title', '설명': 'Please check the ventilation system, door-lock and LED '
+                                                     'lighting every month. Contact the A/S center: 1588-0000.'},
+    {'번호': 7, '제목': '번호 건너뜀', '설명': '번호가 연속되지 않는 행'},
+    {'번호': 7, '제목': '중복 번호 (마지막 행 사용)', '설명': '같은 번호가 두 번 나오면 마지막 행을 사용합니다.'},
+    {'번호': 8, '제목': '특수문자 ㎡ ℃ ※ ① ② ·', '설명': '1,234㎡ / 25℃ ※ 참고: ①, ② 항목 · 확인'},
+]
+
+# 기본 시트 모음 {이름: 행 목록 생성 함수}
+CORPUS = {
+    'short': lambda: make_synthetic_rows(5, seed=1),
+    'medium': lambda: make_synthetic_rows(40, seed=2),
+    'edge': lambda: [dict(row) for row in EDGE_ROWS],
+}
+
+
+def make_variant_rows(rows: List[Dict]) -> List[Dict]:
+    """증분 렌더링 검사용 수정 전 시트 (가운데 행 설명을 늘려 아래 레이어 위치도 바뀌게 함)"""
+    variant = [dict(row) for row in rows]
+    if variant:
+        middle = variant[len(variant) // 2]
+        middle['설명'] = f"{middle['설명']} 수정 전 문장이 더 길어서 줄 수가 달라지는 경우를 확인합니다."
+    return variant
+
+
+def hash_image(image) -> str:
+    """픽셀 데이터 해시 (모드, 크기 포함)"""
+    digest = hashlib.sha256()
+    digest.update(f'{image.mode}:{image.size[0]}x{image.size[1]}:'.encode('utf-8'))
+    digest.update(image.tobytes())
+    return digest.hexdigest()
+
+
+def hash_image_file(path: str) -> str:
+    """이미지 파일의 픽셀 해시"""
+    from PIL import Image
+
+    with Image.open(path) as image:
+        image.load()
+        return hash_image(image)
+
+
+def make_diff_image(expected, actual) -> Tuple[object, int, Optional[Tuple[int, int, int, int]]]:
+    """
+    픽셀 단위 비교 이미지 생성
+
+    같은 픽셀은 기준 이미지를 흐린 흑백으로, 다른 픽셀은 빨간색으로 표시합니다.
+    크기가 다르면 큰 쪽 크기에 맞춰 흰색으로 채운 뒤 비교합니다.
+
+    Returns:
+        (비교 이미지, 다른 픽셀 수, 다른 영역 (left, top, right, bottom) 또는 None)
+    """
+    from PIL import Image, ImageChops
+
+    size = (max(expected.width, actual.width), max(expected.height, actual.height))
+
+    def normalize(image):
+        canvas = Image.new('RGB', size, (255, 255, 255))
+        canvas.paste(image.convert('RGB'), (0, 0))
+        return canvas
+
+    expected_rgb = normalize(expected)
+    actual_rgb = normalize(actual)
+
+    difference = ImageChops.difference(expected_rgb, actual_rgb).convert('L')
+    mask = difference.point(lambda value: 255 if value else 0)
+    changed_pixels = mask.histogram()[255]
+    bbox = mask.getbbox()
+
+    base = expected_rgb.convert('L').convert('RGB')
+    diff_image = Image.blend(base, Image.new('RGB', size, (255, 255, 255)), DIFF_FADE)
+    diff_image.paste(DIFF_COLOR, (0, 0, size[0], size[1]), mask)
+    return diff_image, changed_pixels, bbox
+
+
+class GoldenImageHarness:
+    """시트 모음 × 템플릿 × 렌더링 방식 결과를 골든 해시와 비교하고 렌더링 시간 측정"""
+
+    def __init__(self, golden_dir: str, template_paths: Dict[str, str], sheets: Optional[List[str]] = None,
+                 modes=DEFAULT_MODES, fonts_path: Optional[str] = None, chunk_height: int = 2000,
+                 diff_dir: Optional[str] = None):
+        """
+        Args:
+            golden_dir: 골든 파일 폴더 (golden_hashes.json, 선택적으로 images/)
+            template_paths: {템플릿 이름: 템플릿 파일 경로}
+            sheets: 사용할 시트 이름 (CORPUS 키, None이면 전체)
+            modes: 렌더링 방식 목록 (RENDER_MODES, canvas는 항상 포함)
+            fonts_path: 폰트 폴더 (None이면 assets/fonts)
+            chunk_height: 청크 높이
+            diff_dir: 비교 이미지 저장 폴더 (None이면 golden_dir/diff)
+        """
+        for mode in modes:
+            if mode not in RENDER_MODES:
+                raise ValueError(f"지원하지 않는 렌더링 방식입니다: {mode} (사용 가능: {', '.join(RENDER_MODES)})")
+        sheets = list(sheets) if sheets else list(CORPUS)
+        for sheet in sheets:
+            if sheet not in CORPUS:
+                raise ValueError(f"알 수 없는 시트입니다: {sheet} (사용 가능: {', '.join(CORPUS)})")
+
+        self.golden_dir = golden_dir
+        self.golden_path = os.path.join(golden_dir, GOLDEN_FILE_NAME)
+        self.images_dir = os.path.join(golden_dir, GOLDEN_IMAGES_DIR)
+        self.template_paths = template_paths
+        self.sheets = sheets
+        # 기준 방식(canvas)을 먼저 렌더링
+        self.modes = [REFERENCE_MODE] + [mode for mode in modes if mode != REFERENCE_MODE]
+        self.fonts_path = fonts_path
+        self.chunk_height = chunk_height
+        self.diff_dir = diff_dir or os.path.join(golden_dir, 'diff')
+
+    @staticmethod
+    def make_case_name(sheet: str, template_name: str) -> str:
+        return f"{sheet}/{template_name}"
+
+    def load_golden(self) -> Optional[Dict]:
+        """골든 파일 읽기 (없으면 None, 형식 버전이 다르면 ValueError)"""
+        if not os.path.exists(self.golden_path):
+            return None
+        with open(self.golden_path, 'r', encoding='utf-8') as f:
+            golden = json.load(f)
+        if golden.get('version') != GOLDEN_VERSION:
+            raise ValueError(f"골든 파일 형식 버전이 다릅니다: {golden.get('version')} (필요: {GOLDEN_VERSION})")
+        return golden
+
+    def _create_position_settings(self):
+        from .position_settings import PositionSettings
+
+        position_settings = PositionSettings()
+        position_settings.fonts_path = self.fonts_path
+        position_settings.text_utils.fonts_path = self.fonts_path
+        return position_settings
+
+    def _load_document(self, excel_path: str, company_name: str, position_settings):
+        from .excel_to_json import ExelToJson
+
+        with open(excel_path, 'rb') as f:
+            excel_file = io.BytesIO(f.read())
+        return ExelToJson(excel_file, position_settings, company_name=company_name).generate_document()
+
+    def _render(self, document, template_tiles, output_dir: str, position_settings, streaming: bool = False,
+                incremental_state=None, render_cache=None) -> Tuple[Dict[str, str], float]:
+        """
+        렌더링 한 번 실행
+
+        Returns:
+            ({결과 이름: 파일 경로}, generate_image_from_json 소요 시간)
+        """
+        from .json_to_image import JsonToImage
+
+        os.makedirs(output_dir, exist_ok=True)
+        image_generator = JsonToImage(
+            document,
+            os.path.join(output_dir, 'output.png'),
+            template_tiles,
+            split_chunks=True,
+            chunk_height=self.chunk_height,
+            fonts_path=self.fonts_path,
+            output_dir=output_dir,
+            position_settings=position_settings,
+            streaming=streaming,
+            incremental_state=incremental_state,
+            render_cache=render_cache
+        )
+        started = time.perf_counter()
+        result_files = image_generator.generate_image_from_json()
+        seconds = time.perf_counter() - started
+        return {os.path.basename(path): path for path in result_files}, seconds
+
+    def render_mode(self, mode: str, document, variant_document, template_tiles, work_dir: str,
+                    position_settings) -> Tuple[Dict[str, str], float]:
+        """
+        렌더링 방식 하나로 결과 생성 (시간은 검사 대상 렌더링만 측정)
+
+        - incremental: 수정 전 시트를 먼저 그린 뒤 같은 상태로 대상 시트를 증분 렌더링
+        - cached: 빈 캐시에 한 번 저장한 뒤 캐시에서 다시 출력
+        """
+        output_dir = os.path.join(work_dir, mode)
+        if mode == 'canvas':
+            return self._render(document, template_tiles, output_dir, position_settings)
+        if mode == 'streaming':
+            return self._render(document, template_tiles, output_dir, position_settings, streaming=True)
+        if mode == 'incremental':
+            from .incremental_render import IncrementalRenderState
+
+            state = IncrementalRenderState()
+            self._render(variant_document, template_tiles, os.path.join(work_dir, 'incremental_before'),
+                         position_settings, incremental_state=state)
+            return self._render(document, template_tiles, output_dir, position_settings, incremental_state=state)
+        if mode == 'cached':
+            from .render_cache import RenderCache
+
+            render_cache = RenderCache(os.path.join(work_dir, 'cache'))
+            self._render(document, template_tiles, os.path.join(work_dir, 'cached_store'), position_settings,
+                         render_cache=render_cache)
+            return self._render(document, template_tiles, output_dir, position_settings, render_cache=render_cache)
+        raise ValueError(f"지원하지 않는 렌더링 방식입니다: {mode}")
+
+    def _write_diff(self, case_name: str, mode: str, result_name: str, actual_path: str,
+                    expected_path: Optional[str]) -> Optional[Dict]:
+        """비교 이미지 저장 - 기준 이미지가 없으면 None"""
+        from PIL import Image
+
+        if not expected_path or not os.path.exists(expected_path):
+            return None
+        with Image.open(expected_path) as expected, Image.open(actual_path) as actual:
+            diff_image, changed_pixels, bbox = make_diff_image(expected, actual)
+            sizes = (expected.size, actual.size)
+        diff_path = os.path.join(self.diff_dir, case_name.replace('/', '_'), f"{mode}_{os.path.splitext(result_name)[0]}.png")
+        os.makedirs(os.path.dirname(diff_path), exist_ok=True)
+        diff_image.save(diff_path)
+        return {'path': diff_path, 'changed_pixels': changed_pixels, 'bbox': bbox,
+                'expected_size': sizes[0], 'actual_size': sizes[1]}
+
+    def run(self, save: bool = False, store_images: bool = False,
+            progress: Optional[Callable[[str], None]] = print) -> Dict:
+        """
+        전체 검사 실행
+
+        Args:
+            save: True이면 canvas 결과를 새 골든으로 저장 (비교하지 않음)
+            store_images: save 시 골든 이미지도 저장 (이후 비교 이미지의 기준)
+            progress: 진행 메시지 출력 함수
+
+        Returns:
+            {'cases': {케이스: {방식: {'seconds', 'hashes', 'mismatches', 'missing', 'extra'}}},
+             'failures': [메시지, ...], 'golden': 골든 dict 또는 None}
+        """
+        from .local_file_manager import LocalFileManager
+
+        golden = None if save else self.load_golden()
+        golden_cases = golden['cases'] if golden else {}
+        file_manager = LocalFileManager()
+        self.fonts_path = self.fonts_path or file_manager.fonts_path
+        position_settings = self._create_position_settings()
+
+        report = {'cases': {}, 'failures': [], 'golden': golden}
+        work_root = tempfile.mkdtemp(prefix='golden_')
+        try:
+            workbooks = {}
+            for sheet in self.sheets:
+                rows = CORPUS[sheet]()
+                workbooks[sheet] = (
+                    write_workbook(os.path.join(work_root, f'{sheet}.xlsx'), rows),
+                    write_workbook(os.path.join(work_root, f'{sheet}_variant.xlsx'), make_variant_rows(rows))
+                )
+
+            for sheet in self.sheets:
+                excel_path, variant_path = workbooks[sheet]
+                for template_name, template_path in self.template_paths.items():
+                    case_name = self.make_case_name(sheet, template_name)
+                    work_dir = os.path.join(work_root, case_name.replace('/', '_'))
+                    template_tiles = file_manager.get_template_tiles(template_path)
+                    document = self._load_document(excel_path, template_name, position_settings)
+                    variant_document = None
+                    if 'incremental' in self.modes:
+                        variant_document = self._load_document(variant_path, template_name, position_settings)
+
+                    case_report = {}
+                    reference_files = {}
+                    for mode in self.modes:
+                        files, seconds = self.render_mode(mode, document, variant_document, template_tiles,
+                                                          work_dir, position_settings)
+                        if mode == REFERENCE_MODE:
+                            reference_files = files
+                        hashes = {name: hash_image_file(path) for name, path in files.items()}
+                        mode_report = {'seconds': seconds, 'hashes': hashes, 'mismatches': [], 'missing': [], 'extra': []}
+                        case_report[mode] = mode_report
+
+                        if save:
+                            continue
+                        self._check_mode(case_name, mode, files, mode_report, golden_cases.get(case_name),
+                                         reference_files, report['failures'])
+
+                    report['cases'][case_name] = case_report
+                    if save and store_images:
+                        image_dir = os.path.join(self.images_dir, case_name.replace('/', '_'))
+                        shutil.rmtree(image_dir, ignore_errors=True)
+                        os.makedirs(image_dir)
+                        for name, path in reference_files.items():
+                            shutil.copyfile(path, os.path.join(image_dir, name))
+                    if progress:
+                        progress(self.format_case(case_name, case_report, golden_cases.get(case_name)))
+                    shutil.rmtree(work_dir, ignore_errors=True)
+        finally:
+            shutil.rmtree(work_root, ignore_errors=True)
+
+        if save:
+            self.save_golden(report['cases'])
+        return report
+
+    def _check_mode(self, case_name: str, mode: str, files: Dict[str, str], mode_report: Dict,
+                    golden_case: Optional[Dict], reference_files: Dict[str, str], failures: List[str]):
+        """렌더링 방식 하나의 결과를 골든(없으면 같은 실행의 canvas 결과)과 비교"""
+        if golden_case is not None:
+            expected_hashes = golden_case['hashes']
+        elif mode != REFERENCE_MODE:
+            expected_hashes = {name: hash_image_file(path) for name, path in reference_files.items()}
+        else:
+            # 골든이 없으면 canvas 결과는 비교 대상 없음
+            return
+
+        # 스트리밍은 전체 이미지(output.png)를 만들지 않으므로 청크만 비교
+        expected_names = set(expected_hashes)
+        if mode == 'streaming':
+            expected_names = {name for name in expected_names if name in files or name != 'output.png'}
+        mode_report['missing'] = sorted(expected_names - set(files))
+        mode_report['extra'] = sorted(set(files) - set(expected_hashes))
+        for name in mode_report['missing']:
+            failures.append(f"{case_name} [{mode}] {name}: 결과 없음")
+        for name in mode_report['extra']:
+            failures.append(f"{case_name} [{mode}] {name}: 골든에 없는 결과")
+
+        for name, path in sorted(files.items()):
+            expected = expected_hashes.get(name)
+            if expected is None or expected == mode_report['hashes'][name]:
+                continue
+            expected_path = os.path.join(self.images_dir, case_name.replace('/', '_'), name)
+            if not os.path.exists(expected_path):
+                expected_path = reference_files.get(name) if mode != REFERENCE_MODE else None
+            diff = self._write_diff(case_name, mode, name, path, expected_path)
+            mode_report['mismatches'].append({'name': name, 'diff': diff})
+            if diff is None:
+                failures.append(f"{case_name} [{mode}] {name}: 픽셀 다름 (비교할 골든 이미지 없음)")
+            else:
+                failures.append(f"{case_name} [{mode}] {name}: 픽셀 {diff['changed_pixels']}개 다름 "
+                                f"(영역 {diff['bbox']}, 크기 {diff['expected_size']} → {diff['actual_size']}) "
+                                f"→ {diff['path']}")
+
+    @staticmethod
+    def format_case(case_name: str, case_report: Dict, golden_case: Optional[Dict]) -> str:
+        """케이스 한 줄 요약 (방식별 결과와 시간, 골든 저장 시간 대비 비율)"""
+        parts = []
+        for mode, mode_report in case_report.items():
+            failed = mode_report['mismatches'] or mode_report['missing'] or mode_report['extra']
+            status = '✗' if failed else '✓'
+            text = f"{mode} {status} {mode_report['seconds']:.2f}s"
+            previous = (golden_case or {}).get('seconds', {}).get(mode)
+            if previous:
+                text += f" (×{mode_report['seconds'] / previous:.2f})"
+            parts.append(text)
+        return f"{case_name:<32} " + ' | '.join(parts)
+
+    def save_golden(self, cases: Dict[str, Dict]):
+        """canvas 결과 해시와 방식별 렌더링 시간을 골든 파일로 저장"""
+        os.makedirs(self.golden_dir, exist_ok=True)
+        golden_cases = {
+            case_name: {
+                'hashes': case_report[REFERENCE_MODE]['hashes'],
+                'seconds': {mode: mode_report['seconds'] for mode, mode_report in case_report.items()}
+            }
+            for case_name, case_report in cases.items()
+        }
+        with open(self.golden_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': GOLDEN_VERSION, 'created': time.time(), 'chunk_height': self.chunk_height,
+                       'cases': golden_cases}, f, ensure_ascii=False, indent=2)
+
+    @staticmethod
+    def summarize_timings(report: Dict) -> Dict[str, Dict]:
+        """
+        방식별 렌더링 시간 합계 {방식: {'seconds', 'compared_seconds', 'golden_seconds'}}
+
+        compared_seconds/golden_seconds는 골든에 시간이 있는 케이스만 합산합니다.
+        """
+        golden_cases = report['golden']['cases'] if report.get('golden') else {}
+        totals = {}
+        for case_name, case_report in report['cases'].items():
+            for mode, mode_report in case_report.items():
+                total = totals.setdefault(mode, {'seconds': 0.0, 'compared_seconds': 0.0, 'golden_seconds': 0.0})
+                total['seconds'] += mode_report['seconds']
+                previous = golden_cases.get(case_name, {}).get('seconds', {}).get(mode)
+                if previous:
+                    total['compared_seconds'] += mode_report['seconds']
+                    total['golden_seconds'] += previous
+        return totals
+
+    @classmethod
+    def compare_timings(cls, report: Dict, tolerance: float) -> List[str]:
+        """골든 저장 시간 대비 방식별 렌더링 시간 합계가 허용 비율 이상 늘어난 경우 메시지 목록"""
+        regressions = []
+        for mode, total in cls.summarize_timings(report).items():
+            previous = total['golden_seconds']
+            if not previous:
+                continue
+            seconds = total['compared_seconds']
+            if seconds > previous * (1 + tolerance) + MIN_SECONDS_SLACK:
+                regressions.append(f"[{mode}] 렌더링 시간 {previous:.2f}s → {seconds:.2f}s "
+                                   f"(+{(seconds / previous - 1) * 100:.0f}%, 허용 {tolerance * 100:.0f}%)")
+        return regressions
@@ -0,0 +1,134 @@
+"""
+증분 렌더링 모듈
+이전 생성 결과(레이아웃, 청크 이미지)를 보관하고 바뀐 청크만 다시 그립니다.
+
+- 레이어 지문: 레이어 dict(텍스트, 색상, 폰트, 박스) 해시 + 계산된 위치
+- 설정 지문: 위치 설정, 템플릿, 출력 형식, 청크 높이 등 - 다르면 전체 다시 그림
+- 박스 높이가 같은 행만 바뀌면 그 레이어가 걸친 청크만, 높이가 바뀌면 아래 레이어가
+  모두 이동하므로 첫 변경 지점 이후 청크만 다시 그립니다.
+
+청크마다 배경 합성 + 겹치는 레이어 그리기를 하므로 결과는 전체 렌더링과 픽셀 단위로 같습니다.
+"""
+
+import hashlib
+import json
+from typing import Dict, List, Optional, Set, Tuple
+
+from .template_cache import FOOTER_HEIGHT, HEADER_HEIGHT
+
+
+def fingerprint_layer(layer) -> str:
+    """레이어 내용 지문 (번호/제목/내용의 텍스트, 색상, 폰트, 박스 정보)"""
+    payload = json.dumps(layer.to_dict(), sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def fingerprint_settings(settings: Dict) -> str:
+    """전체 설정 지문"""
+    payload = json.dumps(settings, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def fingerprint_template(tiles):
+    """템플릿 지문 (파일이면 경로/수정 시각, 메모리 이미지면 픽셀 해시)"""
+    if tiles.path is not None:
+        return [tiles.path, tiles.mtime_ns, list(tiles.size)]
+    digest = hashlib.sha1()
+    for tile in (tiles.header, tiles.body, tiles.footer):
+        if tile is not None:
+            digest.update(tile.tobytes())
+    return [digest.hexdigest(), list(tiles.size)]
+
+
+def _freeze(value):
+    """위치 정보(dict/list)를 비교 가능한 값으로 변환"""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+class IncrementalRenderState:
+    """
+    증분 렌더링 상태 (생성 사이에 유지)
+
+    JsonToImage(incremental_state=...)로 전달하면 이전 생성과 비교하여
+    바뀐 청크만 다시 그리고, 나머지 청크는 보관된 인코딩 결과를 그대로 저장합니다.
+    """
+
+    def __init__(self):
+        self.settings_key: Optional[str] = None
+        self.required_height: Optional[int] = None
+        self.template_height: Optional[int] = None
+        # 레이어 키 → (레이어 지문, 위치 정보, 그리기 범위)
+        self.layer_signatures: Dict[str, Tuple] = {}
+        self.separators: Set[int] = set()
+        # 청크별 {'band_top', 'band_bottom', 'data', 'record'} (밴드 이미지는 보관하지 않음 - 메모리가 시트 길이에 비례하지 않음)
+        self.chunks: List[Dict] = []
+        # 전체 이미지 (인코딩 결과, 저장 기록)
+        self.full_image: Optional[Tuple[bytes, Dict]] = None
+        # 마지막 생성 통계 {'chunks', 'redrawn', 'reused', 'full_redraw'}
+        self.last_stats: Dict = {}
+
+    def reset(self):
+        """보관 결과 비우기 (다음 생성은 전체 렌더링)"""
+        self.__init__()
+
+    @property
+    def is_empty(self) -> bool:
+        return self.settings_key is None
+
+    def find_dirty_chunks(self, settings_key: str, layer_signatures: Dict[str, Tuple], separators: Set[int],
+                          required_height: int, template_height: int,
+                          chunk_ranges: List[Tuple[int, int]]) -> List[bool]:
+        """
+        다시 그려야 하는 청크 표시 목록 (chunk_ranges와 같은 순서)
+
+        이전 결과가 없거나 설정/청크 경계가 바뀌었으면 모든 청크를 다시 그립니다.
+        """
+        previous_ranges = [(chunk['band_top'], chunk['band_bottom']) for chunk in self.chunks]
+        if self.settings_key != settings_key or self.template_height != template_height:
+            return [True] * len(chunk_ranges)
+
+        dirty_ranges = []
+
+        # 지문 또는 위치가 바뀐 레이어: 이전/현재 그리기 범위 모두
+        for layer_key in set(self.layer_signatures) | set(layer_signatures):
+            previous = self.layer_signatures.get(layer_key)
+            current = layer_signatures.get(layer_key)
+            if previous == current:
+                continue
+            for signature in (previous, current):
+                if signature is not None:
+                    dirty_ranges.append(signature[2])
+
+        # 추가/제거된 구분선
+        for separator_y in self.separators ^ separators:
+            dirty_ranges.append((separator_y, separator_y + 1))
+
+        # 이미지 높이가 바뀌면 푸터 위치가 바뀜 (템플릿 본문 사용 여부가 바뀌면 헤더 아래 전체)
+        if self.required_height != required_height:
+            same_body = (self.required_height <= template_height) == (required_height <= template_height)
+            if same_body:
+                background_top = min(self.required_height, required_height) - FOOTER_HEIGHT
+            else:
+                background_top = HEADER_HEIGHT
+            dirty_ranges.append((background_top, max(self.required_height, required_height)))
+
+        dirty = []
+        for index, (band_top, band_bottom) in enumerate(chunk_ranges):
+            if index >= len(previous_ranges) or previous_ranges[index] != (band_top, band_bottom):
+                dirty.append(True)
+                continue
+            dirty.append(any(top < band_bottom and bottom > band_top for top, bottom in dirty_ranges))
+        return dirty
+
+    @staticmethod
+    def make_layer_signatures(document, layer_positions: Dict, get_extent) -> Dict[str, Tuple]:
+        """레이어 키 → (레이어 지문, 위치 정보, 그리기 범위)"""
+        return {
+            layer.key: (fingerprint_layer(layer), _freeze(layer_positions[layer.key]),
+                        get_extent(layer_positions[layer.key]))
+            for layer in document.layers
+        }
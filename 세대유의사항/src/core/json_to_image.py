@@ -5,25 +5,65 @@ try:
 except ImportError:
     PIL_AVAILABLE = False
     print("⚠️ JsonToImage: PIL/Pillow 없음 - 일부 기능 제한될 수 있음")
+import io
+import logging
 import os
-import pandas as pd
-from ..utils.text_utils import TextUtils
+from concurrent.futures import ThreadPoolExecutor
+from ..utils.progress import get_progress
+from ..utils.text_utils import FontRegistry, TextUtils
+from ..utils.tracing import span
+from .notice_document import NoticeDocument
+from .output_profiles import get_output_profile, summarize_encode_stats
+from .output_sink import DirectorySink
+from .incremental_render import fingerprint_settings, fingerprint_template
+from .template_cache import TemplateCache, TemplateTiles
+
+logger = logging.getLogger(__name__)
 
 
 class JsonToImage:
-    def __init__(self, excel_file_json, output_image, original_image, split_chunks, chunk_height, fonts_path='/tmp/fonts', output_dir=None, position_settings=None):
+    # 렌더링 모드
+    # - 'layout': PositionSettings가 측정한 줄 문자열을 그대로 그림 (재측정 없음, 박스 높이와 픽셀 단위 일치)
+    # - 'rewrap': 그리기 단계에서 텍스트를 다시 줄바꿈 (기존 방식)
+    RENDER_MODE_LAYOUT = 'layout'
+    RENDER_MODE_REWRAP = 'rewrap'
+
+    def __init__(self, excel_file_json, output_image, original_image, split_chunks, chunk_height, fonts_path=None, output_dir=None, position_settings=None,
+                 render_mode=RENDER_MODE_LAYOUT, encode_workers=None, output_profile=None, streaming=False,
+                 output_sink=None, incremental_state=None, render_cache=None):
+        # 문서 모델 (NoticeDocument, 기존 JSON 템플릿 dict/문자열도 허용)
         self.excel_file_json = excel_file_json
-        self.output_image = output_image
+        self.document = NoticeDocument.coerce(excel_file_json)
+        # 출력 형식 프로파일 (기본값: 기존과 같은 PNG 저장)
+        self.output_profile = get_output_profile(output_profile)
+        self.output_image = self.output_profile.with_extension(output_image)
         self.original_image = original_image
         self.layer_spacing = 80
         self.split_chunks = split_chunks
         self.chunk_height = chunk_height
+        # 폰트 폴더 (None이면 기본 assets/fonts - 폰트는 복사 없이 설치 위치에서 사용)
         self.fonts_path = fonts_path
         self.output_dir = output_dir or os.path.dirname(output_image)
         # 위치 설정 (선택적)
         self.position_settings = position_settings
         # 텍스트 유틸리티 초기화
         self.text_utils = TextUtils(fonts_path)
+        # 렌더링 모드
+        if render_mode not in (self.RENDER_MODE_LAYOUT, self.RENDER_MODE_REWRAP):
+            raise ValueError(f"지원하지 않는 렌더링 모드입니다: {render_mode}")
+        self.render_mode = render_mode
+        # PNG 인코딩 스레드 수 (zlib 압축은 GIL을 해제하므로 스레드로 병렬 처리됨)
+        self.encode_workers = encode_workers or min(8, os.cpu_count() or 1)
+        # 마지막 저장의 파일별 인코딩 시간/크기 기록
+        self.encode_stats = []
+        # 스트리밍 모드: 전체 높이 캔버스 없이 청크 단위로 렌더링 (메모리 상한 = 청크 크기)
+        self.streaming = streaming
+        # 저장 위치 (None이면 output_image/output_dir에 원자적 쓰기, ZipSink 등은 호출한 쪽에서 close)
+        self.output_sink = output_sink or self._create_default_sink()
+        # 증분 렌더링 상태 (IncrementalRenderState - 생성 사이에 유지하면 바뀐 청크만 다시 그림)
+        self.incremental_state = incremental_state
+        # 렌더링 결과 디스크 캐시 (RenderCache - 같은 입력이면 저장된 이미지를 그대로 출력)
+        self.render_cache = render_cache
 
     def get_font(self, font_size, font_weight='normal', text_type='content'):
         """폰트 가져오기 (TextUtils 사용)"""
@@ -59,15 +99,22 @@ class JsonToImage:
         # PositionSettings와 동일한 계산 방식: 줄 수 × line_spacing
         return len(lines) * line_spacing
 
-    def draw_multiline_text(self, draw, position, text, font, color, max_width, is_bold=False, forced_lines=None):
-        """여러 줄 텍스트 그리기 (PositionSettings 동기화 지원)"""
+    def draw_multiline_text(self, draw, position, text, font, color, max_width, is_bold=False, forced_lines=None, lines=None):
+        """
+        여러 줄 텍스트 그리기 (PositionSettings 동기화 지원)
+        
+        lines가 주어지면 (레이아웃 단계에서 측정한 줄 문자열) 다시 줄바꿈하지 않고 그대로 그립니다.
+        """
         x, y = position
         
         # 라인 높이 계산 (PositionSettings와 일관성 유지)
         line_spacing = 44  # PositionSettings의 line_height_multiplier와 동일
         
+        if lines is not None:
+            # 레이아웃에서 측정한 줄을 그대로 사용
+            pass
         # PositionSettings에서 계산한 줄 수가 있으면 검증 후 사용
-        if forced_lines is not None:
+        elif forced_lines is not None:
             # 먼저 자연스러운 줄바꿈 계산
             natural_lines = self.wrap_text_to_fit(draw, text, font, max_width)
             natural_line_count = len(natural_lines)
@@ -171,48 +218,38 @@ class JsonToImage:
         
         return merged_lines if merged_lines else natural_lines
 
-    def calculate_layer_positions(self, template, image_height=None):
+    def calculate_layer_positions(self, document, image_height=None):
         """레이어 위치 계산 (PositionSettings 사용 가능, 이미지 높이 고려)"""
-        layer_keys = sorted(template['layers'].keys(), key=lambda x: int(x.replace('layer', '')))
-
         # PositionSettings가 있으면 항상 사용 (간격 통일을 위해 강제 적용)
         if self.position_settings:
-            return self.calculate_positions_with_settings(template, image_height)
+            return self.calculate_positions_with_settings(document, image_height)
 
         # PositionSettings가 없는 경우 에러 발생 (일관성 보장)
         raise ValueError("PositionSettings가 필수입니다. 일관성 있는 레이어 계산을 위해 PositionSettings를 사용해주세요.")
 
-    def calculate_positions_with_settings(self, template, image_height=None):
+    def calculate_positions_with_settings(self, document, image_height=None):
         """PositionSettings를 사용한 위치 계산 (이미지 높이 고려)"""
+        document = NoticeDocument.coerce(document)
+        layer_keys = document.layer_keys
 
-        # 템플릿에서 데이터 추출
-        data_rows = []
-        layer_keys = sorted(template['layers'].keys(), key=lambda x: int(x.replace('layer', '')))
+        # ExelToJson이 계산해 둔 레이아웃이 유효하면 재계산 없이 사용 (작업당 1회 측정)
+        positions = self.get_carried_positions(document)
 
-        for layer_key in layer_keys:
-            layer_data = template['layers'][layer_key]
-            layer_num = int(layer_key.replace('layer', ''))
-            title = layer_data['title_layer']['text']
-            content = layer_data['content_layer']['text']
+        if positions is None:
+            # 문서에서 데이터 추출
+            data_rows = [
+                {'번호': layer.number, '제목': layer.title_layer.text, '설명': layer.content_layer.text}
+                for layer in document.layers
+            ]
 
-            data_rows.append({
-                '번호': layer_num,
-                '제목': title,
-                '설명': content
-            })
-
-        # DataFrame 생성
-        df = pd.DataFrame(data_rows)
-
-        # PositionSettings로 위치 계산 (이미지 높이와 템플릿 데이터 전달)
-        positions = self.position_settings.calculate_positions(df, image_height=image_height, template_data=template)
+            # PositionSettings로 위치 계산 (이미지 높이와 템플릿 데이터 전달)
+            positions = self.position_settings.calculate_positions(data_rows, image_height=image_height, template_data=document)
 
         # 결과를 JsonToImage 형식으로 변환 (레이어 박스 정보 포함)
         layer_positions = {}
         for i, layer_key in enumerate(layer_keys):
             if i < len(positions):
                 pos = positions[i]
-                layer_num = int(layer_key.replace('layer', ''))
                 
                 # 레이어 박스 정보가 있는지 확인
                 if 'layer_box' in pos:
@@ -232,7 +269,14 @@ class JsonToImage:
                         'title_lines': pos['title'].get('lines', 1),
                         'content_lines': pos['content'].get('lines', 1),
                         'title_text': pos['title'].get('text', ''),
-                        'content_text': pos['content'].get('text', '')
+                        'content_text': pos['content'].get('text', ''),
+                        # 레이아웃 단계에서 측정한 실제 줄 문자열
+                        'title_wrapped_lines': pos['title'].get('wrapped_lines'),
+                        'content_wrapped_lines': pos['content'].get('wrapped_lines'),
+                        # PositionSettings 계산 X 좌표
+                        'number_x': pos['number']['x'],
+                        'title_x': pos['title']['x'],
+                        'content_x': pos['content']['x']
                     }
                 else:
                     # 하위 호환성: 레이어 박스 정보가 없는 경우
@@ -243,32 +287,75 @@ class JsonToImage:
                         'title_y': int(pos['title']['y']),
                         'content_y': int(pos['content']['y']),
                         'height': int(pos['content']['y'] + pos['content']['height'] - pos['title']['y']),
-                        'actual_content_height': int(pos['content']['height'])
+                        'actual_content_height': int(pos['content']['height']),
+                        'number_x': pos['number']['x'],
+                        'title_x': pos['title']['x'],
+                        'content_x': pos['content']['x']
                     }
 
         return layer_positions
 
+    def get_carried_positions(self, document):
+        """
+        문서에 포함된 레이아웃(ExelToJson 계산 결과) 반환
+        
+        계산 당시 설정값과 현재 PositionSettings 설정이 같고, 측정에 사용한 폰트 파일이
+        그릴 폰트와 같으며, 모든 레이어의 텍스트가 일치할 때만 사용합니다.
+        사용할 수 없으면 None을 반환합니다.
+        """
+        layout = document.layout
+        if not layout or not self.position_settings:
+            return None
+
+        if layout.get('settings') != self.position_settings.get_all_settings():
+            return None
+
+        # 다른 폰트(또는 기본 비트맵 폰트)로 측정한 줄바꿈/높이는 현재 폰트와 맞지 않음
+        if 'fonts_path' not in layout:
+            return None
+        if FontRegistry.resolve_all(layout['fonts_path']) != FontRegistry.resolve_all(self.fonts_path):
+            return None
+
+        layout_layers = layout.get('layers') or {}
+        positions = []
+        for layer in document.layers:
+            pos = layout_layers.get(layer.key)
+            if pos is None or 'layer_box' not in pos:
+                return None
+
+            if (pos['title'].get('text') != layer.title_layer.text or
+                    pos['content'].get('text') != layer.content_layer.text):
+                return None
+
+            positions.append(pos)
+
+        return positions
+
     def calculate_required_height(self, layer_positions):
         """필요한 이미지 높이 계산 (동적 레이어 박스 지원, 데이터 양에 따른 하단 여백 최적화)"""
         if not layer_positions:
             return 1500
 
         max_y = 422  # 기본 상단 높이
-        print(f"🔍 높이 계산 시작 - 기본 상단 높이: {max_y}px")
-        print(f"🔍 레이어 개수: {len(layer_positions)}개")
+        # 레이어별 상세 로그는 DEBUG 수준에서만 (레이어 수만큼 출력되므로 문자열 생성도 생략)
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("🔍 높이 계산 시작 - 기본 상단 높이: %spx, 레이어 %s개", max_y, len(layer_positions))
         
         for layer_key, pos_info in layer_positions.items():
             # 동적 레이어 박스 정보가 있으면 우선 사용
             if 'layer_box_end' in pos_info:
                 layer_bottom = pos_info['layer_box_end']
-                print(f"🔍 {layer_key}: layer_box_end = {layer_bottom}px")
+                if debug:
+                    logger.debug("🔍 %s: layer_box_end = %spx", layer_key, layer_bottom)
             else:
                 # 하위 호환성: 기존 방식
                 layer_bottom = pos_info['base_y'] + pos_info['height']
-                print(f"🔍 {layer_key}: base_y({pos_info['base_y']}) + height({pos_info['height']}) = {layer_bottom}px")
+                if debug:
+                    logger.debug("🔍 %s: base_y(%s) + height(%s) = %spx",
+                                 layer_key, pos_info['base_y'], pos_info['height'], layer_bottom)
                 
             max_y = max(max_y, layer_bottom)
-            print(f"🔍 현재 max_y: {max_y}px")
 
         # 여백만 최소화, 푸터는 원본 크기 유지
         bottom_margin = 10   # 여백만 최소화 (20 → 10)
@@ -276,130 +363,56 @@ class JsonToImage:
         
         required_height = max_y + bottom_margin + bottom_area
         
-        print(f"🔍 최종 계산: max_y({max_y}) + bottom_margin({bottom_margin}) + bottom_area({bottom_area}) = {required_height}px")
-        print(f"🔍 하단 여백 총합: {bottom_margin + bottom_area}px")
+        logger.debug("🔍 최종 계산: max_y(%s) + bottom_margin(%s) + bottom_area(%s) = %spx",
+                     max_y, bottom_margin, bottom_area, required_height)
         
         return required_height
 
     def resize_image(self, original_image, required_height, data_count=0):
-        """이미지 높이 동적 조정 (확장/축소 모두 지원, 템플릿 중간 여백 제거)"""
+        """
+        이미지 높이 동적 조정 (확장/축소 모두 지원, 템플릿 중간 여백 제거)
+
+        Args:
+            original_image: 템플릿 PIL 이미지 또는 TemplateTiles (캐시된 타일)
+        """
         if not PIL_AVAILABLE:
             return original_image
-            
-        original_width, original_height = original_image.size
-        print(f"🖼️ 이미지 크기 조정 시작 - 원본: {original_width}x{original_height}px")
-        print(f"🖼️ 요청된 높이: {required_height}px")
-        print(f"🖼️ 데이터 개수: {data_count}개")
 
-        # 푸터 크기 설정 (원본 크기 유지)
-        footer_height = 114
-        
+        tiles = original_image if isinstance(original_image, TemplateTiles) else TemplateTiles(original_image)
+        original_width, original_height = tiles.size
         if required_height == original_height:
-            print(f"🖼️ 크기 조정 불필요 - 원본 크기 그대로 사용")
-            return original_image
+            action = "크기 조정 불필요"
         elif required_height < original_height:
-            print(f"🖼️ 축소 필요 - 템플릿 중간 여백 제거")
-            return self._crop_image(original_image, required_height, footer_height)
+            action = "축소 - 템플릿 중간 여백 제거"
         else:
-            print(f"🖼️ 확장 필요 - 이미지 높이 늘리기")
-            return self._extend_image(original_image, required_height, footer_height)
-    
-    def _crop_image(self, original_image, required_height, footer_height):
-        """이미지 축소 - 템플릿 중간 여백 제거"""
-        try:
-            original_width, original_height = original_image.size
-            
-            # 새 이미지 생성
-            cropped_image = Image.new('RGBA', (original_width, required_height), (255, 255, 255, 255))
-            
-            # 1. 헤더 영역 복사 (고정: 0~422px)
-            header_area = original_image.crop((0, 0, original_width, 422))
-            cropped_image.paste(header_area, (0, 0))
-            print(f"🖼️ 헤더 영역 복사: 0~422px")
-            
-            # 2. 콘텐츠 영역 계산 (헤더 다음부터 푸터 직전까지)
-            content_start = 422
-            content_end = required_height - footer_height
-            content_height = content_end - content_start
-            
-            print(f"🖼️ 콘텐츠 영역: {content_start}~{content_end}px (높이: {content_height}px)")
-            
-            # 3. 원본에서 콘텐츠 영역 추출 (헤더 바로 다음부터)
-            if content_height > 0:
-                original_content = original_image.crop((0, 422, original_width, 422 + content_height))
-                cropped_image.paste(original_content, (0, content_start))
-                print(f"🖼️ 콘텐츠 영역 복사 완료")
-            
-            # 4. 푸터 영역 복사 (원본 맨 아래에서 가져와서 새 위치에 배치)
-            footer_start = required_height - footer_height
-            original_footer_start = original_height - 114  # 원본 푸터는 항상 114px
-            original_footer = original_image.crop((0, original_footer_start, original_width, original_height))
-            
-            # 푸터 크기 조정
-            if footer_height != 114:
-                resized_footer = original_footer.resize((original_width, footer_height))
-                cropped_image.paste(resized_footer, (0, footer_start))
-                print(f"🖼️ 푸터 리사이즈 후 복사: {footer_start}~{required_height}px (114px → {footer_height}px)")
-            else:
-                cropped_image.paste(original_footer, (0, footer_start))
-                print(f"🖼️ 푸터 원본 크기로 복사: {footer_start}~{required_height}px")
-            
-            print(f"🖼️ 이미지 축소 완료: {original_width}x{required_height}px")
-            return cropped_image
-            
-        except Exception as e:
-            print(f"🖼️ 이미지 축소 실패: {e}")
-            return original_image
-    
-    def _extend_image(self, original_image, required_height, footer_height):
-        """이미지 확장 - 기존 로직"""
-        try:
-            original_width, original_height = original_image.size
-            
-            extended_image = Image.new('RGBA', (original_width, required_height), (255, 255, 255, 255))
+            action = "확장 - 본문 영역 늘리기"
+        logger.info("🖼️ 이미지 크기 조정: %sx%spx → %sx%spx (%s, 데이터 %s개)",
+                    original_width, original_height, original_width, required_height, action, data_count)
+        with span('template.compose', height=required_height):
+            return tiles.compose(required_height)
 
-            # 상단 영역 복사 (고정 헤더 영역)
-            top_area = original_image.crop((0, 0, original_width, 422))
-            extended_image.paste(top_area, (0, 0))
-            print(f"🖼️ 헤더 영역 복사 완료: 0~422px")
+    def _create_default_sink(self):
+        """기본 저장 위치: 전체 이미지는 output_image, 청크는 output_dir"""
+        full_image_name = os.path.basename(self.output_image)
+        full_image_path = os.path.abspath(self.output_image)
 
-            # 하단 영역 복사 (동적 푸터 영역)
-            bottom_source_start = original_height - 114  # 원본에서는 항상 114로 추출
-            bottom_target_start = required_height - footer_height  # 목적지는 동적 크기로 배치
-            
-            print(f"🖼️ 푸터 설정 - 높이: {footer_height}px")
-            print(f"🖼️ 푸터 위치 - 원본: {bottom_source_start}~{original_height}px, 목표: {bottom_target_start}~{required_height}px")
-            
-            # 원본 푸터를 추출하여 동적 크기로 조정
-            original_bottom = original_image.crop((0, bottom_source_start, original_width, original_height))
-            
-            if footer_height != 114:
-                # 푸터 크기가 다르면 리사이즈 적용
-                resized_bottom = original_bottom.resize((original_width, footer_height))
-                extended_image.paste(resized_bottom, (0, bottom_target_start))
-                print(f"🖼️ 푸터 리사이즈 적용: 114px → {footer_height}px")
-            else:
-                # 기존 크기 그대로 사용
-                extended_image.paste(original_bottom, (0, bottom_target_start))
-                print(f"🖼️ 푸터 원본 크기 사용: {footer_height}px")
+        def get_filename(result_name):
+            return full_image_path if result_name == full_image_name else result_name
 
-            print(f"🖼️ 이미지 확장 완료: {original_width}x{required_height}px")
-            return extended_image
-            
-        except Exception as e:
-            print(f"🖼️ 이미지 확장 실패: {e}")
-            return original_image
+        return DirectorySink(self.output_dir, get_filename)
 
     def split_and_save_image(self, output_image, chunk_height):
         """이미지를 청크로 분할하여 저장"""
-        width, height = output_image.size
+        chunk_tasks = self._build_chunk_tasks(output_image, chunk_height)
+        return self._save_images(chunk_tasks)
 
-        # 출력 디렉토리 생성
-        os.makedirs(self.output_dir, exist_ok=True)
+    def _build_chunk_tasks(self, output_image, chunk_height):
+        """청크 저장 작업 목록 생성 [(청크 이미지, 결과 이름, 로그 메시지), ...]"""
+        width, height = output_image.size
 
         chunk_number = 1
         y_position = 0
-        saved_files = []
+        chunk_tasks = []
 
         while y_position < height:
             # 청크 끝 위치 계산
@@ -409,173 +422,527 @@ class JsonToImage:
             chunk = output_image.crop((0, y_position, width, end_y))
 
             # 파일명 생성
-            chunk_filename = f"{chunk_number}.png"
-            chunk_path = os.path.join(self.output_dir, chunk_filename)
-
-            # 청크 저장
-            chunk.save(chunk_path, 'PNG', dpi=(96, 96))
-            saved_files.append(chunk_path)
+            chunk_filename = f"{chunk_number}{self.output_profile.extension}"
 
-            print(f"청크 {chunk_number} 저장됨: {chunk_filename} (높이: {end_y - y_position}px)")
+            chunk_tasks.append((chunk, chunk_filename, f"청크 {chunk_number} 저장됨: {chunk_filename} (높이: {end_y - y_position}px)"))
 
             # 다음 청크로
             y_position = end_y
             chunk_number += 1
 
-        return saved_files
+        return chunk_tasks
+
+    def _save_images(self, save_tasks):
+        """
+        여러 이미지를 스레드 풀에서 동시에 인코딩하여 저장 (출력 프로파일 적용)
+        
+        Args:
+            save_tasks: [(이미지, 결과 이름, 로그 메시지 또는 None), ...]
+            
+        Returns:
+            저장된 파일 경로 목록 (save_tasks와 같은 순서)
+        """
+        def save(task):
+            image, result_name, _ = task
+            return self.output_sink.write(image, result_name, self.output_profile)
+
+        progress = get_progress()
+        progress.start('encode', len(save_tasks))
+        records = []
+        if self.encode_workers <= 1 or len(save_tasks) <= 1:
+            for task in save_tasks:
+                records.append(save(task))
+                progress.advance()
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.encode_workers, len(save_tasks))) as executor:
+                # 입력 순서대로 결과를 모으므로 파일 목록 순서가 항상 같음
+                futures = [executor.submit(save, task) for task in save_tasks]
+                try:
+                    for future in futures:
+                        records.append(future.result())
+                        progress.advance()
+                except Exception:
+                    # 취소/실패 시 아직 시작하지 않은 인코딩은 실행하지 않음
+                    for future in futures:
+                        future.cancel()
+                    raise
+
+        if logger.isEnabledFor(logging.DEBUG):
+            for _, _, message in save_tasks:
+                if message:
+                    logger.debug(message)
+
+        self.encode_stats.extend(records)
+        logger.info("💾 %s", summarize_encode_stats(records))
+
+        return [record['path'] for record in records]
+
+    def load_template_tiles(self):
+        """
+        템플릿 타일 반환
+
+        템플릿은 파일 경로(TemplateCache에서 1회만 디코딩), 미리 로딩된 PIL 이미지,
+        또는 TemplateTiles로 전달할 수 있습니다.
+        """
+        if isinstance(self.original_image, TemplateTiles):
+            return self.original_image
+        if isinstance(self.original_image, Image.Image):
+            return TemplateTiles(self.original_image)
+        return TemplateCache.get(self.original_image)
+
+    def get_layer_extent(self, layer_pos):
+        """레이어가 그려지는 세로 범위 (위, 아래) - 글자 높이와 굵기 보정 여유 포함"""
+        line_spacing = 44
+        top = min(layer_pos['number_y'], layer_pos['title_y'], layer_pos['content_y'],
+                  layer_pos.get('layer_box_start', layer_pos['base_y']))
+        title_lines = len(layer_pos.get('title_wrapped_lines') or []) or layer_pos.get('title_lines', 1)
+        content_lines = len(layer_pos.get('content_wrapped_lines') or []) or layer_pos.get('content_lines', 1)
+        bottom = max(layer_pos.get('layer_box_end', layer_pos['base_y'] + layer_pos['height']),
+                     layer_pos['title_y'] + title_lines * line_spacing,
+                     layer_pos['content_y'] + content_lines * line_spacing)
+        margin = line_spacing * 2
+        return top - margin, bottom + margin
+
+    def get_separator_y(self, layer_pos, next_layer_pos):
+        """두 레이어 사이 구분선 y 좌표"""
+        # 통일된 구분선 위치: 현재 레이어 박스 끝과 다음 레이어 박스 시작의 정중앙 (정수 연산)
+        if 'layer_box_end' in layer_pos and 'layer_box_start' in next_layer_pos:
+            current_end = int(layer_pos['layer_box_end'])
+            next_start = int(next_layer_pos['layer_box_start'])
+            # 정확한 중앙점 계산 - 부동소수점 오차 제거
+            return int(current_end + (next_start - current_end) // 2)
+
+        # Fallback: 레이어 간격의 중앙 (정수 연산)
+        layer_spacing = self.position_settings.get_setting('layer_spacing') if self.position_settings else 20
+        return int(int(layer_pos['base_y']) + int(layer_pos['height']) + layer_spacing // 2)
+
+    def draw_layer(self, draw, layer, layer_pos, use_settings_x, offset_y=0):
+        """레이어 하나(번호, 제목, 내용) 그리기 - offset_y는 밴드 시작 y (전체 이미지면 0)"""
+        # 번호 레이어 그리기
+        number_info = layer.number_layer.info
+        number_char = layer.number_layer.char
+        number_font = self.get_font(number_char.font_size, number_char.font_weight, 'number')
+        number_color = tuple(number_char.color + [255])
+
+        # PositionSettings 사용 시 계산된 X 좌표 적용
+        if use_settings_x and 'number_x' in layer_pos:
+            number_x = int(layer_pos['number_x'])
+        else:
+            number_x = int(number_info.x)
+
+        self.draw_text_bold(
+            draw,
+            (int(number_x), layer_pos['number_y'] - offset_y),
+            layer.number_layer.text,
+            number_font, number_color,
+            False
+        )
+
+        # 제목 레이어 그리기
+        title_info = layer.title_layer.info
+        title_char = layer.title_layer.char
+        title_font = self.get_font(title_char.font_size, title_char.font_weight, 'title')
+        title_color = tuple(title_char.color + [255])
+        title_max_width = int(title_info.width)
+
+        # PositionSettings 사용 시 계산된 X 좌표 적용
+        if use_settings_x and 'title_x' in layer_pos:
+            title_x = int(layer_pos['title_x'])
+        else:
+            title_x = int(title_info.x)
+
+        # PositionSettings에서 계산한 줄 수 사용 (동기화)
+        title_forced_lines = layer_pos.get('title_lines', None)
+        title_wrapped_lines = layer_pos.get('title_wrapped_lines') if self.render_mode == self.RENDER_MODE_LAYOUT else None
+
+        self.draw_multiline_text(
+            draw,
+            (title_x, layer_pos['title_y'] - offset_y),
+            layer.title_layer.text,
+            title_font, title_color, title_max_width,
+            False,
+            forced_lines=title_forced_lines,
+            lines=title_wrapped_lines
+        )
+
+        # 내용 레이어 그리기
+        content_info = layer.content_layer.info
+        content_char = layer.content_layer.char
+        content_font = self.get_font(content_char.font_size, content_char.font_weight, 'content')
+        content_color = tuple(content_char.color + [255])
+        content_max_width = int(content_info.width)
+
+        # PositionSettings 사용 시 계산된 X 좌표 적용
+        if use_settings_x and 'content_x' in layer_pos:
+            content_x = int(layer_pos['content_x'])
+        else:
+            content_x = int(content_info.x)
+
+        # PositionSettings에서 계산한 줄 수 사용 (동기화)
+        content_forced_lines = layer_pos.get('content_lines', None)
+        content_wrapped_lines = layer_pos.get('content_wrapped_lines') if self.render_mode == self.RENDER_MODE_LAYOUT else None
+
+        self.draw_multiline_text(
+            draw,
+            (content_x, layer_pos['content_y'] - offset_y),
+            layer.content_layer.text,
+            content_font, content_color, content_max_width,
+            content_char.font_weight == 'bold',
+            forced_lines=content_forced_lines,
+            lines=content_wrapped_lines
+        )
+
+    def draw_layers(self, draw, document, layer_positions, image_width, band_top=0, band_bottom=None):
+        """
+        모든 레이어와 구분선 그리기
+
+        band_bottom이 주어지면 [band_top, band_bottom) 구간과 겹치는 레이어/구분선만
+        밴드 좌표로 옮겨 그립니다. (rewrap 모드는 줄 수가 바뀔 수 있어 모든 레이어를 그림)
+        """
+        with span('draw', band_top=band_top, band_bottom=band_bottom):
+            self._draw_layers(draw, document, layer_positions, image_width, band_top, band_bottom)
+
+    def uses_manual_adjustment(self) -> bool:
+        """수동 위치 조정 사용 여부 (켜져 있으면 레이아웃 계산 결과의 X 좌표로 그림 - 캐시/증분 키에 포함)"""
+        return bool(self.position_settings and self.position_settings.is_manual_adjustment_enabled())
+
+    def _draw_layers(self, draw, document, layer_positions, image_width, band_top, band_bottom):
+        # PositionSettings 사용 시 레이아웃 계산 결과의 X 좌표 사용
+        use_settings_x = self.uses_manual_adjustment()
+        cull_layers = band_bottom is not None and self.render_mode == self.RENDER_MODE_LAYOUT
+        # 밴드 단위 렌더링은 호출한 쪽에서 밴드 단위로 진행률 보고
+        progress = get_progress() if band_bottom is None else None
+
+        layers = document.layers
+        for i, layer in enumerate(layers):
+            layer_pos = layer_positions[layer.key]
+
+            if cull_layers:
+                layer_top, layer_bottom = self.get_layer_extent(layer_pos)
+                visible = layer_bottom > band_top and layer_top < band_bottom
+            else:
+                visible = True
+            if visible:
+                self.draw_layer(draw, layer, layer_pos, use_settings_x, band_top)
+
+            # 구분선 그리기 (마지막 레이어가 아닌 경우)
+            if i < len(layers) - 1:
+                separator_y = self.get_separator_y(layer_pos, layer_positions[layers[i + 1].key])
+                if band_bottom is None or band_top <= separator_y < band_bottom:
+                    # 이미지 전체 너비로 구분선 그리기
+                    draw.line([(0, separator_y - band_top), (image_width, separator_y - band_top)],
+                              fill=(200, 200, 200, 255), width=1)
+            if progress is not None:
+                progress.advance()
+
+    def _build_band_tasks(self, required_height):
+        """청크 구간 목록 [(밴드 시작 y, 밴드 끝 y, 결과 이름), ...] - 분할하지 않으면 전체 이미지 1개"""
+        chunk_height = self.chunk_height if self.split_chunks else required_height
+        tasks = []
+        band_top = 0
+        while band_top < required_height:
+            band_bottom = min(band_top + chunk_height, required_height)
+            if self.split_chunks:
+                result_name = f"{len(tasks) + 1}{self.output_profile.extension}"
+            else:
+                result_name = os.path.basename(self.output_image)
+            tasks.append((band_top, band_bottom, result_name))
+            band_top = band_bottom
+        return tasks
+
+    def render_band(self, document, layer_positions, tiles, required_height, band_top, band_bottom):
+        """결과 이미지의 [band_top, band_bottom) 구간 렌더링 (배경 합성 + 겹치는 레이어 그리기)"""
+        with span('template.compose', band_top=band_top, band_bottom=band_bottom):
+            band = tiles.compose_band(required_height, band_top, band_bottom)
+        self.draw_layers(ImageDraw.Draw(band), document, layer_positions, tiles.width, band_top, band_bottom)
+        return band
+
+    def render_streaming(self, document, layer_positions, tiles, required_height):
+        """
+        청크 단위 스트리밍 렌더링 (전체 높이 캔버스를 만들지 않음)
+
+        청크마다 템플릿 배경을 합성하고 그 구간에 걸친 레이어만 그린 뒤 바로 인코딩합니다.
+        동시에 메모리에 있는 청크는 (인코딩 스레드 수 + 1)개 이하로 유지됩니다.
+        전체 이미지는 저장하지 않습니다.
+        """
+        width = tiles.width
+        logger.info("🌊 스트리밍 렌더링: %sx%spx → %spx 단위",
+                    width, required_height, self.chunk_height if self.split_chunks else required_height)
+
+        tasks = self._build_band_tasks(required_height)
+        progress = get_progress()
+        progress.start('draw', len(tasks))
+        progress.start('encode', len(tasks))
+
+        self.encode_stats = []
+        records = []
+        workers = max(1, min(self.encode_workers, len(tasks)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = []
+            for band_top, band_bottom, result_name in tasks:
+                band = self.render_band(document, layer_positions, tiles, required_height, band_top, band_bottom)
+                pending.append(executor.submit(self.output_sink.write, band, result_name, self.output_profile))
+                del band
+                progress.advance(stage='draw')
+                # 인코딩 대기 중인 청크 수 제한 (메모리 상한)
+                if len(pending) >= workers:
+                    records.append(pending.pop(0).result())
+                    progress.advance(stage='encode')
+            for future in pending:
+                records.append(future.result())
+                progress.advance(stage='encode')
+
+        if logger.isEnabledFor(logging.DEBUG):
+            for number, (band_top, band_bottom, result_name) in enumerate(tasks, 1):
+                logger.debug("청크 %s 저장됨: %s (높이: %spx)", number, result_name, band_bottom - band_top)
+
+        self.encode_stats.extend(records)
+        logger.info("💾 %s", summarize_encode_stats(records))
+        return [record['path'] for record in records]
+
+    def get_render_settings_key(self, tiles, required_height):
+        """증분 렌더링용 설정 지문 (다르면 모든 청크를 다시 그림)"""
+        return fingerprint_settings({
+            'template': fingerprint_template(tiles),
+            'position_settings': self.position_settings.get_all_settings() if self.position_settings else None,
+            'manual_adjustment': self.uses_manual_adjustment(),
+            'render_mode': self.render_mode,
+            'fonts_path': self.fonts_path,
+            'output_profile': self.output_profile.name,
+            'split_chunks': self.split_chunks,
+            'chunk_height': self.chunk_height,
+            'full_image': self._keeps_full_image(tiles.width, required_height)
+        })
+
+    def _keeps_full_image(self, width, required_height):
+        """증분 렌더링에서 청크와 별도로 전체 이미지를 저장하는지 여부"""
+        return self.split_chunks and not self.streaming and self.output_profile.supports_size((width, required_height))
+
+    def render_incremental(self, document, layer_positions, tiles, required_height):
+        """
+        증분 렌더링 (IncrementalRenderState와 비교하여 바뀐 청크만 다시 그림)
+
+        다시 그리지 않은 청크는 보관된 인코딩 결과를 그대로 저장합니다.
+        전체 이미지는 청크를 이어 붙여 만들며, 스트리밍 모드이면 저장하지 않습니다.
+        상태에는 청크별 인코딩 결과만 보관하므로 (밴드 이미지 없음), 전체 이미지를 다시 만들 때
+        다시 그리지 않은 청크는 무손실 형식이면 디코딩하고 그 외 형식은 그 밴드만 다시 그립니다.
+        (rewrap 모드는 그리기 단계에서 줄 수가 바뀔 수 있어 항상 전체를 다시 그림)
+        """
+        state = self.incremental_state
+        if self.render_mode != self.RENDER_MODE_LAYOUT:
+            state.reset()
+
+        width = tiles.width
+        tasks = self._build_band_tasks(required_height)
+        keep_full_image = self._keeps_full_image(width, required_height)
+        if self.split_chunks and not self.streaming and not keep_full_image:
+            logger.warning("⚠️ 전체 이미지가 %s 최대 크기(%spx)를 넘어 청크만 저장합니다",
+                           self.output_profile.label, self.output_profile.max_dimension)
+
+        settings_key = self.get_render_settings_key(tiles, required_height)
+        layer_signatures = state.make_layer_signatures(document, layer_positions, self.get_layer_extent)
+        layers = document.layers
+        separators = {
+            self.get_separator_y(layer_positions[layers[i].key], layer_positions[layers[i + 1].key])
+            for i in range(len(layers) - 1)
+        }
+        dirty = state.find_dirty_chunks(settings_key, layer_signatures, separators, required_height,
+                                        tiles.height, [(top, bottom) for top, bottom, _ in tasks])
+        previous_chunks = state.chunks
+        progress = get_progress()
+        progress.start('draw', len(tasks))
+        progress.start('encode', len(tasks) + (1 if keep_full_image else 0))
+
+        # 전체 이미지를 다시 만들어야 하면 밴드를 그리는 대로 붙여 넣음 (실행이 끝나면 해제)
+        full_canvas = None
+        if keep_full_image and (any(dirty) or state.full_image is None):
+            full_canvas = Image.new('RGBA', (width, required_height))
+
+        try:
+            chunks = []
+            workers = max(1, min(self.encode_workers, len(tasks)))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                pending = []
+                for index, (band_top, band_bottom, result_name) in enumerate(tasks):
+                    if dirty[index]:
+                        band = self.render_band(document, layer_positions, tiles, required_height, band_top, band_bottom)
+                        if full_canvas is not None:
+                            full_canvas.paste(band, (0, band_top))
+                        chunk = {'band_top': band_top, 'band_bottom': band_bottom}
+                        pending.append((chunk, executor.submit(self.output_profile.encode, band)))
+                        del band
+                    else:
+                        previous = previous_chunks[index]
+                        chunk = dict(previous, record=dict(previous['record'], encode_seconds=0.0, reused=True))
+                        if full_canvas is not None:
+                            full_canvas.paste(self._restore_band(previous, document, layer_positions, tiles,
+                                                                 required_height), (0, band_top))
+                        progress.advance(stage='encode')
+                    chunks.append(chunk)
+                    progress.advance(stage='draw')
+                    # 인코딩 대기 중인 청크 수 제한 (메모리 상한)
+                    if len(pending) >= workers:
+                        chunk, future = pending.pop(0)
+                        chunk['data'], chunk['record'] = future.result()
+                        progress.advance(stage='encode')
+                for chunk, future in pending:
+                    chunk['data'], chunk['record'] = future.result()
+                    progress.advance(stage='encode')
+
+            full_image = None
+            if keep_full_image:
+                if full_canvas is not None:
+                    # 청크를 이어 붙인 전체 이미지 (전체 렌더링과 같은 결과)
+                    full_image = self.output_profile.encode(full_canvas)
+                    full_canvas = None
+                else:
+                    data, record = state.full_image
+                    full_image = (data, dict(record, encode_seconds=0.0, reused=True))
+                progress.advance(stage='encode')
+        except Exception:
+            state.reset()
+            raise
+
+        self.encode_stats = []
+        records = []
+        if full_image is not None:
+            records.append(self.output_sink.write_encoded(full_image[0], os.path.basename(self.output_image), full_image[1]))
+        for number, (chunk, (band_top, band_bottom, result_name)) in enumerate(zip(chunks, tasks), 1):
+            records.append(self.output_sink.write_encoded(chunk['data'], result_name, chunk['record']))
+            if self.split_chunks:
+                logger.debug("청크 %s 저장됨: %s (높이: %spx)", number, result_name, band_bottom - band_top)
+
+        redrawn = sum(dirty)
+        state.settings_key = settings_key
+        state.required_height = required_height
+        state.template_height = tiles.height
+        state.layer_signatures = layer_signatures
+        state.separators = separators
+        state.chunks = chunks
+        state.full_image = full_image
+        state.last_stats = {'chunks': len(chunks), 'redrawn': redrawn, 'reused': len(chunks) - redrawn,
+                            'full_redraw': redrawn == len(chunks)}
+        logger.info("♻️ 증분 렌더링: 청크 %s개 중 %s개 다시 그림", len(chunks), redrawn)
+
+        self.encode_stats.extend(records)
+        logger.info("💾 %s", summarize_encode_stats(records))
+        return [record['path'] for record in records]
+
+    def _restore_band(self, chunk, document, layer_positions, tiles, required_height):
+        """보관된 청크의 밴드 이미지 (무손실 형식이면 인코딩 결과 디코딩, 그 외에는 다시 그림)"""
+        if self.output_profile.is_lossless:
+            with Image.open(io.BytesIO(chunk['data'])) as band:
+                return band.convert('RGBA')
+        return self.render_band(document, layer_positions, tiles, required_height,
+                                chunk['band_top'], chunk['band_bottom'])
+
+    def get_render_cache_key(self):
+        """
+        렌더링 캐시 키 (레이어 데이터, 템플릿, 위치 설정, 수동 위치 조정 여부, 출력 형식/옵션, 폰트)
+
+        문서에 포함된 레이아웃을 사용하면 위치는 그 레이아웃을 측정한 폰트 폴더 기준이므로
+        해당 폴더의 폰트로 키를 만듭니다.
+        """
+        fonts_path = self.fonts_path
+        if self.get_carried_positions(self.document) is not None:
+            fonts_path = self.document.layout['fonts_path']
+        font_paths = FontRegistry.resolve_all(fonts_path)
+        options = {
+            'output_profile': self.output_profile.name,
+            'output_name': os.path.basename(self.output_image),
+            'split_chunks': self.split_chunks,
+            'chunk_height': self.chunk_height,
+            'streaming': self.streaming,
+            'render_mode': self.render_mode,
+            'manual_adjustment': self.uses_manual_adjustment(),
+            'fonts': self.render_cache.describe_fonts(font_paths)
+        }
+        settings = self.position_settings.get_all_settings() if self.position_settings else None
+        return self.render_cache.make_key(self.document, self.original_image, settings, options)
 
     def generate_image_from_json(self):
+        """JSON에서 이미지 생성 (렌더링 캐시가 있으면 캐시 확인 후 렌더링)"""
+        with span('render', layers=len(self.document.layers), streaming=self.streaming):
+            return self._generate_image_from_json()
+
+    def _generate_image_from_json(self):
+        if self.render_cache is None or not PIL_AVAILABLE:
+            return self._generate_images()
+
+        cache_key = self.get_render_cache_key()
+        records = self.render_cache.restore(cache_key, self.output_sink)
+        if records is not None:
+            logger.info("⚡ 렌더링 캐시 사용: %s개 파일 (키 %s)", len(records), cache_key[:12])
+            self.encode_stats = records
+            return [record['path'] for record in records]
+
+        # 출력하면서 캐시에도 기록
+        output_sink = self.output_sink
+        cache_writer = self.render_cache.open_entry(cache_key, output_sink)
+        self.output_sink = cache_writer
+        try:
+            result_files = self._generate_images()
+            if result_files:
+                cache_writer.commit(result_files)
+            else:
+                cache_writer.discard()
+        except Exception:
+            cache_writer.discard()
+            raise
+        finally:
+            self.output_sink = output_sink
+        return result_files
+
+    def _generate_images(self):
         """JSON에서 이미지 생성 (수정된 실행 순서)"""
         try:
-            template = self.excel_file_json
+            document = self.document
 
             if not PIL_AVAILABLE:
                 return []
                 
-            original_image = Image.open(self.original_image).convert('RGBA')
-            original_width, original_height = original_image.size
+            # 템플릿 타일 (파일 경로는 TemplateCache에서 디코딩 결과 재사용)
+            with span('template.load'):
+                tiles = self.load_template_tiles()
+            original_height = tiles.height
 
             # 이미지 높이를 전달하여 레이어 위치 계산
-            layer_positions = self.calculate_layer_positions(template, original_height)
+            layer_positions = self.calculate_layer_positions(document, original_height)
 
-            # 계산된 레이어 위치 기반으로 필요 높이 계산 및 이미지 크기 조정
+            # 계산된 레이어 위치 기반으로 필요 높이 계산
             required_height = self.calculate_required_height(layer_positions)
-            data_count = len(layer_positions)  # 데이터 개수 계산
-            image = self.resize_image(original_image, required_height, data_count)
-            final_width, final_height = image.size
-            
-            draw = ImageDraw.Draw(image)
-
-            # 레이어 키를 정렬해서 순서대로 처리
-            layer_keys = sorted(template['layers'].keys(), key=lambda x: int(x.replace('layer', '')))
-
-            # PositionSettings 사용 시 위치 데이터 가져오기
-            positions_data = None
-            if self.position_settings and self.position_settings.is_manual_adjustment_enabled():
-                # DataFrame 생성하여 positions 계산
-                data_rows = []
-                for layer_key in layer_keys:
-                    layer_data = template['layers'][layer_key]
-                    layer_num = int(layer_key.replace('layer', ''))
-                    title = layer_data['title_layer']['text']
-                    content = layer_data['content_layer']['text']
-                    data_rows.append({
-                        '번호': layer_num,
-                        '제목': title,
-                        '설명': content
-                    })
-                df = pd.DataFrame(data_rows)
-                # 이미지 높이 전달
-                positions_data = self.position_settings.calculate_positions(df, image_height=image.size[1])
-
-            for i, layer_key in enumerate(layer_keys):
-                layer_data = template['layers'][layer_key]
-                layer_pos = layer_positions[layer_key]
-                layer_num = int(layer_key.replace('layer', ''))
-                
-
-                # 번호 레이어 그리기
-                number_info = layer_data['number_layer']['info']
-                number_char = layer_data['number_layer']['char']
-                number_font = self.get_font(number_char['font_size'], number_char['font_weight'], 'number')
-                number_color = tuple(number_char['color'] + [255])
-                
-
-                # PositionSettings 사용 시 계산된 X 좌표 적용
-                if positions_data and i < len(positions_data):
-                    number_x = int(positions_data[i]['number']['x'])
-                else:
-                    number_x = int(number_info['x'])
-
-                self.draw_text_bold(
-                    draw,
-                    (int(number_x), layer_pos['number_y']),
-                    layer_data['number_layer']['text'],
-                    number_font, number_color,
-                    False
-                )
-
-                # 제목 레이어 그리기
-                title_info = layer_data['title_layer']['info']
-                title_char = layer_data['title_layer']['char']
-                title_font = self.get_font(title_char['font_size'], title_char['font_weight'], 'title')
-                title_color = tuple(title_char['color'] + [255])
-                title_max_width = int(title_info['width'])
-                
 
-                # PositionSettings 사용 시 계산된 X 좌표 적용
-                if positions_data and i < len(positions_data):
-                    title_x = int(positions_data[i]['title']['x'])
-                else:
-                    title_x = int(title_info['x'])
+            # 증분 모드: 이전 생성과 비교하여 바뀐 청크만 다시 그리기
+            if self.incremental_state is not None:
+                return self.render_incremental(document, layer_positions, tiles, required_height)
 
-                # PositionSettings에서 계산한 줄 수 사용 (동기화)
-                title_forced_lines = layer_pos.get('title_lines', None)
-                
-                self.draw_multiline_text(
-                    draw,
-                    (title_x, layer_pos['title_y']),
-                    layer_data['title_layer']['text'],
-                    title_font, title_color, title_max_width,
-                    False,
-                    forced_lines=title_forced_lines
-                )
-
-                # 내용 레이어 그리기
-                content_info = layer_data['content_layer']['info']
-                content_char = layer_data['content_layer']['char']
-                content_font = self.get_font(content_char['font_size'], content_char['font_weight'], 'content')
-                content_color = tuple(content_char['color'] + [255])
-                content_max_width = int(content_info['width'])
-                
+            # 스트리밍 모드: 청크별로 배경 합성 + 레이어 그리기 + 저장
+            if self.streaming:
+                return self.render_streaming(document, layer_positions, tiles, required_height)
 
-                # PositionSettings 사용 시 계산된 X 좌표 적용
-                if positions_data and i < len(positions_data):
-                    content_x = int(positions_data[i]['content']['x'])
-                else:
-                    content_x = int(content_info['x'])
-
-                # PositionSettings에서 계산한 줄 수 사용 (동기화)
-                content_forced_lines = layer_pos.get('content_lines', None)
-                
-                self.draw_multiline_text(
-                    draw,
-                    (content_x, layer_pos['content_y']),
-                    layer_data['content_layer']['text'],
-                    content_font, content_color, content_max_width,
-                    content_char['font_weight'] == 'bold',
-                    forced_lines=content_forced_lines
-                )
-
-                # 구분선 그리기 (마지막 레이어가 아닌 경우)
-                if i < len(layer_keys) - 1:
-                    next_layer_key = layer_keys[i + 1]
-                    next_layer_pos = layer_positions[next_layer_key]
-                    
-                    # 통일된 구분선 위치: 현재 레이어 박스 끝과 다음 레이어 박스 시작의 정중앙 (정수 연산)
-                    if 'layer_box_end' in layer_pos and 'layer_box_start' in next_layer_pos:
-                        current_end = int(layer_pos['layer_box_end'])
-                        next_start = int(next_layer_pos['layer_box_start'])
-                        # 정확한 중앙점 계산 - 부동소수점 오차 제거
-                        separator_y = int(current_end + (next_start - current_end) // 2)
-                    else:
-                        # Fallback: 레이어 간격의 중앙 (정수 연산)
-                        layer_spacing = self.position_settings.get_setting('layer_spacing') if self.position_settings else 20
-                        separator_y = int(int(layer_pos['base_y']) + int(layer_pos['height']) + layer_spacing // 2)
-
-                    # 이미지 전체 너비로 구분선 그리기
-                    image_width = image.size[0]
-                    draw.line([(0, separator_y), (image_width, separator_y)], fill=(200, 200, 200, 255), width=1)
+            # 이미지 크기 조정
+            data_count = len(layer_positions)  # 데이터 개수 계산
+            image = self.resize_image(tiles, required_height, data_count)
 
-            # 이미지 저장
-            image.save(self.output_image, 'PNG', dpi=(96, 96))
+            draw = ImageDraw.Draw(image)
+            get_progress().start('draw', len(document.layers))
+            self.draw_layers(draw, document, layer_positions, image.size[0])
+
+            # 이미지 저장 - 전체 이미지와 청크를 함께 병렬 인코딩
+            self.encode_stats = []
+            save_tasks = []
+            if self.output_profile.supports_size(image.size) or not self.split_chunks:
+                save_tasks.append((image, os.path.basename(self.output_image), None))  # 원본 이미지
+            else:
+                # 형식 최대 크기를 넘는 전체 이미지는 건너뛰고 청크만 저장 (예: WebP 16383px)
+                logger.warning("⚠️ 전체 이미지가 %s 최대 크기(%spx)를 넘어 청크만 저장합니다",
+                               self.output_profile.label, self.output_profile.max_dimension)
 
             # 청크 분할 저장
-            result_files = [self.output_image]  # 원본 이미지 경로
-
             if self.split_chunks:
-                chunk_files = self.split_and_save_image(image, self.chunk_height)
-                result_files.extend(chunk_files)
+                save_tasks.extend(self._build_chunk_tasks(image, self.chunk_height))
+
+            result_files = self._save_images(save_tasks)
 
             return result_files
         except Exception as e:
@@ -1,9 +1,32 @@
-import gc
-import json
 import io
 import os
 import shutil
-from .excel_to_json import ExelToJson
+import sys
+
+# ExelToJson/NoticeDocument(PIL, openpyxl 사용)는 필요할 때 임포트 - GUI 첫 화면 표시를 늦추지 않도록 함
+
+# 사용자별 캐시 폴더 이름
+APP_CACHE_NAME = 'ImageGenerator'
+
+
+def get_user_cache_dir():
+    """
+    사용자별 캐시 폴더 반환 (프로그램 설치 위치와 무관하게 실행 사이에 유지)
+
+    - Windows: %LOCALAPPDATA%\\ImageGenerator
+    - macOS: ~/Library/Caches/ImageGenerator
+    - 그 외: $XDG_CACHE_HOME/ImageGenerator (기본 ~/.cache/ImageGenerator)
+
+    PyInstaller 실행 파일에서는 assets가 종료 시 삭제되는 임시 폴더(_MEIPASS)에 풀리므로
+    그 아래에 캐시를 두면 매번 비어 있게 됩니다.
+    """
+    if os.name == 'nt':
+        base = os.environ.get('LOCALAPPDATA') or os.path.join(os.path.expanduser('~'), 'AppData', 'Local')
+    elif sys.platform == 'darwin':
+        base = os.path.join(os.path.expanduser('~'), 'Library', 'Caches')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, APP_CACHE_NAME)
 
 
 class LocalFileManager:
@@ -16,44 +39,45 @@ class LocalFileManager:
         self.fonts_path = os.path.join(base_path, 'fonts')
         self.templates_path = os.path.join(base_path, 'templates')
         self.data_path = os.path.join(base_path, 'data')
+        # 렌더링 결과 캐시 폴더 (RenderCache 사용 시 생성 - 사용자별 캐시 폴더)
+        self.cache_path = os.path.join(get_user_cache_dir(), 'renders')
         
         # 필요한 디렉토리 생성
         for path in [self.fonts_path, self.templates_path, self.data_path]:
             os.makedirs(path, exist_ok=True)
 
-    def setup_fonts(self, temp_fonts_path):
-        """폰트 파일을 임시 디렉토리로 복사"""
-        os.makedirs(temp_fonts_path, exist_ok=True)
-        
-        font_files = ['NotoSansCJKkr-Bold.otf', 'NotoSansCJKkr-Regular.otf']
-        
-        for font_file in font_files:
-            src_path = os.path.join(self.fonts_path, font_file)
-            dst_path = os.path.join(temp_fonts_path, font_file)
-            
-            if os.path.exists(src_path):
-                shutil.copy2(src_path, dst_path)
-                print(f"폰트 복사됨: {font_file}")
-            else:
-                print(f"폰트 파일을 찾을 수 없음: {src_path}")
-
-    def process_excel(self, excel_file_path, position_settings, company_name=None):
-        """엑셀 파일 처리 (건설사별 색상 적용)"""
+    def process_excel(self, excel_file_path, position_settings, company_name=None, json_export_path=None):
+        """
+        엑셀 파일 처리 (건설사별 색상 적용)
+
+        Args:
+            json_export_path: 지정하면 생성된 문서를 JSON 파일로도 저장 (선택)
+
+        Returns:
+            NoticeDocument (JsonToImage에 그대로 전달)
+        """
         if not os.path.exists(excel_file_path):
             raise FileNotFoundError(f"엑셀 파일을 찾을 수 없습니다: {excel_file_path}")
 
+        from .excel_to_json import ExelToJson
+
         with open(excel_file_path, 'rb') as f:
             excel_file = io.BytesIO(f.read())
         excel_processor = ExelToJson(excel_file, position_settings, company_name=company_name)
-        excel_file_json = excel_processor.generate_json_from_excel()
+        document = excel_processor.generate_document()
+
+        if json_export_path:
+            document.save_json(json_export_path)
 
-        del excel_file, excel_processor
-        gc.collect()
+        return document
 
-        if isinstance(excel_file_json, str):
-            excel_file_json = json.loads(excel_file_json)
+    def load_document_json(self, json_file_path):
+        """JSON 파일로 저장된 문서 불러오기 (process_excel의 JSON 내보내기와 짝)"""
+        from .notice_document import NoticeDocument
 
-        return excel_file_json
+        if not os.path.exists(json_file_path):
+            raise FileNotFoundError(f"JSON 파일을 찾을 수 없습니다: {json_file_path}")
+        return NoticeDocument.load_json(json_file_path)
 
     def get_template_path(self, construction_name, result_path):
         """템플릿 파일 경로 반환 및 결과 디렉토리로 복사 (.png 및 .jpg 지원)"""
@@ -82,8 +106,13 @@ class LocalFileManager:
         
         return result_template_path
 
-    def get_available_templates(self):
-        """사용 가능한 템플릿 목록 반환 (.png 및 .jpg 지원)"""
+    def get_available_templates(self, warm_cache=False):
+        """
+        사용 가능한 템플릿 목록 반환 (.png 및 .jpg 지원)
+
+        Args:
+            warm_cache: True이면 목록의 템플릿을 TemplateCache에 미리 디코딩
+        """
         if not os.path.exists(self.templates_path):
             return []
         
@@ -99,7 +128,30 @@ class LocalFileManager:
                 templates.append(construction_name)
         
         # 중복 제거 및 정렬
-        return sorted(list(set(templates)))
+        templates = sorted(list(set(templates)))
+
+        if warm_cache:
+            self.warm_template_cache(templates)
+
+        return templates
+
+    def warm_template_cache(self, construction_names):
+        """
+        건설사 템플릿을 TemplateCache에 미리 디코딩
+
+        Returns:
+            적재된 템플릿 수
+        """
+        from .template_cache import TemplateCache
+
+        template_paths = [self.find_template_file_path(name) for name in construction_names]
+        return TemplateCache.warm([path for path in template_paths if path])
+
+    def get_template_tiles(self, template_path):
+        """템플릿 파일의 디코딩된 타일 반환 (경로와 수정 시각 기준으로 캐시)"""
+        from .template_cache import TemplateCache
+
+        return TemplateCache.get(template_path)
     
     def find_template_file_path(self, construction_name):
         """건설사명으로 실제 템플릿 파일 경로 찾기 (복사 없이)"""
@@ -115,6 +167,27 @@ class LocalFileManager:
         
         return None
 
+    @staticmethod
+    def get_output_filename(construction_name, timestamp, result_filename):
+        """
+        결과 파일의 최종 저장 이름 반환
+        
+        Args:
+            construction_name: 건설사명
+            timestamp: 생성 시각 문자열 (예: 20240101_120000)
+            result_filename: JsonToImage가 만든 파일명 ('output.png' 또는 '1.png', '2.png' ...)
+            
+        Returns:
+            '{건설사명}_{타임스탬프}_전체.png' 또는 '{건설사명}_{타임스탬프}_{N}.png'
+            (확장자는 출력 형식에 따라 .jpg, .webp 등으로 유지)
+        """
+        name, extension = os.path.splitext(result_filename)
+        if name == 'output':
+            # 원본 이미지
+            return f'{construction_name}_{timestamp}_전체{extension}'
+        # 청크 파일들 (1.png, 2.png 등)
+        return f'{construction_name}_{timestamp}_{result_filename}'
+
     def validate_files(self):
         """필수 파일들이 존재하는지 확인"""
         missing_files = []
@@ -0,0 +1,190 @@
+"""
+주의사항 문서 모델
+ExelToJson이 만든 레이어/레이아웃 정보를 JSON 문자열 변환 없이 JsonToImage에 전달합니다.
+
+JSON 저장/불러오기는 필요할 때만 사용하는 선택 단계입니다.
+(to_json/from_json 결과는 기존 generate_json_from_excel 출력과 같은 구조)
+"""
+
+import json
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Union
+
+
+@dataclass
+class LayerBox:
+    """레이어 영역 정보 (JSON 'info')"""
+    width: float
+    height: float
+    x: float
+    y: float
+
+    def to_dict(self) -> Dict:
+        return {'width': self.width, 'height': self.height, 'x': self.x, 'y': self.y}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'LayerBox':
+        return cls(data['width'], data['height'], data['x'], data['y'])
+
+
+@dataclass
+class TextStyle:
+    """글자 스타일 정보 (JSON 'char')"""
+    font_size: str
+    font_family: str
+    font_weight: str
+    color: List[int]
+    text_height: str
+    text_width: str
+
+    def to_dict(self) -> Dict:
+        return {
+            'font_size': self.font_size,
+            'font_family': self.font_family,
+            'font_weight': self.font_weight,
+            'color': list(self.color),
+            'text_height': self.text_height,
+            'text_width': self.text_width
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'TextStyle':
+        return cls(data['font_size'], data['font_family'], data['font_weight'],
+                   list(data['color']), data['text_height'], data['text_width'])
+
+
+@dataclass
+class TextLayer:
+    """번호/제목/내용 중 하나의 텍스트 레이어"""
+    info: LayerBox
+    char: TextStyle
+    text: str
+
+    def to_dict(self) -> Dict:
+        return {'info': self.info.to_dict(), 'char': self.char.to_dict(), 'text': self.text}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'TextLayer':
+        return cls(LayerBox.from_dict(data['info']), TextStyle.from_dict(data['char']), data['text'])
+
+
+@dataclass
+class NoticeLayer:
+    """주의사항 항목 하나 (번호 + 제목 + 내용)"""
+    number: int
+    number_layer: TextLayer
+    title_layer: TextLayer
+    content_layer: TextLayer
+
+    @property
+    def key(self) -> str:
+        """JSON 레이어 키 ('layer{번호}')"""
+        return f'layer{self.number}'
+
+    def to_dict(self) -> Dict:
+        return {
+            'number_layer': self.number_layer.to_dict(),
+            'title_layer': self.title_layer.to_dict(),
+            'content_layer': self.content_layer.to_dict()
+        }
+
+    @classmethod
+    def from_dict(cls, number: int, data: Dict) -> 'NoticeLayer':
+        return cls(
+            number,
+            TextLayer.from_dict(data['number_layer']),
+            TextLayer.from_dict(data['title_layer']),
+            TextLayer.from_dict(data['content_layer'])
+        )
+
+
+@dataclass
+class NoticeDocument:
+    """
+    주의사항 이미지 한 장의 문서
+
+    layers는 레이어 번호 순으로 유지되며, layout은 ExelToJson이 계산한
+    레이아웃({'settings': 설정값, 'fonts_path': 측정 폰트 폴더, 'layers': {레이어 키: 위치 정보}})입니다.
+    """
+    layers: List[NoticeLayer] = field(default_factory=list)
+    layout: Optional[Dict] = None
+    template_name: Optional[str] = None
+    logo_image: Optional[str] = None
+    dpi: Optional[int] = None
+
+    def add_layer(self, layer: NoticeLayer):
+        """레이어 추가 (같은 번호가 있으면 교체, 번호 순 정렬 유지)"""
+        self.layers = [existing for existing in self.layers if existing.number != layer.number]
+        self.layers.append(layer)
+        self.layers.sort(key=lambda item: item.number)
+
+    def get_layer(self, layer_key: str) -> NoticeLayer:
+        """레이어 키로 레이어 반환"""
+        for layer in self.layers:
+            if layer.key == layer_key:
+                return layer
+        raise KeyError(layer_key)
+
+    @property
+    def layer_keys(self) -> List[str]:
+        """번호 순 레이어 키 목록"""
+        return [layer.key for layer in self.layers]
+
+    def to_dict(self) -> Dict:
+        """기존 JSON 템플릿 구조로 변환"""
+        template = {
+            'template_name': self.template_name,
+            'logo_image': self.logo_image,
+            'dpi': self.dpi,
+            'layers': {layer.key: layer.to_dict() for layer in self.layers}
+        }
+        if self.layout is not None:
+            template['layout'] = self.layout
+        return template
+
+    @classmethod
+    def from_dict(cls, template: Dict) -> 'NoticeDocument':
+        """JSON 템플릿 구조(dict)에서 문서 생성"""
+        layers = [
+            NoticeLayer.from_dict(int(layer_key.replace('layer', '')), layer_data)
+            for layer_key, layer_data in template.get('layers', {}).items()
+        ]
+        layers.sort(key=lambda item: item.number)
+        return cls(
+            layers=layers,
+            layout=template.get('layout'),
+            template_name=template.get('template_name'),
+            logo_image=template.get('logo_image'),
+            dpi=template.get('dpi')
+        )
+
+    def to_json(self, **kwargs) -> str:
+        """JSON 문자열로 내보내기"""
+        return json.dumps(self.to_dict(), **kwargs)
+
+    @classmethod
+    def from_json(cls, json_text: str) -> 'NoticeDocument':
+        """JSON 문자열에서 불러오기"""
+        return cls.from_dict(json.loads(json_text))
+
+    def save_json(self, file_path: str):
+        """JSON 파일로 내보내기"""
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=4)
+
+    @classmethod
+    def load_json(cls, file_path: str) -> 'NoticeDocument':
+        """JSON 파일에서 불러오기"""
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
+
+    @classmethod
+    def coerce(cls, source: Union['NoticeDocument', Dict, str]) -> 'NoticeDocument':
+        """문서, JSON 템플릿 dict, JSON 문자열을 문서로 변환"""
+        if isinstance(source, cls):
+            return source
+        if isinstance(source, dict):
+            return cls.from_dict(source)
+        if isinstance(source, str):
+            return cls.from_json(source)
+        raise TypeError(f"지원하지 않는 문서 형식입니다: {type(source).__name__}")
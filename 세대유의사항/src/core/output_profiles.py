@@ -0,0 +1,167 @@
+"""
+출력 형식(프로파일) 관리 모듈
+이미지 저장 형식과 압축 옵션을 프로파일 단위로 관리합니다.
+
+각 프로파일은 저장 시 인코딩 시간과 파일 크기를 기록하여
+웹 게시용 용량/속도 비교에 사용할 수 있습니다.
+"""
+
+import io
+import os
+import time
+from typing import Dict, List, Union
+
+from ..utils.tracing import span
+
+# 팔레트 양자화 방식 (2 = FASTOCTREE, Pillow 버전별 상수명 차이 회피)
+_QUANTIZE_FAST_OCTREE = 2
+
+
+class OutputProfile:
+    """이미지 저장 프로파일"""
+
+    def __init__(self, name: str, label: str, image_format: str, extension: str,
+                 save_options: Dict = None, mode: str = None, palette_colors: int = None,
+                 max_dimension: int = None):
+        """
+        Args:
+            name: 프로파일 식별자
+            label: GUI 표시 이름
+            image_format: PIL 저장 형식 ('PNG', 'JPEG', 'WEBP')
+            extension: 파일 확장자 ('.png', '.jpg', '.webp')
+            save_options: PIL save()에 전달할 옵션
+            mode: 저장 전 변환할 색상 모드 (None이면 변환 없음)
+            palette_colors: 팔레트 양자화 색상 수 (None이면 양자화 없음)
+            max_dimension: 형식이 허용하는 최대 가로/세로 픽셀 (None이면 제한 없음)
+        """
+        self.name = name
+        self.label = label
+        self.image_format = image_format
+        self.extension = extension
+        self.save_options = save_options or {}
+        self.mode = mode
+        self.palette_colors = palette_colors
+        self.max_dimension = max_dimension
+
+    def __repr__(self):
+        return f"OutputProfile({self.name!r})"
+
+    def supports_size(self, size) -> bool:
+        """이미지 크기(가로, 세로)를 이 형식으로 저장할 수 있는지 확인"""
+        return self.max_dimension is None or max(size) <= self.max_dimension
+
+    @property
+    def is_lossless(self) -> bool:
+        """인코딩 결과를 디코딩하면 원래 이미지와 픽셀 단위로 같은지 여부 (색상 변환/양자화 없는 PNG)"""
+        return self.image_format == 'PNG' and not self.palette_colors and not self.mode
+
+    def prepare(self, image):
+        """저장 형식에 맞게 이미지 변환 (색상 모드, 팔레트)"""
+        if self.palette_colors:
+            return image.convert('RGB').quantize(colors=self.palette_colors, method=_QUANTIZE_FAST_OCTREE)
+        if self.mode and image.mode != self.mode:
+            return image.convert(self.mode)
+        return image
+
+    def save(self, image, target: Union[str, io.IOBase]) -> Dict:
+        """
+        이미지를 프로파일 설정으로 저장
+
+        Args:
+            image: PIL 이미지
+            target: 저장 경로 또는 파일 객체
+
+        Returns:
+            {'profile', 'path', 'bytes', 'encode_seconds'} 저장 기록
+        """
+        if not self.supports_size(image.size):
+            raise ValueError(f"{self.image_format} 형식은 {self.max_dimension}px 이하 이미지만 저장할 수 있습니다 "
+                             f"(이미지 크기: {image.size[0]}x{image.size[1]}px)")
+
+        with span('encode', profile=self.name, height=image.size[1]):
+            started = time.perf_counter()
+            self.prepare(image).save(target, self.image_format, **self.save_options)
+            encode_seconds = time.perf_counter() - started
+
+        if isinstance(target, str):
+            path = target
+            size = os.path.getsize(target)
+        else:
+            path = getattr(target, 'name', None)
+            try:
+                size = target.tell()
+            except (AttributeError, OSError):
+                # 위치를 알 수 없는 스트림 (예: ZIP 항목 쓰기 스트림)
+                size = None
+
+        return {
+            'profile': self.name,
+            'path': path,
+            'bytes': size,
+            'encode_seconds': encode_seconds
+        }
+
+    def encode(self, image) -> tuple:
+        """
+        이미지를 메모리에서 인코딩
+
+        Returns:
+            (인코딩된 바이트, 저장 기록)
+        """
+        buffer = io.BytesIO()
+        record = self.save(image, buffer)
+        return buffer.getvalue(), record
+
+    def with_extension(self, path: str) -> str:
+        """경로의 확장자를 프로파일 확장자로 변경"""
+        return os.path.splitext(path)[0] + self.extension
+
+
+# 기본 제공 프로파일 (기본값 'default'는 기존 저장 방식과 동일)
+OUTPUT_PROFILES = {
+    profile.name: profile for profile in [
+        OutputProfile('default', 'PNG (기본)', 'PNG', '.png', {'dpi': (96, 96)}),
+        OutputProfile('fast_png', 'PNG (빠른 저장)', 'PNG', '.png', {'dpi': (96, 96), 'compress_level': 1}),
+        OutputProfile('optimized_png', 'PNG (최소 용량)', 'PNG', '.png', {'dpi': (96, 96), 'optimize': True}),
+        OutputProfile('palette_png', 'PNG (256색 팔레트)', 'PNG', '.png', {'dpi': (96, 96), 'optimize': True},
+                      palette_colors=256),
+        OutputProfile('jpeg', 'JPEG (고화질)', 'JPEG', '.jpg', {'dpi': (96, 96), 'quality': 92, 'subsampling': 0},
+                      mode='RGB', max_dimension=65500),  # libjpeg JPEG_MAX_DIMENSION
+        OutputProfile('webp', 'WebP (고화질)', 'WEBP', '.webp', {'quality': 90, 'method': 4}, mode='RGB',
+                      max_dimension=16383),
+    ]
+}
+
+DEFAULT_PROFILE_NAME = 'default'
+
+
+def get_output_profile(profile: Union[str, OutputProfile, None]) -> OutputProfile:
+    """
+    프로파일 이름 또는 객체로 OutputProfile 반환
+
+    Raises:
+        ValueError: 알 수 없는 프로파일 이름
+    """
+    if profile is None:
+        return OUTPUT_PROFILES[DEFAULT_PROFILE_NAME]
+    if isinstance(profile, OutputProfile):
+        return profile
+    if profile not in OUTPUT_PROFILES:
+        raise ValueError(f"지원하지 않는 출력 형식입니다: {profile} (사용 가능: {', '.join(OUTPUT_PROFILES)})")
+    return OUTPUT_PROFILES[profile]
+
+
+def get_profile_names() -> List[str]:
+    """사용 가능한 프로파일 이름 목록"""
+    return list(OUTPUT_PROFILES.keys())
+
+
+def summarize_encode_stats(encode_stats: List[Dict]) -> str:
+    """저장 기록 요약 문자열 (총 용량, 인코딩 시간)"""
+    if not encode_stats:
+        return "저장된 이미지 없음"
+    total_bytes = sum(record['bytes'] or 0 for record in encode_stats)
+    total_seconds = sum(record['encode_seconds'] for record in encode_stats)
+    profile_name = encode_stats[0]['profile']
+    return (f"{profile_name}: {len(encode_stats)}개 파일, "
+            f"{total_bytes / (1024 * 1024):.2f} MB, 인코딩 {total_seconds:.2f}초")
@@ -0,0 +1,197 @@
+"""
+출력 저장 모듈
+JsonToImage가 만든 이미지를 최종 위치에 바로 저장합니다.
+
+- DirectorySink: 출력 폴더에 최종 파일명으로 저장 (임시 이름으로 쓴 뒤 이름 변경 - 중간에 실패해도 깨진 파일이 남지 않음)
+- ZipSink: 모든 이미지를 메모리에서 인코딩하여 ZIP 파일 하나에 기록 (store/deflate 선택)
+
+이미지 이름은 JsonToImage 기준 결과 이름('output.png', '1.png', '2.png' ...)으로 전달되며,
+name_func로 최종 파일명({건설사명}_{타임스탬프}_N.png 등)을 정할 수 있습니다.
+"""
+
+import os
+import threading
+import zipfile
+from typing import Callable, Dict, List, Optional
+
+from ..utils.tracing import span
+
+# ZIP 압축 방식 {이름: (zipfile 상수, 표시 이름)}
+# PNG/JPEG/WebP는 이미 압축된 형식이라 기본값은 'store' (다시 압축해도 크기 차이가 거의 없음)
+ZIP_COMPRESSIONS = {
+    'store': (zipfile.ZIP_STORED, '압축 안 함 (빠름)'),
+    'deflate': (zipfile.ZIP_DEFLATED, '압축 (deflate)'),
+}
+DEFAULT_ZIP_COMPRESSION = 'store'
+
+
+class OutputSink:
+    """출력 저장 기본 클래스"""
+
+    def __init__(self, name_func: Optional[Callable[[str], str]] = None):
+        """
+        Args:
+            name_func: 결과 이름 → 최종 파일명 변환 함수 (None이면 결과 이름 그대로)
+        """
+        self.name_func = name_func
+        self.records: List[Dict] = []
+        self._records_lock = threading.Lock()
+
+    def get_filename(self, result_name: str) -> str:
+        """결과 이름의 최종 파일명"""
+        return self.name_func(result_name) if self.name_func else result_name
+
+    def write(self, image, result_name: str, profile) -> Dict:
+        """
+        이미지 저장
+
+        Args:
+            image: PIL 이미지
+            result_name: 결과 이름 ('output.png', '1.png' ...)
+            profile: OutputProfile
+
+        Returns:
+            저장 기록 {'profile', 'path', 'bytes', 'encode_seconds', 'name'}
+            (ZipSink는 path가 압축 파일 안의 이름이며 'archive'에 ZIP 경로 기록)
+        """
+        raise NotImplementedError
+
+    def write_encoded(self, data: bytes, result_name: str, record: Dict) -> Dict:
+        """
+        이미 인코딩된 이미지 저장 (증분 렌더링에서 다시 그리지 않은 청크 등)
+
+        Args:
+            data: 인코딩된 바이트
+            result_name: 결과 이름
+            record: 인코딩 당시 저장 기록 (복사하여 path/name/bytes 갱신)
+        """
+        raise NotImplementedError
+
+    def close(self):
+        """저장 완료 처리"""
+
+    def discard(self):
+        """저장 취소 처리 (실패 시 미완성 결과 제거)"""
+        self.close()
+
+    def _add_record(self, record: Dict) -> Dict:
+        with self._records_lock:
+            self.records.append(record)
+        return record
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+        return False
+
+
+class DirectorySink(OutputSink):
+    """출력 폴더에 최종 파일명으로 바로 저장 (원자적 쓰기)"""
+
+    # 쓰는 중인 파일의 임시 확장자
+    TEMP_SUFFIX = '.part'
+
+    def __init__(self, output_dir: str, name_func: Optional[Callable[[str], str]] = None):
+        super().__init__(name_func)
+        self.output_dir = output_dir
+        os.makedirs(output_dir, exist_ok=True)
+
+    def write(self, image, result_name: str, profile) -> Dict:
+        filename = self.get_filename(result_name)
+        path = os.path.join(self.output_dir, filename)
+        temp_path = path + self.TEMP_SUFFIX
+        try:
+            # 인코딩 결과를 임시 파일에 바로 기록 (encode 구간에 파일 쓰기 포함)
+            record = profile.save(image, temp_path)
+            with span('write', file=filename):
+                os.replace(temp_path, path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        record.update(path=path, name=filename)
+        return self._add_record(record)
+
+    def write_encoded(self, data: bytes, result_name: str, record: Dict) -> Dict:
+        filename = self.get_filename(result_name)
+        path = os.path.join(self.output_dir, filename)
+        temp_path = path + self.TEMP_SUFFIX
+        try:
+            with span('write', file=filename, bytes=len(data)):
+                with open(temp_path, 'wb') as f:
+                    f.write(data)
+                os.replace(temp_path, path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        record = dict(record, path=path, name=filename, bytes=len(data))
+        return self._add_record(record)
+
+    def discard(self):
+        """이미 저장한 파일도 제거 (취소/실패 시 일부 청크만 남지 않음)"""
+        with self._records_lock:
+            records, self.records = self.records, []
+        for record in records:
+            if os.path.exists(record['path']):
+                os.remove(record['path'])
+
+
+class ZipSink(OutputSink):
+    """
+    모든 이미지를 ZIP 파일 하나에 저장 (이미지 파일을 따로 만들지 않음)
+
+    이미지는 메모리에서 인코딩한 뒤(스레드별 병렬) ZIP 항목으로 기록하며,
+    ZIP은 임시 이름으로 기록하고 close()에서 최종 이름으로 변경합니다.
+    """
+
+    TEMP_SUFFIX = '.part'
+
+    def __init__(self, zip_path: str, name_func: Optional[Callable[[str], str]] = None,
+                 compression: str = DEFAULT_ZIP_COMPRESSION):
+        """
+        Args:
+            zip_path: ZIP 파일 경로
+            name_func: 결과 이름 → ZIP 항목 이름 변환 함수
+            compression: 'store' (압축 안 함) 또는 'deflate' (ZIP_COMPRESSIONS 참고)
+        """
+        super().__init__(name_func)
+        if compression not in ZIP_COMPRESSIONS:
+            raise ValueError(f"지원하지 않는 ZIP 압축 방식입니다: {compression} "
+                             f"(사용 가능: {', '.join(ZIP_COMPRESSIONS)})")
+        self.zip_path = zip_path
+        self.compression = compression
+        self._temp_path = zip_path + self.TEMP_SUFFIX
+        os.makedirs(os.path.dirname(os.path.abspath(zip_path)), exist_ok=True)
+        self._zip_file = zipfile.ZipFile(self._temp_path, 'w', compression=ZIP_COMPRESSIONS[compression][0])
+        # ZIP 항목은 한 번에 하나씩만 기록 가능 (인코딩은 락 밖에서 수행)
+        self._zip_lock = threading.Lock()
+
+    def write(self, image, result_name: str, profile) -> Dict:
+        data, record = profile.encode(image)
+        return self.write_encoded(data, result_name, record)
+
+    def write_encoded(self, data: bytes, result_name: str, record: Dict) -> Dict:
+        filename = self.get_filename(result_name)
+        with span('write', file=filename, bytes=len(data)), self._zip_lock:
+            self._zip_file.writestr(filename, data)
+        # ZIP 항목 기록의 path는 압축 파일 안의 이름
+        record = dict(record, path=filename, name=filename, archive=self.zip_path, bytes=len(data))
+        return self._add_record(record)
+
+    def close(self):
+        if self._zip_file is not None:
+            self._zip_file.close()
+            self._zip_file = None
+            os.replace(self._temp_path, self.zip_path)
+
+    def discard(self):
+        if self._zip_file is not None:
+            self._zip_file.close()
+            self._zip_file = None
+            os.remove(self._temp_path)
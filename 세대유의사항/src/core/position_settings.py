@@ -64,7 +64,10 @@ except ImportError:
     PIL_AVAILABLE = False
     print("⚠️ PIL/Pillow 없음 - fallback 텍스트 계산 사용")
 
+from ..utils.line_estimator import LineEstimator
+from ..utils.progress import get_progress
 from ..utils.text_utils import TextUtils
+from .excel_loader import iter_row_records
 
 
 class PositionSettings:
@@ -131,7 +134,12 @@ class PositionSettings:
 
 
     def calculate_positions(self, valid_data, image_height: Optional[int] = None, template_data: Optional[Dict] = None) -> list:
-        """향상된 위치 계산 메소드 (템플릿 기반)"""
+        """
+        향상된 위치 계산 메소드 (템플릿 기반)
+
+        Args:
+            valid_data: '번호'/'제목'/'설명' 키를 가진 행 목록 (dict 목록, DataFrame 등 반복 가능한 행)
+        """
         # 기존 간단한 계산 방식 (하위 호환성)
         return self._calculate_positions_simple(valid_data, image_height)
 
@@ -150,7 +158,10 @@ class PositionSettings:
 
         current_y = start_y
 
-        for i, (_, row) in enumerate(valid_data.iterrows()):
+        rows = list(iter_row_records(valid_data))
+        progress = get_progress()
+        progress.start('layout', len(rows))
+        for i, row in enumerate(rows):
             layer_num = int(row.get('번호', i + 1))
             
             try:
@@ -172,17 +183,18 @@ class PositionSettings:
 
             
             # 텍스트 라인 수 계산 (실제 폰트 기반, json_to_image와 동일한 폰트 크기)
+            # 측정한 실제 줄 문자열도 함께 보관하여 렌더링 단계에서 다시 줄바꿈하지 않도록 함
             try:
-                title_lines = self.text_utils.calculate_text_lines_accurate(title, self.get_setting('title_width'), 36, 'title', 'bold')
+                title_lines, title_wrapped = self.text_utils.measure_text_lines(title, self.get_setting('title_width'), 36, 'title', 'bold')
             except Exception as e:
                 # 기본값으로 fallback
-                title_lines = 1
+                title_lines, title_wrapped = 1, [title]
             
             try:
-                content_lines = self.text_utils.calculate_text_lines_accurate(content, self.get_setting('content_width'), 28, 'content', 'normal')
+                content_lines, content_wrapped = self.text_utils.measure_text_lines(content, self.get_setting('content_width'), 28, 'content', 'normal')
             except Exception as e:
                 # 기본값으로 fallback
-                content_lines = 1
+                content_lines, content_wrapped = 1, [content]
 
             # 텍스트 높이 계산
             title_height = title_lines * line_height  # 실제 제목 높이
@@ -229,7 +241,8 @@ class PositionSettings:
                     'x': self.get_setting('title_x'),
                     'y': title_y,
                     'lines': title_lines,  # JsonToImage 동기화용 줄 수
-                    'text': title  # JsonToImage 동기화용 텍스트
+                    'text': title,  # JsonToImage 동기화용 텍스트
+                    'wrapped_lines': title_wrapped  # 측정에 사용된 실제 줄 문자열
                 },
                 'content': {
                     'width': self.get_setting('content_width'),
@@ -237,7 +250,8 @@ class PositionSettings:
                     'x': self.get_setting('content_x'),
                     'y': content_y,  # 보정된 Y 좌표 사용
                     'lines': content_lines,  # JsonToImage 동기화용 줄 수
-                    'text': content  # JsonToImage 동기화용 텍스트
+                    'text': content,  # JsonToImage 동기화용 텍스트
+                    'wrapped_lines': content_wrapped  # 측정에 사용된 실제 줄 문자열
                 },
                 # 동적 레이어 박스 정보 (보정된 값 포함)
                 'layer_box': {
@@ -253,7 +267,7 @@ class PositionSettings:
                     'title_content_gap': title_content_spacing,  # 항상 설정값으로 보장
                     'content_area_height': actual_content_height,
                     'is_first_layer': (i == 0),
-                    'is_last_layer': (i == len(valid_data) - 1),
+                    'is_last_layer': (i == len(rows) - 1),
                     'is_dynamic_expanded': True,  # 동적 확장 박스임을 표시
                     'margin_verified': gap_exact and margin_ok  # 보정 후 검증 결과
                 }
@@ -263,9 +277,56 @@ class PositionSettings:
 
             # 다음 레이어 시작점 설정 (보정된 박스 끝 반영)
             current_y = adjusted_layer_end_y
+            progress.advance()
 
         return positions
 
+    def estimate_layout(self, valid_data) -> Dict[str, Any]:
+        """
+        폰트 없이 전체 레이아웃 크기 추정 (사전 배치/이미지 높이 미리 계산용)
+
+        _calculate_positions_simple과 같은 박스 높이 공식을 사용하지만, 줄 수는
+        LineEstimator 단어 폭 표로 열 단위 추정합니다. 글자 폭은 36pt 기준이므로 내용(28pt)
+        줄 수는 실제 폰트 측정보다 크게(보수적으로) 나옵니다.
+
+        Returns:
+            {'layers': [{'number', 'title_lines', 'content_lines', 'start_y', 'end_y'}, ...],
+             'content_bottom': 마지막 레이어 끝 Y, 'required_height': 추정 이미지 높이}
+        """
+        rows = list(iter_row_records(valid_data))
+        titles = [self.text_utils.clean_text_newlines(str(row['제목'])) for row in rows]
+        contents = [self.text_utils.clean_text_newlines(str(row['설명'])) for row in rows]
+        title_line_counts = LineEstimator.count_lines_column(titles, self.get_setting('title_width'))
+        content_line_counts = LineEstimator.count_lines_column(contents, self.get_setting('content_width'))
+
+        layer_spacing = self.get_setting('layer_spacing')
+        line_height = self.get_setting('line_height_multiplier')
+        box_margins = (self.get_setting('layer_top_margin') + self.get_setting('title_content_spacing')
+                       + self.get_setting('layer_bottom_margin'))
+
+        layers = []
+        current_y = self.get_setting('start_y')
+        for i, row in enumerate(rows):
+            if i > 0:
+                current_y += layer_spacing
+            title_lines = max(1, title_line_counts[i]) if titles[i].strip() else 1
+            content_lines = max(1, content_line_counts[i]) if contents[i].strip() else 1
+            start_y = int(current_y)
+            end_y = int(start_y + int(box_margins + (title_lines + content_lines) * line_height))
+            layers.append({
+                'number': int(row.get('번호', i + 1)),
+                'title_lines': title_lines,
+                'content_lines': content_lines,
+                'start_y': start_y,
+                'end_y': end_y
+            })
+            current_y = end_y
+
+        # JsonToImage.calculate_required_height와 같은 공식 (헤더 422px, 하단 여백 10px, 푸터 114px)
+        content_bottom = layers[-1]['end_y'] if layers else 0
+        required_height = max(422, content_bottom) + 10 + 114 if layers else 1500
+        return {'layers': layers, 'content_bottom': content_bottom, 'required_height': required_height}
+
 
     def save_to_file(self, file_path: str):
         """설정을 JSON 파일로 저장"""
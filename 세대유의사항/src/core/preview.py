@@ -0,0 +1,283 @@
+"""
+미리보기 렌더링 모듈
+엑셀/템플릿/위치 설정이 바뀔 때 GUI에 표시할 축소 이미지를 빠르게 만듭니다.
+
+- PreviewRenderer: 전체 크기로 그린 뒤 줄이지 않고, 좌표와 폰트 크기를 배율만큼 줄여 바로 그림
+  레이어 배치와 그리기 순서는 JsonToImage와 같은 코드를 사용
+- 글자 래스터화 비용은 크기보다 글자 수에 비례하므로 (폰트에 따라 글자당 수십 µs~0.1ms),
+  축소 폰트의 글자 마스크를 한 번만 만들어 두고 붙여 넣어 줄을 그림 (커닝 생략 - 미리보기 전용)
+- LayoutCache: 엑셀 파일(수정 시각/크기), 건설사, 위치 설정별로 계산된 문서(레이아웃 포함)를 보관
+  미리보기에서 계산한 레이아웃을 이미지 생성에서 그대로 사용 (엑셀 읽기/레이아웃 계산 생략)
+
+렌더링 중 취소는 progress 모듈의 ProgressReporter로 처리합니다 (레이아웃 행/레이어마다 확인).
+"""
+
+import os
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+# PIL 선택적 임포트 - 없으면 미리보기 사용 불가
+try:
+    from PIL import Image, ImageDraw
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+from ..utils.progress import get_progress
+from ..utils.text_utils import FontCache
+from .json_to_image import JsonToImage
+from .notice_document import NoticeDocument
+from .output_sink import OutputSink
+
+# 미리보기 가로 크기 (px) - 템플릿 너비 대비 배율 결정
+PREVIEW_WIDTH = 300
+# 미리보기 최대 세로 크기 (px) - 넘으면 앞부분 레이어만 표시
+PREVIEW_MAX_HEIGHT = 8000
+# 폰트별 최대 보관 글자 마스크 수 (넘으면 비우고 다시 만듦)
+MAX_GLYPHS_PER_FONT = 4000
+
+
+class _GlyphCache:
+    """
+    축소 폰트별 글자 마스크 캐시 (프로세스 전역, 미리보기 사이에 유지)
+
+    글자마다 (마스크, 오프셋, 진행 폭)을 보관합니다. 폰트 객체가 사라지면 함께 제거됩니다.
+    """
+
+    _glyphs = weakref.WeakKeyDictionary()
+    _lock = threading.Lock()
+
+    @classmethod
+    def get(cls, font, char: str):
+        """글자 마스크 (마스크, (x, y) 오프셋, 진행 폭) - 오프셋은 draw.text 기본 기준점(왼쪽 위) 기준"""
+        with cls._lock:
+            glyphs = cls._glyphs.get(font)
+            if glyphs is None or len(glyphs) > MAX_GLYPHS_PER_FONT:
+                glyphs = cls._glyphs[font] = {}
+            glyph = glyphs.get(char)
+        if glyph is None:
+            mask, offset = font.getmask2(char, mode='L')
+            glyph = (mask, offset, font.getlength(char))
+            with cls._lock:
+                glyphs[char] = glyph
+        return glyph
+
+
+class _ScaledDraw:
+    """
+    ImageDraw 래퍼 - 좌표와 폰트 크기를 배율만큼 줄여 그림
+
+    JsonToImage의 그리기 코드(draw.text, draw.line)를 그대로 사용하기 위한 것으로,
+    그 외 속성(측정 함수 등)은 원래 크기 기준으로 원본 ImageDraw에 위임합니다.
+    """
+
+    # 파일이 아닌 폰트의 축소 폰트 ((폰트 이름, 스타일), 축소 크기) → 폰트
+    # (ImageFont.load_default()는 호출마다 새 객체를 만들므로 이름으로 공유 - 글자 마스크 캐시도 공유됨)
+    _variant_fonts = {}
+
+    def __init__(self, image, scale: float):
+        self.image = image
+        self.draw = ImageDraw.Draw(image)
+        self.scale = scale
+        # (폰트 경로 또는 이름, 원래 크기) → 축소 폰트
+        self._fonts = {}
+
+    def _scaled_font(self, font):
+        """
+        배율만큼 줄인 폰트
+
+        폰트 파일 경로가 있으면 FontCache에서, 파일이 아닌 폰트(폰트 파일이 없을 때의
+        ImageFont.load_default() 등)는 font_variant로 만들고, 크기를 바꿀 수 없는 비트맵 폰트는 그대로 사용합니다.
+        """
+        size = getattr(font, 'size', None)
+        if size is None or not hasattr(font, 'font_variant'):
+            return font
+        path = getattr(font, 'path', None)
+        key = (path if isinstance(path, str) else font.getname(), size)
+        scaled = self._fonts.get(key)
+        if scaled is None:
+            scaled_size = max(1, round(size * self.scale))
+            if isinstance(path, str):
+                scaled = FontCache.get(path, scaled_size)
+            else:
+                variant_key = (key[0], scaled_size)
+                scaled = self._variant_fonts.get(variant_key)
+                if scaled is None:
+                    scaled = self._variant_fonts[variant_key] = font.font_variant(size=scaled_size)
+            self._fonts[key] = scaled
+        return scaled
+
+    def text(self, xy, text, font=None, fill=None, **kwargs):
+        x, y = xy
+        scaled_font = self._scaled_font(font)
+        if kwargs or not hasattr(scaled_font, 'getlength'):
+            self.draw.text((x * self.scale, y * self.scale), text, font=scaled_font, fill=fill, **kwargs)
+            return
+
+        # 글자 마스크를 찍어 그림 (같은 글자는 한 번만 래스터화, 합성은 ImageDraw.text와 같은 draw_bitmap)
+        ink = self.draw._getink(tuple(fill) if isinstance(fill, list) else fill)[0]
+        pen_x = x * self.scale
+        top = round(y * self.scale)
+        for char in text:
+            mask, (offset_x, offset_y), advance = _GlyphCache.get(scaled_font, char)
+            if mask.size[0] and mask.size[1]:
+                self.draw.draw.draw_bitmap((round(pen_x) + offset_x, top + offset_y), mask, ink)
+            pen_x += advance
+
+    def line(self, xy, fill=None, width=1, **kwargs):
+        points = [(x * self.scale, y * self.scale) for x, y in xy]
+        self.draw.line(points, fill=fill, width=max(1, round(width * self.scale)), **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self.draw, name)
+
+
+class PreviewRenderer:
+    """축소 배율로 미리보기 이미지 렌더링 (파일 저장 없음)"""
+
+    def __init__(self, position_settings, fonts_path: Optional[str] = None, width: int = PREVIEW_WIDTH,
+                 max_height: int = PREVIEW_MAX_HEIGHT):
+        """
+        Args:
+            position_settings: 위치 설정 (이미지 생성과 같은 인스턴스 - 레이아웃 재사용 조건)
+            fonts_path: 폰트 폴더 (None이면 기본 assets/fonts)
+            width: 미리보기 가로 크기 (px)
+            max_height: 미리보기 최대 세로 크기 (px)
+        """
+        self.position_settings = position_settings
+        self.fonts_path = fonts_path
+        self.width = width
+        self.max_height = max_height
+
+    def compose_background(self, tiles, required_height: int, source_height: int, scale: float):
+        """템플릿 배경을 축소하여 구성 (결과 이미지의 [0, source_height) 구간)"""
+        size = (max(1, round(tiles.width * scale)), max(1, round(source_height * scale)))
+        background = Image.new('RGBA', size, (255, 255, 255, 255))
+        for dst_top, dst_bottom, tile, tile_top in tiles.get_segments(required_height):
+            bottom = min(dst_bottom, source_height)
+            if dst_top >= bottom:
+                continue
+            top_px = round(dst_top * scale)
+            height_px = round(bottom * scale) - top_px
+            if height_px <= 0:
+                continue
+            part = tile.crop((0, tile_top, tiles.width, tile_top + bottom - dst_top))
+            background.paste(part.resize((size[0], height_px), Image.BILINEAR), (0, top_px))
+        return background
+
+    def render(self, document, template_source) -> Dict:
+        """
+        미리보기 렌더링
+
+        Args:
+            document: NoticeDocument (레이아웃 포함)
+            template_source: 템플릿 파일 경로, PIL 이미지 또는 TemplateTiles
+
+        Returns:
+            {'image', 'scale', 'required_height', 'layers', 'shown_layers', 'truncated', 'seconds'}
+
+        Raises:
+            OperationCancelled: 현재 스레드의 진행률 보고 대상에 취소 요청이 있는 경우
+        """
+        if not PIL_AVAILABLE:
+            raise RuntimeError("미리보기에는 PIL/Pillow가 필요합니다")
+
+        started = time.perf_counter()
+        document = NoticeDocument.coerce(document)
+        # 레이어 위치 계산/그리기는 JsonToImage와 같은 코드 사용 (저장하지 않으므로 빈 출력 위치)
+        image_generator = JsonToImage(
+            document,
+            'preview.png',
+            template_source,
+            split_chunks=False,
+            chunk_height=0,
+            fonts_path=self.fonts_path,
+            position_settings=self.position_settings,
+            output_sink=OutputSink()
+        )
+        tiles = image_generator.load_template_tiles()
+        layer_positions = image_generator.calculate_layer_positions(document, tiles.height)
+        required_height = image_generator.calculate_required_height(layer_positions)
+
+        scale = self.width / tiles.width
+        source_height = required_height
+        layers = document.layers
+        if required_height * scale > self.max_height:
+            # 앞부분만 표시 (시작 위치가 표시 범위 안인 레이어)
+            source_height = int(self.max_height / scale)
+            layers = [layer for layer in layers if layer_positions[layer.key]['base_y'] < source_height]
+
+        image = self.compose_background(tiles, required_height, source_height, scale)
+        preview_document = document if len(layers) == len(document.layers) else NoticeDocument(layers, document.layout)
+        get_progress().start('draw', len(layers))
+        image_generator.draw_layers(_ScaledDraw(image, scale), preview_document,
+                                    layer_positions, tiles.width)
+
+        return {
+            'image': image,
+            'scale': scale,
+            'required_height': required_height,
+            'layers': len(document.layers),
+            'shown_layers': len(layers),
+            'truncated': source_height < required_height,
+            'seconds': time.perf_counter() - started
+        }
+
+
+class LayoutCache:
+    """
+    계산된 문서(레이아웃 포함) 캐시
+
+    (엑셀 실제 경로, 수정 시각, 크기, 건설사, 위치 설정, 폰트 폴더)가 같으면 엑셀을 다시 읽지 않고
+    보관된 문서를 반환합니다. 엑셀을 저장하거나 설정을 바꾸면 키가 달라져 다시 계산합니다.
+    """
+
+    # 최대 보관 문서 수 (초과 시 가장 오래 사용하지 않은 문서부터 제거)
+    MAX_ENTRIES = 4
+
+    def __init__(self, file_manager):
+        self.file_manager = file_manager
+        self._documents = OrderedDict()
+        # 보관 목록만 보호 - 계산(폰트 측정)은 호출하는 쪽에서 그리기와 함께 직렬화 (ImageGeneratorGUI.render_lock)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(excel_path: str, position_settings, company_name: Optional[str] = None) -> Tuple:
+        """캐시 키 (파일이 없으면 OSError)"""
+        stat = os.stat(excel_path)
+        settings = tuple(sorted(position_settings.get_all_settings().items()))
+        return (os.path.realpath(excel_path), stat.st_mtime_ns, stat.st_size, company_name or None,
+                settings, position_settings.fonts_path)
+
+    def get_document(self, excel_path: str, position_settings, company_name: Optional[str] = None):
+        """
+        문서 반환 (없으면 LocalFileManager.process_excel로 계산 후 보관)
+
+        Returns:
+            (NoticeDocument, 캐시 사용 여부)
+        """
+        key = self.make_key(excel_path, position_settings, company_name)
+        with self._lock:
+            document = self._documents.get(key)
+            if document is not None:
+                self._documents.move_to_end(key)
+                self.hits += 1
+                return document, True
+
+        document = self.file_manager.process_excel(excel_path, position_settings, company_name)
+        with self._lock:
+            self.misses += 1
+            self._documents[key] = document
+            while len(self._documents) > self.MAX_ENTRIES:
+                self._documents.popitem(last=False)
+        return document, False
+
+    def clear(self):
+        """캐시 비우기"""
+        with self._lock:
+            self._documents.clear()
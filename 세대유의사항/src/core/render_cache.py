@@ -0,0 +1,303 @@
+"""
+렌더링 결과 디스크 캐시 모듈
+같은 입력(레이어 데이터, 템플릿, 위치 설정, 출력 형식)으로 다시 생성하면
+렌더링 없이 저장해 둔 이미지를 그대로 출력합니다.
+
+캐시 키는 다음 값의 SHA-256 해시입니다.
+- 정규화된 레이어 데이터 (NoticeDocument.to_dict()['layers'] - 텍스트, 색상, 폰트, 박스)
+- 템플릿 파일 내용 (파일 바이트 해시, 메모리 이미지는 픽셀 해시)
+- 위치 설정 스냅샷 (PositionSettings.get_all_settings())
+- 출력 형식 프로파일과 렌더링 옵션 (청크 높이, 분할 여부, 스트리밍 등)
+- 사용 폰트 파일 (경로, 크기, 수정 시각)
+
+항목은 '{캐시 폴더}/{키}/' 아래 결과 이름 그대로 저장되며, 전체 크기가 max_bytes를
+넘으면 가장 오래 사용하지 않은 항목부터 삭제합니다 (manifest.json 수정 시각 기준).
+기록 중인 임시 폴더('.{키}.*.tmp')도 크기에 포함하며, 강제 종료 등으로 남은 임시 폴더는
+TEMP_GRACE_SECONDS가 지나면 삭제합니다.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+import uuid
+from typing import Dict, List, Optional
+
+from .output_sink import OutputSink
+
+# 캐시 형식 버전 (저장 구조나 렌더링 결과가 바뀌면 올려서 이전 항목 무시)
+CACHE_VERSION = 1
+
+MANIFEST_NAME = 'manifest.json'
+
+# 기록 중인 항목의 임시 폴더 이름 ('.{키}.{PID}.{임의값}.tmp')
+TEMP_PREFIX = '.'
+TEMP_SUFFIX = '.tmp'
+# 마지막 기록 후 이 시간(초)이 지난 임시 폴더는 중단된 기록으로 보고 삭제
+TEMP_GRACE_SECONDS = 60 * 60
+
+
+def hash_file(path: str) -> str:
+    """파일 내용 SHA-256 해시"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class RenderCache:
+    """작업 단위 렌더링 결과 디스크 캐시 (크기 제한 LRU)"""
+
+    # 기본 최대 크기
+    MAX_BYTES = 512 * 1024 * 1024
+
+    # 템플릿 파일 해시 (실제 경로, 수정 시각, 크기) → 해시 - 프로세스 전역
+    _file_hashes = {}
+    _file_hashes_lock = threading.Lock()
+
+    def __init__(self, cache_dir: str, max_bytes: Optional[int] = None):
+        """
+        Args:
+            cache_dir: 캐시 폴더
+            max_bytes: 최대 크기 (None이면 MAX_BYTES)
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = self.MAX_BYTES if max_bytes is None else max_bytes
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(cache_dir, exist_ok=True)
+        # 이전 실행이 중단되어 남긴 임시 폴더 정리 (저장이 한 번도 성공하지 않아도 쌓이지 않도록)
+        self.get_temp_dirs()
+
+    @classmethod
+    def hash_template_file(cls, path: str) -> str:
+        """템플릿 파일 내용 해시 (파일이 바뀌지 않았으면 다시 읽지 않음)"""
+        real_path = os.path.realpath(path)
+        stat = os.stat(real_path)
+        key = (real_path, stat.st_mtime_ns, stat.st_size)
+        with cls._file_hashes_lock:
+            digest = cls._file_hashes.get(key)
+        if digest is None:
+            digest = hash_file(real_path)
+            with cls._file_hashes_lock:
+                cls._file_hashes[key] = digest
+        return digest
+
+    @classmethod
+    def hash_template(cls, template_source) -> str:
+        """템플릿 해시 (파일 경로, TemplateTiles, PIL 이미지 지원)"""
+        if isinstance(template_source, str):
+            return cls.hash_template_file(template_source)
+        if getattr(template_source, 'path', None):
+            return cls.hash_template_file(template_source.path)
+        if hasattr(template_source, 'header'):
+            from .incremental_render import fingerprint_template
+            return fingerprint_template(template_source)[0]
+        digest = hashlib.sha256()
+        digest.update(f'{template_source.mode}:{template_source.size}'.encode('utf-8'))
+        digest.update(template_source.tobytes())
+        return digest.hexdigest()
+
+    @staticmethod
+    def describe_fonts(font_paths: List[str]) -> List:
+        """폰트 파일 식별 정보 [(경로, 크기, 수정 시각), ...]"""
+        fonts = []
+        for path in font_paths:
+            stat = os.stat(path)
+            fonts.append([path, stat.st_size, stat.st_mtime_ns])
+        return fonts
+
+    def make_key(self, document, template_source, settings: Optional[Dict], options: Dict) -> str:
+        """
+        캐시 키 생성
+
+        Args:
+            document: NoticeDocument
+            template_source: 템플릿 (파일 경로, TemplateTiles, PIL 이미지)
+            settings: PositionSettings.get_all_settings() 결과
+            options: 출력 형식/렌더링 옵션/폰트 정보
+        """
+        payload = json.dumps({
+            'version': CACHE_VERSION,
+            'layers': document.to_dict()['layers'],
+            'template': self.hash_template(template_source),
+            'settings': settings,
+            'options': options
+        }, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key)
+
+    def restore(self, key: str, output_sink: OutputSink) -> Optional[List[Dict]]:
+        """
+        캐시된 결과를 출력 위치에 저장
+
+        Returns:
+            저장 기록 목록 (결과 순서) - 캐시에 없거나 읽을 수 없으면 None
+        """
+        entry_path = self._entry_path(key)
+        manifest_path = os.path.join(entry_path, MANIFEST_NAME)
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            # 출력 전에 모두 읽어 둠 (읽는 중 삭제되면 캐시 없음으로 처리)
+            outputs = []
+            for item in manifest['outputs']:
+                with open(os.path.join(entry_path, item['result_name']), 'rb') as f:
+                    outputs.append((item, f.read()))
+            # LRU 순서 갱신
+            os.utime(manifest_path)
+        except (OSError, ValueError, KeyError):
+            self.misses += 1
+            return None
+
+        records = []
+        for item, data in outputs:
+            record = dict(item['record'], encode_seconds=0.0, cached=True)
+            records.append(output_sink.write_encoded(data, item['result_name'], record))
+        self.hits += 1
+        return records
+
+    def open_entry(self, key: str, output_sink: OutputSink) -> 'RenderCacheWriter':
+        """렌더링 결과를 출력하면서 캐시에도 기록하는 저장 위치 반환"""
+        return RenderCacheWriter(self, key, output_sink)
+
+    def _commit_entry(self, key: str, temp_path: str, manifest: Dict):
+        """임시 폴더에 기록한 항목을 캐시에 등록"""
+        with open(os.path.join(temp_path, MANIFEST_NAME), 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False)
+        entry_path = self._entry_path(key)
+        try:
+            os.rename(temp_path, entry_path)
+        except OSError:
+            # 다른 프로세스가 먼저 같은 항목을 저장함
+            shutil.rmtree(temp_path, ignore_errors=True)
+        self.evict()
+
+    def get_entries(self) -> List[Dict]:
+        """캐시 항목 목록 [{'key', 'bytes', 'last_used'}, ...] (오래 사용하지 않은 순)"""
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            manifest_path = os.path.join(self.cache_dir, name, MANIFEST_NAME)
+            try:
+                last_used = os.stat(manifest_path).st_mtime
+                with open(manifest_path, 'r', encoding='utf-8') as f:
+                    size = json.load(f)['bytes']
+            except (OSError, ValueError, KeyError):
+                continue
+            entries.append({'key': name, 'bytes': size, 'last_used': last_used})
+        entries.sort(key=lambda entry: entry['last_used'])
+        return entries
+
+    def get_temp_dirs(self, grace_seconds: float = TEMP_GRACE_SECONDS) -> List[Dict]:
+        """
+        기록 중인 임시 폴더 목록 [{'path', 'bytes'}, ...]
+
+        마지막 기록 후 grace_seconds가 지난 임시 폴더(강제 종료/비정상 종료로 남은 기록)는 삭제하고 제외합니다.
+        """
+        temp_dirs = []
+        now = time.time()
+        for name in os.listdir(self.cache_dir):
+            if not (name.startswith(TEMP_PREFIX) and name.endswith(TEMP_SUFFIX)):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stats = [os.stat(path)] + [entry.stat() for entry in os.scandir(path) if entry.is_file()]
+            except OSError:
+                # 그 사이 등록되었거나 삭제됨
+                continue
+            if now - max(stat.st_mtime for stat in stats) > grace_seconds:
+                shutil.rmtree(path, ignore_errors=True)
+                continue
+            temp_dirs.append({'path': path, 'bytes': sum(stat.st_size for stat in stats[1:])})
+        return temp_dirs
+
+    def evict(self) -> int:
+        """
+        최대 크기를 넘으면 오래 사용하지 않은 항목부터 삭제 (기록 중인 임시 폴더 크기 포함)
+
+        Returns:
+            삭제한 항목 수
+        """
+        entries = self.get_entries()
+        total = sum(entry['bytes'] for entry in entries)
+        total += sum(temp_dir['bytes'] for temp_dir in self.get_temp_dirs())
+        removed = 0
+        for entry in entries:
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(self._entry_path(entry['key']), ignore_errors=True)
+            total -= entry['bytes']
+            removed += 1
+        return removed
+
+    def clear(self):
+        """모든 캐시 항목 삭제"""
+        for entry in self.get_entries():
+            shutil.rmtree(self._entry_path(entry['key']), ignore_errors=True)
+
+    def get_stats(self) -> Dict:
+        """캐시 통계 반환 (bytes는 기록 중인 임시 폴더 포함)"""
+        entries = self.get_entries()
+        temp_dirs = self.get_temp_dirs()
+        return {
+            'entries': len(entries),
+            'bytes': sum(entry['bytes'] for entry in entries) + sum(temp_dir['bytes'] for temp_dir in temp_dirs),
+            'temp_dirs': len(temp_dirs),
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses
+        }
+
+
+class RenderCacheWriter(OutputSink):
+    """
+    출력 위치에 저장하면서 같은 바이트를 캐시 임시 폴더에도 기록하는 저장 위치
+
+    렌더링이 끝나면 commit()으로 캐시에 등록하고, 실패하면 discard()로 임시 폴더를 지웁니다.
+    (close()는 감싼 출력 위치를 닫지 않음 - 출력 위치는 호출한 쪽에서 관리)
+    """
+
+    def __init__(self, cache: RenderCache, key: str, output_sink: OutputSink):
+        super().__init__()
+        self.cache = cache
+        self.key = key
+        self.output_sink = output_sink
+        self._temp_path = os.path.join(cache.cache_dir, f'{TEMP_PREFIX}{key}.{os.getpid()}.{uuid.uuid4().hex}{TEMP_SUFFIX}')
+        os.makedirs(self._temp_path)
+        # 출력 기록 path → (결과 이름, 저장 기록)
+        self._outputs = {}
+
+    def write(self, image, result_name: str, profile) -> Dict:
+        data, record = profile.encode(image)
+        return self.write_encoded(data, result_name, record)
+
+    def write_encoded(self, data: bytes, result_name: str, record: Dict) -> Dict:
+        with open(os.path.join(self._temp_path, result_name), 'wb') as f:
+            f.write(data)
+        output_record = self.output_sink.write_encoded(data, result_name, record)
+        with self._records_lock:
+            self._outputs[output_record['path']] = (result_name, dict(record, bytes=len(data)))
+        return self._add_record(output_record)
+
+    def commit(self, result_paths: List[str]):
+        """결과 순서(result_paths)대로 캐시 항목 등록"""
+        outputs = []
+        for path in result_paths:
+            result_name, record = self._outputs[path]
+            record = {key: value for key, value in record.items() if key not in ('path', 'name', 'archive')}
+            outputs.append({'result_name': result_name, 'record': record})
+        manifest = {
+            'version': CACHE_VERSION,
+            'created': time.time(),
+            'bytes': sum(item['record']['bytes'] for item in outputs),
+            'outputs': outputs
+        }
+        self.cache._commit_entry(self.key, self._temp_path, manifest)
+
+    def discard(self):
+        shutil.rmtree(self._temp_path, ignore_errors=True)
@@ -0,0 +1,190 @@
+"""
+템플릿 이미지 캐시 모듈
+템플릿 JPEG/PNG를 한 번만 디코딩하여 헤더/본문/푸터 타일로 보관합니다.
+
+결과 이미지는 타일을 붙여 만들며, 배치는 기존 resize_image(_crop_image/_extend_image)와 같습니다.
+- 헤더: 원본 0~422px (항상 같은 위치)
+- 본문: 원본 422px ~ (높이 - 114px) - 결과가 원본보다 짧을 때 헤더 아래에 이어 붙임
+- 푸터: 원본 마지막 114px - 결과 이미지 맨 아래에 배치
+"""
+
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+from ..utils.tracing import span
+
+logger = logging.getLogger(__name__)
+
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+# 템플릿 고정 영역 높이 (px)
+HEADER_HEIGHT = 422
+FOOTER_HEIGHT = 114
+
+
+class TemplateTiles:
+    """디코딩된 템플릿 타일 (헤더, 본문, 푸터)"""
+
+    def __init__(self, image, path: Optional[str] = None, mtime_ns: Optional[int] = None):
+        """
+        Args:
+            image: 템플릿 PIL 이미지 (RGBA로 변환하여 타일 생성)
+            path: 템플릿 파일 경로 (캐시 키 / 로그용)
+            mtime_ns: 파일 수정 시각 (캐시 키)
+        """
+        image = image.convert('RGBA') if image.mode != 'RGBA' else image
+        self.path = path
+        self.mtime_ns = mtime_ns
+        self.width, self.height = image.size
+
+        self.header = image.crop((0, 0, self.width, min(HEADER_HEIGHT, self.height)))
+        body_end = self.height - FOOTER_HEIGHT
+        self.body = image.crop((0, HEADER_HEIGHT, self.width, body_end)) if body_end > HEADER_HEIGHT else None
+        self.footer = image.crop((0, max(0, self.height - FOOTER_HEIGHT), self.width, self.height))
+
+    @classmethod
+    def from_file(cls, path: str) -> 'TemplateTiles':
+        """템플릿 파일 디코딩"""
+        mtime_ns = os.stat(path).st_mtime_ns
+        with Image.open(path) as image:
+            return cls(image, path, mtime_ns)
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        """원본 템플릿 크기 (가로, 세로)"""
+        return self.width, self.height
+
+    @property
+    def nbytes(self) -> int:
+        """타일 메모리 사용량 (바이트, RGBA 기준)"""
+        tiles = [self.header, self.body, self.footer]
+        return sum(tile.size[0] * tile.size[1] * 4 for tile in tiles if tile is not None)
+
+    def get_segments(self, required_height: int) -> List[Tuple[int, int, object, int]]:
+        """
+        결과 이미지 배경 구성 [(결과 시작 y, 결과 끝 y, 타일, 타일 시작 y), ...] - 순서대로 붙여넣음
+        """
+        segments = [(0, min(HEADER_HEIGHT, self.height, required_height), self.header, 0)]
+        content_end = required_height - FOOTER_HEIGHT
+        if self.body is not None and content_end > HEADER_HEIGHT:
+            if required_height <= self.height:
+                # 원본 높이 이하: 원본 본문을 헤더 바로 다음부터 사용 (중간 여백 제거)
+                segments.append((HEADER_HEIGHT, content_end, self.body, 0))
+            # 원본보다 긴 경우 본문 영역은 흰색 배경
+        footer_top = required_height - self.footer.size[1]
+        segments.append((footer_top, required_height, self.footer, 0))
+        return segments
+
+    def compose_band(self, required_height: int, band_top: int, band_bottom: int):
+        """결과 이미지의 [band_top, band_bottom) 구간 배경 생성"""
+        band = Image.new('RGBA', (self.width, band_bottom - band_top), (255, 255, 255, 255))
+        for dst_top, dst_bottom, tile, tile_top in self.get_segments(required_height):
+            top = max(dst_top, band_top)
+            bottom = min(dst_bottom, band_bottom)
+            if top >= bottom:
+                continue
+            source_top = tile_top + top - dst_top
+            band.paste(tile.crop((0, source_top, self.width, source_top + bottom - top)), (0, top - band_top))
+        return band
+
+    def compose(self, required_height: int):
+        """결과 이미지 전체 배경 생성"""
+        return self.compose_band(required_height, 0, required_height)
+
+
+class TemplateCache:
+    """
+    프로세스 전역 템플릿 캐시
+
+    (실제 경로, 수정 시각) 단위로 디코딩된 타일을 보관합니다. 파일이 바뀌면
+    수정 시각이 달라져 다시 디코딩하며, 전체 크기가 MAX_BYTES를 넘으면
+    가장 오래 사용하지 않은 템플릿부터 제거합니다.
+    """
+
+    # 최대 보관 크기 (템플릿 1장 약 10MB - 1000x2628 RGBA)
+    MAX_BYTES = 64 * 1024 * 1024
+
+    _templates = OrderedDict()
+    _bytes = 0
+    # 디코딩은 락 안에서 수행 (같은 템플릿을 두 스레드가 동시에 디코딩하지 않도록)
+    _lock = threading.RLock()
+    _hits = 0
+    _misses = 0
+
+    @classmethod
+    def get(cls, template_path: str) -> TemplateTiles:
+        """
+        캐시된 템플릿 타일 반환 (없거나 파일이 바뀌었으면 디코딩 후 저장)
+
+        Raises:
+            FileNotFoundError: 템플릿 파일이 없는 경우
+        """
+        real_path = os.path.realpath(template_path)
+        key = (real_path, os.stat(real_path).st_mtime_ns)
+
+        with cls._lock:
+            tiles = cls._templates.get(key)
+            if tiles is not None:
+                cls._templates.move_to_end(key)
+                cls._hits += 1
+                return tiles
+
+            with span('template.decode', path=os.path.basename(real_path)):
+                tiles = TemplateTiles.from_file(real_path)
+            cls._misses += 1
+
+            # 같은 경로의 이전 버전 제거
+            for old_key in [k for k in cls._templates if k[0] == real_path]:
+                cls._bytes -= cls._templates.pop(old_key).nbytes
+
+            cls._templates[key] = tiles
+            cls._bytes += tiles.nbytes
+            while cls._bytes > cls.MAX_BYTES and len(cls._templates) > 1:
+                _, evicted = cls._templates.popitem(last=False)
+                cls._bytes -= evicted.nbytes
+        return tiles
+
+    @classmethod
+    def warm(cls, template_paths) -> int:
+        """
+        템플릿 미리 디코딩
+
+        Returns:
+            캐시에 적재된 템플릿 수 (실패한 파일은 건너뜀)
+        """
+        loaded = 0
+        for template_path in template_paths:
+            try:
+                cls.get(template_path)
+                loaded += 1
+            except Exception as e:
+                logger.warning("템플릿 미리 로딩 실패: %s (%s)", template_path, e)
+        return loaded
+
+    @classmethod
+    def clear(cls):
+        """캐시 비우기"""
+        with cls._lock:
+            cls._templates.clear()
+            cls._bytes = 0
+            cls._hits = 0
+            cls._misses = 0
+
+    @classmethod
+    def get_stats(cls) -> dict:
+        """캐시 통계 반환"""
+        with cls._lock:
+            return {
+                'size': len(cls._templates),
+                'bytes': cls._bytes,
+                'max_bytes': cls.MAX_BYTES,
+                'hits': cls._hits,
+                'misses': cls._misses
+            }
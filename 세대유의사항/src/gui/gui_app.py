@@ -1,38 +1,90 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import os
-import tempfile
-import shutil
-import zipfile
+import queue
 import threading
 from datetime import datetime
 import gc
-# pandas는 필요시에만 지연 임포트
-import io
 import subprocess
 import platform
+import time
 
+# 가벼운 모듈만 즉시 임포트 (PIL, openpyxl을 사용하는 모듈은 첫 화면 표시 후 백그라운드 로딩)
 from src.core.local_file_manager import LocalFileManager
-from src.core.json_to_image import JsonToImage
-from src.core.excel_to_json import ExelToJson
-from src.core.position_settings import PositionSettings
+from src.core.output_profiles import OUTPUT_PROFILES, DEFAULT_PROFILE_NAME, summarize_encode_stats
+from src.core.output_sink import ZIP_COMPRESSIONS, DEFAULT_ZIP_COMPRESSION
 from src.utils.company_colors import CompanyColorManager
+from src.utils.progress import OperationCancelled, ProgressReporter, use_progress
+from src.utils.startup_timing import StartupTimer, FIRST_WINDOW_MARK
+from src.utils.tracing import LogSink, disable_tracing, enable_tracing
+
+# 단계별 시간 기록 시 로그 창에 바로 출력할 주요 구간 (나머지는 완료 후 합계로 출력)
+TRACE_LOG_SPANS = ('excel.read', 'excel.header', 'layout', 'render')
+
+# UI 이벤트 큐 처리 간격 (ms)과 한 번에 처리할 최대 이벤트 수
+UI_POLL_MS = 50
+UI_MAX_EVENTS = 500
+# 로그 창에 유지할 최대 줄 수 (오래된 줄부터 삭제)
+MAX_LOG_LINES = 2000
+
+# 미리보기: 마지막 변경 후 렌더링까지 대기 시간 (ms), 엑셀 파일/설정 변경 확인 간격 (ms)
+PREVIEW_DEBOUNCE_MS = 300
+PREVIEW_WATCH_MS = 1000
+# 미리보기 가로 크기 (px) - src.core.preview는 PIL을 사용하므로 여기서 정의하여 렌더러에 전달
+PREVIEW_WIDTH = 300
+
+# 첫 화면 표시 후 백그라운드에서 로딩할 무거운 모듈
+BACKGROUND_MODULES = [
+    'PIL.Image',
+    'PIL.ImageDraw',
+    'PIL.ImageFont',
+    'openpyxl',
+    'src.core.excel_loader',
+    'src.core.position_settings',
+    'src.core.excel_to_json',
+    'src.core.json_to_image',
+    'src.core.preview',
+]
 
 
 class ImageGeneratorApp:
-    def __init__(self, root):
+    def __init__(self, root, startup_timer=None):
         self.root = root
+        # 시작 시간 측정 (main.py에서 전달, 없으면 여기서부터 측정)
+        self.startup_timer = startup_timer or StartupTimer()
         self.root.title("이미지 생성기")
-        self.root.geometry("600x500")  # 단순화된 GUI에 맞는 기본 크기
-        self.root.minsize(600, 450)  # 최소 창 크기 설정
+        self.root.geometry("940x600")  # 설정 영역 + 미리보기 영역
+        self.root.minsize(900, 450)  # 최소 창 크기 설정
         self.root.resizable(True, True)
 
         # 파일 관리자 초기화
         self.file_manager = LocalFileManager()
 
-        # 위치 설정 초기화
-        self.position_settings = PositionSettings()
+        # 위치 설정은 백그라운드 로딩 완료 후 생성 (PIL 사용)
+        self.position_settings = None
         # self.position_settings.enable_manual_adjustment(True)  # 간격 설정값 적용을 위해 활성화
+        self.background_ready = threading.Event()
+        # 증분 렌더링 상태 (같은 시트를 다시 생성하면 바뀐 청크만 다시 그림, 첫 생성 시 생성)
+        self.render_state = None
+        # 렌더링 결과 캐시 (같은 엑셀/템플릿/설정이면 렌더링 없이 저장된 이미지 출력, 첫 생성 시 생성)
+        self.render_cache = None
+        self.background_error = None
+        # 작업 스레드 → 메인 스레드 UI 이벤트 큐 (('log', 줄) / ('progress', 진행 상황) / ('call', 함수))
+        self.ui_queue = queue.Queue()
+        # 진행 중인 이미지 생성의 취소 요청 (생성 시작 시 생성)
+        self.cancel_event = None
+        # 계산된 레이아웃 캐시와 미리보기 렌더러 (백그라운드 로딩 완료 후 생성)
+        self.layout_cache = None
+        self.preview_renderer = None
+        # 미리보기 상태: 예약된 렌더링(after id), 마지막 요청 입력, 요청 번호, 진행 중인 렌더링 취소 요청
+        self.preview_after_id = None
+        self.preview_inputs = None
+        self.preview_generation = 0
+        self.preview_cancel_event = None
+        # 레이아웃 계산과 그리기는 미리보기/이미지 생성을 통틀어 한 번에 하나만
+        # (둘이 같은 PositionSettings와 FontCache의 FreeType 폰트를 사용 - 동시에 쓰면 안전하지 않음)
+        self.render_lock = threading.Lock()
+        self.preview_photo = None
 
         # 변수 초기화
         self.excel_file_path = tk.StringVar()
@@ -41,6 +93,15 @@ class ImageGeneratorApp:
         self.selected_template = tk.StringVar()
         self.output_directory = tk.StringVar()
         self.current_company_color = tk.StringVar(value="기본 색상: #EE7500")
+        self.output_profile_label = tk.StringVar(value=OUTPUT_PROFILES[DEFAULT_PROFILE_NAME].label)
+        # ZIP 파일 하나로 저장 여부
+        self.save_as_zip = tk.BooleanVar(value=False)
+        self.zip_compression_label = tk.StringVar(value=ZIP_COMPRESSIONS[DEFAULT_ZIP_COMPRESSION][1])
+        # 단계별 시간 기록 여부 (로그 창에 출력)
+        self.trace_timings = tk.BooleanVar(value=False)
+        # 미리보기 표시 여부와 상태 문구
+        self.preview_enabled = tk.BooleanVar(value=True)
+        self.preview_info = tk.StringVar(value="엑셀 파일과 템플릿을 선택하면 미리보기가 표시됩니다")
         # 기본값 설정 - 프로젝트 폴더의 output 디렉토리
         project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
         output_dir = os.path.join(project_root, "output")
@@ -48,16 +109,68 @@ class ImageGeneratorApp:
         self.output_directory.set(output_dir)
 
         self.setup_ui()
+        self.root.after(UI_POLL_MS, self.process_ui_queue)
+        self.root.after(PREVIEW_WATCH_MS, self.watch_preview_inputs)
         self.check_requirements()
         self.refresh_template_list()
         
         # 초기 색상 표시 설정
         self.update_color_display("호반")
 
+        # 첫 화면이 그려진 뒤 무거운 모듈 로딩 시작
+        self.root.after_idle(self.start_background_loading)
+
+    def start_background_loading(self):
+        """첫 화면 표시 시점 기록 후 무거운 모듈을 백그라운드 스레드에서 로딩"""
+        self.startup_timer.mark(FIRST_WINDOW_MARK)
+        threading.Thread(target=self.load_background_modules, daemon=True).start()
+
+    def load_background_modules(self):
+        """무거운 모듈 임포트 및 위치 설정 생성 (백그라운드 스레드)"""
+        try:
+            for module_name in BACKGROUND_MODULES:
+                self.startup_timer.timed_import(module_name, phase='background')
+            from src.core.position_settings import PositionSettings
+            from src.core.preview import LayoutCache, PreviewRenderer
+            self.position_settings = PositionSettings()
+            self.layout_cache = LayoutCache(self.file_manager)
+            self.preview_renderer = PreviewRenderer(self.position_settings, self.file_manager.fonts_path, PREVIEW_WIDTH)
+            # 현재 선택된 템플릿 미리 디코딩
+            self.warm_template(self.template_file_path.get())
+            ready_seconds = self.startup_timer.mark('background_ready')
+            first_window_seconds = self.startup_timer.first_window_seconds()
+            self.log_message(f"⚡ 준비 완료 (첫 화면 {first_window_seconds:.2f}초, 전체 로딩 {ready_seconds:.2f}초)")
+        except Exception as e:
+            self.background_error = e
+            self.log_message(f"❌ 모듈 로딩 실패: {str(e)}")
+        finally:
+            self.background_ready.set()
+
+    def warm_template(self, template_path):
+        """템플릿을 TemplateCache에 미리 디코딩 (이미지 생성 시 디코딩 대기 없음)"""
+        if not template_path:
+            return
+        from src.core.template_cache import TemplateCache
+        TemplateCache.warm([template_path])
+
+    def warm_selected_template(self):
+        """선택된 템플릿을 백그라운드 스레드에서 미리 디코딩 (모듈 로딩 전이면 로딩 완료 시 처리)"""
+        if self.background_ready.is_set():
+            template_path = self.template_file_path.get()
+            threading.Thread(target=self.warm_template, args=(template_path,), daemon=True).start()
+
+    def wait_for_background_modules(self):
+        """백그라운드 로딩 완료 대기 (로딩 실패 시 예외 발생)"""
+        self.background_ready.wait()
+        if self.background_error is not None:
+            raise RuntimeError(f"필수 모듈을 불러오지 못했습니다: {self.background_error}")
+
     def setup_ui(self):
         """UI 구성"""
         # 스크롤 가능한 메인 영역 생성
         self.setup_scrollable_main_area()
+        # 오른쪽 미리보기 영역
+        self.setup_preview_area()
 
         # 메인 프레임을 스크롤 가능한 영역에 생성
         main_frame = ttk.Frame(self.scrollable_frame, padding="20")
@@ -128,19 +241,57 @@ class ImageGeneratorApp:
         ttk.Button(main_frame, text="폴더 선택", command=self.select_output_directory).grid(row=row, column=2, pady=5)
         row += 1
 
+        # 출력 형식 선택
+        ttk.Label(main_frame, text="출력 형식:").grid(row=row, column=0, sticky=tk.W, pady=5)
+        self.output_profile_combobox = ttk.Combobox(
+            main_frame,
+            textvariable=self.output_profile_label,
+            values=[profile.label for profile in OUTPUT_PROFILES.values()],
+            state="readonly"
+        )
+        self.output_profile_combobox.grid(row=row, column=1, sticky=(tk.W, tk.E), padx=(10, 5), pady=5)
+        row += 1
+
+        # ZIP 저장 선택 (압축 방식 포함)
+        zip_frame = ttk.Frame(main_frame)
+        zip_frame.grid(row=row, column=1, sticky=tk.W, padx=(10, 5), pady=5)
+        ttk.Checkbutton(zip_frame, text="ZIP 파일 하나로 저장", variable=self.save_as_zip).pack(side=tk.LEFT)
+        ttk.Combobox(
+            zip_frame,
+            textvariable=self.zip_compression_label,
+            values=[label for _, label in ZIP_COMPRESSIONS.values()],
+            state="readonly",
+            width=16
+        ).pack(side=tk.LEFT, padx=(10, 0))
+        row += 1
+
+        # 단계별 시간 기록 (엑셀 읽기, 레이아웃, 폰트 로딩, 그리기, 인코딩, 저장)
+        ttk.Checkbutton(main_frame, text="단계별 시간 기록 (로그)", variable=self.trace_timings).grid(
+            row=row, column=1, sticky=tk.W, padx=(10, 5), pady=5)
+        row += 1
+
         # 구분선
         separator = ttk.Separator(main_frame, orient='horizontal')
         separator.grid(row=row, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=20)
         row += 1
 
-        # 생성 버튼
+        # 생성/취소 버튼
+        action_frame = ttk.Frame(main_frame)
+        action_frame.grid(row=row, column=0, columnspan=3, pady=10)
         self.generate_button = ttk.Button(
-            main_frame,
+            action_frame,
             text="이미지 생성하기",
             command=self.start_generation,
             state="disabled"
         )
-        self.generate_button.grid(row=row, column=0, columnspan=3, pady=10)
+        self.generate_button.pack(side=tk.LEFT)
+        self.cancel_button = ttk.Button(
+            action_frame,
+            text="취소",
+            command=self.cancel_generation,
+            state="disabled"
+        )
+        self.cancel_button.pack(side=tk.LEFT, padx=(10, 0))
         row += 1
 
         # 진행률 표시
@@ -148,7 +299,7 @@ class ImageGeneratorApp:
         ttk.Label(main_frame, textvariable=self.progress_var).grid(row=row, column=0, columnspan=3, pady=5)
         row += 1
 
-        self.progress_bar = ttk.Progressbar(main_frame, mode='indeterminate')
+        self.progress_bar = ttk.Progressbar(main_frame, mode='determinate', maximum=100)
         self.progress_bar.grid(row=row, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=5)
         row += 1
 
@@ -205,6 +356,31 @@ class ImageGeneratorApp:
         # 마우스 휠 스크롤 이벤트 바인딩
         self.bind_mousewheel()
 
+    def setup_preview_area(self):
+        """미리보기 영역 설정 (창 오른쪽, 축소 이미지를 세로 스크롤로 표시)"""
+        preview_frame = ttk.LabelFrame(self.root, text="미리보기", padding="5")
+        preview_frame.grid(row=0, column=2, sticky="nsew", padx=(5, 5), pady=5)
+        preview_frame.columnconfigure(0, weight=1)
+        preview_frame.rowconfigure(2, weight=1)
+
+        ttk.Checkbutton(preview_frame, text="미리보기 표시", variable=self.preview_enabled,
+                        command=self.on_preview_toggled).grid(row=0, column=0, columnspan=2, sticky=tk.W)
+        ttk.Label(preview_frame, textvariable=self.preview_info, wraplength=PREVIEW_WIDTH).grid(
+            row=1, column=0, columnspan=2, sticky=tk.W, pady=(2, 5))
+
+        self.preview_canvas = tk.Canvas(preview_frame, width=PREVIEW_WIDTH, background="white", highlightthickness=0)
+        preview_scrollbar = ttk.Scrollbar(preview_frame, orient="vertical", command=self.preview_canvas.yview)
+        self.preview_canvas.configure(yscrollcommand=preview_scrollbar.set)
+        self.preview_canvas.grid(row=2, column=0, sticky="nsew")
+        preview_scrollbar.grid(row=2, column=1, sticky="ns")
+
+        # 마우스가 미리보기 위에 있을 때는 미리보기를 스크롤
+        def _on_mousewheel(event):
+            self.preview_canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+
+        self.preview_canvas.bind('<Enter>', lambda e: self.preview_canvas.bind_all("<MouseWheel>", _on_mousewheel))
+        self.preview_canvas.bind('<Leave>', lambda e: self.preview_canvas.unbind_all("<MouseWheel>"))
+
     def bind_mousewheel(self):
         """마우스 휠 스크롤 이벤트 바인딩"""
         def _on_mousewheel(event):
@@ -221,10 +397,169 @@ class ImageGeneratorApp:
         self.canvas.bind('<Leave>', _unbind_from_mousewheel)
 
     def log_message(self, message):
-        """로그 메시지 추가"""
-        self.log_text.insert(tk.END, f"[{datetime.now().strftime('%H:%M:%S')}] {message}\n")
+        """로그 메시지 추가 (어느 스레드에서나 호출 가능 - 큐를 거쳐 메인 스레드에서 표시)"""
+        self.ui_queue.put(('log', f"[{datetime.now().strftime('%H:%M:%S')}] {message}\n"))
+
+    def post_ui(self, func):
+        """메인 스레드에서 실행할 함수 등록 (메시지 상자 등, 앞서 등록한 로그 출력 후 실행)"""
+        self.ui_queue.put(('call', func))
+
+    def post_progress(self, update):
+        """진행 상황 등록 (ProgressReporter 콜백 - 작업 스레드에서 호출)"""
+        self.ui_queue.put(('progress', update))
+
+    def process_ui_queue(self):
+        """UI 이벤트 큐 처리 (메인 스레드에서 UI_POLL_MS 간격으로 반복 - 로그는 모아서 한 번에 추가)"""
+        log_lines = []
+        try:
+            for _ in range(UI_MAX_EVENTS):
+                try:
+                    kind, payload = self.ui_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if kind == 'log':
+                    log_lines.append(payload)
+                    continue
+                # 순서 유지: 앞서 등록된 로그를 먼저 출력
+                self._append_log_lines(log_lines)
+                log_lines = []
+                if kind == 'progress':
+                    self.show_progress(payload)
+                else:
+                    payload()
+            self._append_log_lines(log_lines)
+        finally:
+            self.root.after(UI_POLL_MS, self.process_ui_queue)
+
+    def _append_log_lines(self, log_lines):
+        """로그 창에 여러 줄 추가 (MAX_LOG_LINES를 넘으면 오래된 줄 삭제)"""
+        if not log_lines:
+            return
+        self.log_text.insert(tk.END, ''.join(log_lines))
+        line_count = int(self.log_text.index('end-1c').split('.')[0])
+        if line_count > MAX_LOG_LINES:
+            self.log_text.delete('1.0', f'{line_count - MAX_LOG_LINES + 1}.0')
         self.log_text.see(tk.END)
-        self.root.update()
+
+    def show_progress(self, update):
+        """진행률 표시 (단계별 처리 수와 전체 진행률)"""
+        self.progress_bar['value'] = update['percent']
+        if update['stage'] is None:
+            return
+        self.progress_var.set(
+            f"{update['label']} {update['stage_percent']:.0f}% ({update['done']}/{update['total']}) "
+            f"· 전체 {update['percent']:.0f}%"
+        )
+
+    def get_preview_inputs(self):
+        """미리보기 입력 (엑셀 경로/수정 시각/크기, 템플릿, 건설사, 위치 설정) - 미리보기를 만들 수 없으면 None"""
+        if not self.preview_enabled.get() or self.position_settings is None:
+            return None
+        excel_path = self.excel_file_path.get().strip()
+        template_path = self.template_file_path.get().strip()
+        if not excel_path or not template_path:
+            return None
+        try:
+            stat = os.stat(excel_path)
+        except OSError:
+            return None
+        settings = tuple(sorted(self.position_settings.get_all_settings().items()))
+        return (excel_path, stat.st_mtime_ns, stat.st_size, template_path,
+                self.construction_name.get().strip(), settings)
+
+    def watch_preview_inputs(self):
+        """미리보기 입력 변경 확인 (엑셀 파일 저장, 백그라운드 로딩 완료 등 - PREVIEW_WATCH_MS 간격으로 반복)"""
+        try:
+            inputs = self.get_preview_inputs()
+            if inputs is not None and inputs != self.preview_inputs and self.cancel_event is None:
+                self.request_preview()
+        finally:
+            self.root.after(PREVIEW_WATCH_MS, self.watch_preview_inputs)
+
+    def request_preview(self):
+        """미리보기 렌더링 예약 (PREVIEW_DEBOUNCE_MS 안에 다시 요청하면 마지막 요청만 렌더링)"""
+        if self.preview_after_id is not None:
+            self.root.after_cancel(self.preview_after_id)
+        self.preview_after_id = self.root.after(PREVIEW_DEBOUNCE_MS, self._start_preview_render)
+
+    def on_preview_toggled(self):
+        """미리보기 표시 선택/해제"""
+        if self.preview_enabled.get():
+            self.preview_inputs = None
+            self.request_preview()
+            return
+        if self.preview_cancel_event is not None:
+            self.preview_cancel_event.set()
+        self.preview_generation += 1
+        self.preview_canvas.delete("all")
+        self.preview_photo = None
+        self.preview_info.set("미리보기 꺼짐")
+
+    def _start_preview_render(self):
+        """예약된 미리보기 렌더링 시작 (진행 중인 이전 렌더링은 취소)"""
+        self.preview_after_id = None
+        inputs = self.get_preview_inputs()
+        # 이미지 생성 중에는 시작하지 않음 (생성이 끝나면 입력 확인에서 다시 요청)
+        if inputs is None or self.cancel_event is not None:
+            return
+        self.preview_inputs = inputs
+        if self.preview_cancel_event is not None:
+            self.preview_cancel_event.set()
+        self.preview_cancel_event = threading.Event()
+        self.preview_generation += 1
+        self.preview_info.set("미리보기 렌더링 중...")
+        threading.Thread(
+            target=self.render_preview,
+            args=(self.preview_generation, inputs, self.preview_cancel_event),
+            daemon=True
+        ).start()
+
+    def render_preview(self, generation, inputs, cancel_event):
+        """미리보기 렌더링 (별도 스레드에서 실행 - 계산한 레이아웃은 이미지 생성에서 재사용)"""
+        excel_path, _, _, template_path, company_name, _ = inputs
+        with self.render_lock:
+            if cancel_event.is_set():
+                return
+            try:
+                with use_progress(ProgressReporter(cancel_event=cancel_event)):
+                    started = time.perf_counter()
+                    document, cached = self.layout_cache.get_document(excel_path, self.position_settings, company_name)
+                    # 레이아웃 계산 시간 (엑셀 읽기 포함, 캐시 사용 시 None) - 행 수에 비례
+                    layout_seconds = None if cached else time.perf_counter() - started
+                    preview = self.preview_renderer.render(document, template_path)
+            except OperationCancelled:
+                return
+            except Exception as e:
+                error_msg = f"미리보기 오류: {str(e)}"
+                self.post_ui(lambda: self._show_preview_error(generation, error_msg))
+                return
+        self.post_ui(lambda: self.show_preview(generation, preview, layout_seconds))
+
+    def show_preview(self, generation, preview, layout_seconds):
+        """미리보기 이미지 표시 (메인 스레드 - 이후 요청이 있었으면 무시)"""
+        if generation != self.preview_generation:
+            return
+        from PIL import ImageTk
+
+        image = preview['image']
+        self.preview_photo = ImageTk.PhotoImage(image)
+        self.preview_canvas.delete("all")
+        self.preview_canvas.create_image(0, 0, image=self.preview_photo, anchor="nw")
+        self.preview_canvas.configure(scrollregion=(0, 0, image.width, image.height))
+
+        if layout_seconds is None:
+            info = f"미리보기 {preview['seconds']:.2f}초 (레이아웃 재사용)"
+        else:
+            info = f"레이아웃 {layout_seconds:.2f}초 + 미리보기 {preview['seconds']:.2f}초"
+        info += f" · 레이어 {preview['layers']}개 · 높이 {preview['required_height']}px"
+        if preview['truncated']:
+            info += f" (처음 {preview['shown_layers']}개만 표시)"
+        self.preview_info.set(info)
+
+    def _show_preview_error(self, generation, error_msg):
+        """미리보기 오류 표시 (이후 요청이 있었으면 무시)"""
+        if generation == self.preview_generation:
+            self.preview_info.set(f"⚠️ {error_msg}")
 
     def check_requirements(self):
         """필수 파일 확인"""
@@ -279,6 +614,8 @@ class ImageGeneratorApp:
                 
                 template_filename = os.path.basename(template_path)
                 self.log_message(f"✅ 템플릿 선택됨: {template_filename}")
+                self.warm_selected_template()
+                self.request_preview()
                 self.log_message(f"🎨 {color_info}")
             else:
                 self.template_file_path.set("")
@@ -327,6 +664,7 @@ class ImageGeneratorApp:
             self.excel_file_path.set(file_path)
             self.log_message(f"엑셀 파일 선택됨: {os.path.basename(file_path)}")
             self.update_generate_button_state()
+            self.request_preview()
 
             # 자동으로 컬럼 분석
             self.analyze_excel_columns(file_path)
@@ -334,31 +672,12 @@ class ImageGeneratorApp:
     def analyze_excel_columns(self, file_path):
         """엑셀 파일의 컬럼 구조 분석"""
         try:
-            # 더미 ExelToJson 객체로 컬럼 매핑 테스트
-            with open(file_path, 'rb') as f:
-                excel_file = io.BytesIO(f.read())
+            # 파일을 한 번만 읽고 메모리에서 헤더 행 감지 (생성 단계와 같은 로더 사용)
+            from src.core.excel_loader import ExcelLoader
 
-            # 현재 선택된 건설사명 가져오기
-            current_company = self.construction_name.get().strip()
-            processor = ExelToJson(excel_file, position_settings=self.position_settings, company_name=current_company)
-
-            # 여러 헤더 위치 테스트
-            file_contents = excel_file.getvalue()
-            file_like = io.BytesIO(file_contents)
-
-            for header_row in [0, 1, 2]:
-                try:
-                    import pandas as pd  # 지연 임포트
-                    temp_df = pd.read_excel(file_like, header=header_row)
-                    file_like.seek(0)
-
-                    mapping = processor.find_column_mapping(temp_df)
-                    if len(mapping) >= 2:
-                        self.log_message(f"📊 컬럼 매핑 (헤더 행 {header_row}): {mapping}")
-                        break
-                except Exception as e:
-                    print(e)
-                    continue
+            header_row, mapping = ExcelLoader(file_path).detect_header()
+            if header_row is not None:
+                self.log_message(f"📊 컬럼 매핑 (헤더 행 {header_row}): {mapping}")
             else:
                 self.log_message("⚠️ 적절한 컬럼을 찾을 수 없습니다")
 
@@ -395,7 +714,9 @@ class ImageGeneratorApp:
 
             self.log_message(f"📁 템플릿 파일 직접 선택됨: {filename}")
             self.log_message(f"🎨 {color_info}")
+            self.warm_selected_template()
             self.update_generate_button_state()
+            self.request_preview()
 
     def select_output_directory(self):
         """출력 디렉토리 선택"""
@@ -404,6 +725,22 @@ class ImageGeneratorApp:
             self.output_directory.set(directory)
             self.log_message(f"저장 위치 변경됨: {directory}")
 
+    def get_selected_output_profile(self):
+        """선택된 출력 형식 프로파일 이름 반환"""
+        selected_label = self.output_profile_label.get()
+        for name, profile in OUTPUT_PROFILES.items():
+            if profile.label == selected_label:
+                return name
+        return DEFAULT_PROFILE_NAME
+
+    def get_selected_zip_compression(self):
+        """선택된 ZIP 압축 방식 이름 반환"""
+        selected_label = self.zip_compression_label.get()
+        for name, (_, label) in ZIP_COMPRESSIONS.items():
+            if label == selected_label:
+                return name
+        return DEFAULT_ZIP_COMPRESSION
+
     def update_generate_button_state(self):
         """생성 버튼 활성화 상태 업데이트"""
         excel_selected = bool(self.excel_file_path.get().strip())
@@ -419,123 +756,179 @@ class ImageGeneratorApp:
         """이미지 생성 시작"""
         # 버튼 비활성화
         self.generate_button.config(state="disabled")
-        self.progress_bar.start(10)
+        self.cancel_event = threading.Event()
+        self.cancel_button.config(state="normal")
+        self.progress_bar['value'] = 0
         self.progress_var.set("이미지 생성 중...")
 
+        # 진행 중인 미리보기는 취소 (렌더링 잠금을 바로 넘겨받음) - 생성이 끝나면 다시 렌더링
+        if self.preview_cancel_event is not None:
+            self.preview_cancel_event.set()
+        self.preview_generation += 1
+        self.preview_inputs = None
+        if self.preview_enabled.get():
+            self.preview_info.set("이미지 생성 후 미리보기를 다시 표시합니다")
+
         # 별도 스레드에서 실행
-        thread = threading.Thread(target=self.generate_images, daemon=True)
+        thread = threading.Thread(target=self.generate_images, args=(self.cancel_event,), daemon=True)
         thread.start()
 
-    def generate_images(self):
+    def cancel_generation(self):
+        """진행 중인 이미지 생성 취소 요청 (다음 레이어/청크 처리 시점에 중단)"""
+        if self.cancel_event is None or self.cancel_event.is_set():
+            return
+        self.cancel_event.set()
+        self.cancel_button.config(state="disabled")
+        self.progress_var.set("취소 중...")
+        self.log_message("⏹️ 취소 요청됨 - 진행 중인 청크를 마무리하고 중단합니다")
+
+    def generate_images(self, cancel_event=None):
         """이미지 생성 (별도 스레드에서 실행)"""
-        temp_dir = None
+        output_sink = None
+        tracer = None
+        status = "오류"
+        reporter = ProgressReporter(self.post_progress, cancel_event)
+        if self.trace_timings.get():
+            tracer = enable_tracing(LogSink(self.log_message, names=TRACE_LOG_SPANS))
         try:
-            # 임시 디렉토리 생성
-            temp_dir = tempfile.mkdtemp()
-            temp_fonts_path = os.path.join(temp_dir, 'fonts')
-            temp_result_path = os.path.join(temp_dir, 'result')
-
-            os.makedirs(temp_result_path, exist_ok=True)
-
-            self.root.after(0, lambda: self.log_message("🔄 폰트 파일 준비 중..."))
-            self.file_manager.setup_fonts(temp_fonts_path)
-
-            self.root.after(0, lambda: self.log_message("📊 엑셀 파일 처리 중..."))
+            # 백그라운드 모듈 로딩이 끝나지 않았으면 대기
+            self.wait_for_background_modules()
+            reporter.check_cancelled()
+            from src.core.json_to_image import JsonToImage
+            from src.core.output_sink import DirectorySink, ZipSink
+            from src.core.incremental_render import IncrementalRenderState
+            from src.core.render_cache import RenderCache
+            if self.render_state is None:
+                self.render_state = IncrementalRenderState()
+            if self.render_cache is None:
+                self.render_cache = RenderCache(self.file_manager.cache_path)
+
+            self.log_message("📊 엑셀 파일 처리 중...")
             # 건설사명 가져오기
             company_name = self.construction_name.get().strip()
             if company_name:
                 color_info = CompanyColorManager.get_color_info(company_name)
-                self.root.after(0, lambda: self.log_message(f"🎨 {company_name} 테마 색상 적용: {color_info['hex']}"))
-            
-            excel_file_json = self.file_manager.process_excel(self.excel_file_path.get(), self.position_settings, company_name)
+                self.log_message(f"🎨 {company_name} 테마 색상 적용: {color_info['hex']}")
+
+            # 미리보기에서 같은 엑셀/설정으로 계산한 레이아웃이 있으면 재사용
+            with self.render_lock, use_progress(reporter):
+                document, cached = self.layout_cache.get_document(
+                    self.excel_file_path.get(), self.position_settings, company_name)
+            if cached:
+                reporter.skip('excel', 'layout')
+                self.log_message("♻️ 미리보기에서 계산한 레이아웃 사용")
 
-            self.root.after(0, lambda: self.log_message("🖼️ 템플릿 파일 준비 중..."))
+            self.log_message("🖼️ 템플릿 파일 준비 중...")
             template_path = self.template_file_path.get()
 
-            # 이미지 생성
-            self.root.after(0, lambda: self.log_message("🎨 이미지 생성 중..."))
-            output_file_path = os.path.join(temp_result_path, 'output.png')
+            # 최종 파일명 결정 (건설사명_타임스탬프_N)
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            selected_template = self.selected_template.get()
+            if selected_template.startswith("직접 선택:"):
+                construction_name = self.construction_name.get().strip() or "사용자지정"
+            else:
+                construction_name = selected_template
+
+            def get_filename(result_name):
+                return LocalFileManager.get_output_filename(construction_name, timestamp, result_name)
+
+            # 저장 위치에 최종 이름으로 바로 저장 (임시 폴더 복사 없음)
+            output_dir = self.output_directory.get()
+            if self.save_as_zip.get():
+                zip_path = os.path.join(output_dir, f"{construction_name}_{timestamp}.zip")
+                output_sink = ZipSink(zip_path, get_filename, self.get_selected_zip_compression())
+            else:
+                output_sink = DirectorySink(output_dir, get_filename)
 
+            # 이미지 생성
+            self.log_message("🎨 이미지 생성 중...")
             image_generator = JsonToImage(
-                excel_file_json,
-                output_file_path,
+                document,
+                os.path.join(output_dir, 'output.png'),
                 template_path,
                 split_chunks=True,
                 chunk_height=2000,
-                fonts_path=temp_fonts_path,
-                output_dir=temp_result_path,
-                position_settings=self.position_settings
+                fonts_path=self.file_manager.fonts_path,
+                output_dir=output_dir,
+                position_settings=self.position_settings,
+                output_profile=self.get_selected_output_profile(),
+                output_sink=output_sink,
+                incremental_state=self.render_state,
+                render_cache=self.render_cache
             )
 
-            result_files = image_generator.generate_image_from_json()
+            with self.render_lock, use_progress(reporter):
+                result_files = image_generator.generate_image_from_json()
+            # 마지막 파일까지 저장된 뒤에는 취소하지 않음
+            output_sink.close()
+            output_sink = None
+            reporter.complete()
+            render_stats = self.render_state.last_stats
+            if image_generator.encode_stats and all(record.get('cached') for record in image_generator.encode_stats):
+                self.log_message("⚡ 같은 입력의 이전 결과를 캐시에서 가져옴")
+            elif not render_stats.get('full_redraw', True):
+                self.log_message(f"♻️ 변경된 청크 {render_stats['redrawn']}/{render_stats['chunks']}개만 다시 그림")
+            self.log_message(f"💾 {summarize_encode_stats(image_generator.encode_stats)}")
 
             if result_files and len(result_files) > 0:
-                self.root.after(0, lambda: self.log_message("📁 이미지 파일을 바탕화면에 저장 중..."))
-                
-                # 바탕화면에 직접 PNG 파일들 복사
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                
-                # 건설사명 결정
-                selected_template = self.selected_template.get()
-                if selected_template.startswith("직접 선택:"):
-                    construction_name = self.construction_name.get().strip() or "사용자지정"
-                else:
-                    construction_name = selected_template
-                
-                # 바탕화면에 PNG 파일들 직접 저장
-                saved_files = []
-                for i, png_file in enumerate([f for f in os.listdir(temp_result_path) if f.endswith('.png')], 1):
-                    src_path = os.path.join(temp_result_path, png_file)
-                    if png_file == 'output.png':
-                        # 원본 이미지
-                        dest_filename = f'{construction_name}_{timestamp}_전체.png'
-                    else:
-                        # 청크 파일들 (1.png, 2.png 등)
-                        dest_filename = f'{construction_name}_{timestamp}_{png_file}'
-                    
-                    dest_path = os.path.join(self.output_directory.get(), dest_filename)
-                    shutil.copy2(src_path, dest_path)
-                    saved_files.append(dest_filename)
-                
+                status = "완료"
+                saved_files = [os.path.basename(path) for path in result_files]
+
                 # 생성된 파일 정보 로깅
                 total_files = len(saved_files)
-                self.root.after(0, lambda: self.log_message(f"✅ 완료! 총 {total_files}개 이미지가 바탕화면에 저장됨"))
+                if self.save_as_zip.get():
+                    location = f"{os.path.basename(zip_path)} (ZIP)"
+                else:
+                    location = "바탕화면"
+                self.log_message(f"✅ 완료! 총 {total_files}개 이미지가 {location}에 저장됨")
                 for filename in saved_files:
-                    self.root.after(0, lambda f=filename: self.log_message(f"📁 저장됨: {f}"))
+                    self.log_message(f"📁 저장됨: {filename}")
                 
                 # 완료 메시지
                 file_list = "\n".join(saved_files[:3])  # 처음 3개만 표시
                 if len(saved_files) > 3:
                     file_list += f"\n... 외 {len(saved_files)-3}개"
                 
-                self.root.after(0, lambda: messagebox.showinfo(
+                self.post_ui(lambda: messagebox.showinfo(
                     "완료", 
-                    f"이미지 생성이 완료되었습니다!\n\n총 {total_files}개 이미지 생성\n저장 위치: 바탕화면\n\n생성된 파일:\n{file_list}",
+                    f"이미지 생성이 완료되었습니다!\n\n총 {total_files}개 이미지 생성\n저장 위치: {location}\n\n생성된 파일:\n{file_list}",
                 ))
             else:
-                self.root.after(0, lambda: self.log_message("❌ 이미지 생성 실패"))
-                self.root.after(0, lambda: messagebox.showerror("오류", "이미지 생성에 실패했습니다."))
-                
+                self.log_message("❌ 이미지 생성 실패")
+                self.post_ui(lambda: messagebox.showerror("오류", "이미지 생성에 실패했습니다."))
+
+        except OperationCancelled:
+            status = "취소됨"
+            self.log_message("⏹️ 이미지 생성이 취소되었습니다 (저장 중이던 파일은 삭제됨)")
+
         except Exception as e:
             error_msg = f"오류 발생: {str(e)}"
-            self.root.after(0, lambda: self.log_message(f"❌ {error_msg}"))
-            self.root.after(0, lambda: messagebox.showerror("오류", error_msg))
+            self.log_message(f"❌ {error_msg}")
+            self.post_ui(lambda: messagebox.showerror("오류", error_msg))
         
         finally:
-            # 정리
-            if temp_dir and os.path.exists(temp_dir):
-                shutil.rmtree(temp_dir, ignore_errors=True)
+            # 저장 중 실패/취소하면 미완성 결과 제거
+            if output_sink is not None:
+                output_sink.discard()
+
+            if tracer is not None:
+                disable_tracing()
+                for line in tracer.summary().splitlines():
+                    self.log_message(line)
             
             # UI 복원
-            self.root.after(0, self._finish_generation)
+            self.post_ui(lambda: self._finish_generation(status))
             
             # 메모리 정리
             gc.collect()
 
-    def _finish_generation(self):
+    def _finish_generation(self, status="완료"):
         """생성 완료 후 UI 복원"""
-        self.progress_bar.stop()
-        self.progress_var.set("완료")
+        if status != "완료":
+            self.progress_bar['value'] = 0
+        self.progress_var.set(status)
+        self.cancel_event = None
+        self.cancel_button.config(state="disabled")
         self.generate_button.config(state="normal")
 
     def _open_file_safely(self, file_path):
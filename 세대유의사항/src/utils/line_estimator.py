@@ -0,0 +1,195 @@
+"""
+폰트 없는 줄 수 추정 모듈
+한글 30px, 그 외 18px(36pt 기준) 글자 폭으로 줄바꿈을 추정합니다.
+
+단어별 폭을 표(word → 폭)에 한 번만 계산해 두고 재사용하므로, 글자마다 ord()를
+비교하는 계산은 처음 나온 단어에서만 수행됩니다. 열(column) 단위 함수는 열 전체의
+단어 표를 먼저 만든 뒤 각 텍스트의 줄 수를 계산합니다 (폰트 로딩 없이 수천 행 사전 배치용).
+
+결과는 TextUtils의 기존 fallback 계산(_calculate_text_lines_fallback, _wrap_text_fallback)과 같습니다.
+"""
+
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Dict, Iterable, List
+
+# 글자 폭 (36pt 폰트 기준 추정값)
+HANGUL_WIDTH = 30
+OTHER_WIDTH = 18
+SPACE_WIDTH = 18
+
+# 한글 음절 범위 (가 ~ 힣)
+HANGUL_FIRST = 0xAC00
+HANGUL_LAST = 0xD7A3
+
+# 긴 단어 분할 기준 평균 글자 폭, 분할 우선 문장부호
+SPLIT_CHAR_WIDTH = 25
+SPLIT_PUNCTUATION = ',，.。;；:：'
+
+
+class LineEstimator:
+    """단어 폭 표 기반 줄 수/줄바꿈 추정 (프로세스 전역 표 공유)"""
+
+    # 단어 폭 표 최대 보관 수 (초과 시 전체 비움)
+    MAX_WORD_ENTRIES = 65536
+
+    _word_widths: Dict[str, int] = {}
+
+    @classmethod
+    def word_width(cls, word: str) -> int:
+        """단어 추정 폭 (표에 없으면 계산 후 저장)"""
+        width = cls._word_widths.get(word)
+        if width is None:
+            hangul = sum(1 for c in word if HANGUL_FIRST <= ord(c) <= HANGUL_LAST)
+            width = hangul * HANGUL_WIDTH + (len(word) - hangul) * OTHER_WIDTH
+            if len(cls._word_widths) >= cls.MAX_WORD_ENTRIES:
+                cls._word_widths.clear()
+            cls._word_widths[word] = width
+        return width
+
+    @classmethod
+    def get_word_widths(cls, words: List[str]) -> List[int]:
+        """단어 목록의 추정 폭 (표 조회, 없는 단어만 계산)"""
+        widths = list(map(cls._word_widths.get, words))
+        if None in widths:
+            widths = [cls.word_width(word) for word in words]
+        return widths
+
+    @classmethod
+    def prepare(cls, texts: Iterable[str]):
+        """여러 텍스트의 단어 폭을 미리 표에 등록 (처음 나온 단어만 계산)"""
+        vocabulary = set()
+        for text in texts:
+            vocabulary.update(text.split())
+        vocabulary.difference_update(cls._word_widths)
+        for word in vocabulary:
+            cls.word_width(word)
+
+    @classmethod
+    def count_lines(cls, text: str, max_width: int) -> int:
+        """
+        텍스트 추정 줄 수 (TextUtils._calculate_text_lines_fallback과 같은 결과)
+
+        줄이 넘어갈 때 새 줄 첫 단어의 폭에 앞 공백 폭이 포함된 채로 계산되는
+        기존 동작도 그대로 유지합니다.
+        """
+        words = text.split()
+        widths = cls.get_word_widths(words)
+
+        # 전체 폭 (단어 사이 공백 등 단어 밖 글자는 모두 18px)
+        total_width = sum(widths) + (len(text) - sum(map(len, words))) * OTHER_WIDTH
+        if total_width <= max_width:
+            return 1
+        return cls._count_wrapped_lines(widths, max_width)
+
+    @staticmethod
+    def _count_wrapped_lines(widths: List[int], max_width: int) -> int:
+        """
+        단어 폭 목록의 줄 수 (줄 단위로 이분 탐색)
+
+        첫 단어 이후의 단어는 모두 (폭 + 공백 폭)을 차지하므로, 누적 합에서
+        최대 너비 안에 들어가는 마지막 단어를 찾아 한 줄씩 건너뜁니다.
+        """
+        count = len(widths)
+        lines = 0
+        index = 0
+
+        # 맨 앞의 한 줄보다 긴 단어는 각각 한 줄 (기존 동작: 줄 비우고 다음 단어는 공백 없이 시작)
+        while index < count and widths[index] > max_width:
+            lines += 1
+            index += 1
+        if index >= count:
+            return max(1, lines)
+
+        prefix = list(accumulate((width + SPACE_WIDTH for width in widths), initial=0))
+        current_width = widths[index]
+        index += 1
+        while True:
+            # current_width + (prefix[end] - prefix[index]) <= max_width 인 가장 큰 end
+            # (줄을 넘긴 단어 하나가 이미 최대 너비보다 길면 end = index)
+            limit = max_width - current_width + prefix[index]
+            index = max(index, bisect_right(prefix, limit, index, count + 1) - 1)
+            if index >= count:
+                break
+            # 넘친 단어로 새 줄 시작 (공백 폭 포함)
+            lines += 1
+            current_width = widths[index] + SPACE_WIDTH
+            index += 1
+        return lines + 1
+
+    @classmethod
+    def count_lines_column(cls, texts: Iterable[str], max_width: int) -> List[int]:
+        """텍스트 목록(열 하나)의 추정 줄 수를 한 번에 계산"""
+        texts = list(texts)
+        cls.prepare(texts)
+        return [cls.count_lines(text, max_width) for text in texts]
+
+    @staticmethod
+    def split_long_words(words: List[str], max_width: int) -> List[str]:
+        """너무 긴 단어를 적절히 분할 (문장부호가 있으면 그 뒤에서 분할)"""
+        result = []
+        max_chars_per_word = max_width // SPLIT_CHAR_WIDTH  # 대략적인 문자 수 제한
+
+        for word in words:
+            if len(word) <= max_chars_per_word:
+                result.append(word)
+                continue
+
+            while len(word) > max_chars_per_word:
+                split_pos = max_chars_per_word
+                for i, char in enumerate(word[:max_chars_per_word]):
+                    if char in SPLIT_PUNCTUATION:
+                        split_pos = i + 1
+                        break
+
+                result.append(word[:split_pos])
+                word = word[split_pos:]
+
+            if word:  # 남은 부분 추가
+                result.append(word)
+
+        return result
+
+    @classmethod
+    def wrap(cls, text: str, max_width: int) -> List[str]:
+        """텍스트 추정 줄바꿈 (TextUtils._wrap_text_fallback과 같은 결과)"""
+        words = cls.split_long_words(text.split(), max_width)
+        if not words:
+            return ['']
+
+        lines = []
+        current_line = []
+        current_width = 0
+        for word in words:
+            word_width = cls.word_width(word)
+            space_width = SPACE_WIDTH if current_line else 0
+
+            if current_width + space_width + word_width <= max_width:
+                current_line.append(word)
+                current_width += space_width + word_width
+            elif current_line:
+                lines.append(' '.join(current_line))
+                current_line = [word]
+                current_width = word_width
+            else:
+                # 단일 단어가 너무 긴 경우 (이미 분할되었어야 함)
+                lines.append(word)
+                current_line = []
+                current_width = 0
+
+        if current_line:
+            lines.append(' '.join(current_line))
+
+        return lines if lines else [text]
+
+    @classmethod
+    def wrap_column(cls, texts: Iterable[str], max_width: int) -> List[List[str]]:
+        """텍스트 목록(열 하나)의 추정 줄바꿈 결과를 한 번에 계산"""
+        texts = list(texts)
+        cls.prepare(texts)
+        return [cls.wrap(text, max_width) for text in texts]
+
+    @classmethod
+    def clear(cls):
+        """단어 폭 표 비우기"""
+        cls._word_widths.clear()
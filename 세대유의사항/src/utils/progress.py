@@ -0,0 +1,209 @@
+"""
+진행률/취소 모듈
+엑셀 읽기, 레이아웃 계산, 그리기, 인코딩 단계가 처리한 항목 수를 보고하고 취소 요청을 확인합니다.
+
+    reporter = ProgressReporter(on_update, cancel_event)
+    with use_progress(reporter):
+        ...  # 파이프라인 실행 (취소되면 OperationCancelled 발생)
+
+파이프라인 쪽에서는 get_progress()로 현재 보고 대상을 가져와 사용합니다.
+
+    progress = get_progress()
+    progress.start('layout', len(rows))
+    for row in rows:
+        ...
+        progress.advance()   # 취소 요청이 있으면 여기서 OperationCancelled 발생
+
+- 기본값은 꺼짐: 보고 대상이 없으면 공용 빈 객체를 반환 (거의 비용 없음)
+- 보고 대상은 스레드별로 지정 (미리보기 렌더링과 이미지 생성이 서로의 진행률에 섞이지 않음)
+- 콜백은 작업 스레드에서 호출되므로 GUI는 큐에 넣어 메인 스레드에서 처리해야 함
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Optional
+
+# 단계별 전체 진행률 비중 (순서 = 진행 순서)
+STAGE_WEIGHTS = {
+    'excel': 0.1,
+    'layout': 0.2,
+    'draw': 0.4,
+    'encode': 0.3,
+}
+
+STAGE_LABELS = {
+    'excel': '엑셀 읽기',
+    'layout': '레이아웃 계산',
+    'draw': '그리기',
+    'encode': '인코딩/저장',
+}
+
+# 콜백 최소 호출 간격 (초) - 단계 시작/완료는 항상 보고
+DEFAULT_MIN_INTERVAL = 0.05
+
+_local = threading.local()
+
+
+class OperationCancelled(Exception):
+    """사용자가 작업을 취소함"""
+
+
+class _NullProgress:
+    """보고 대상이 없을 때 사용하는 빈 진행률"""
+
+    __slots__ = ()
+
+    def start(self, stage: str, total: int):
+        """단계 시작 (보고 대상 없음 - 무시)"""
+
+    def advance(self, count: int = 1, stage: Optional[str] = None):
+        """항목 처리 (보고 대상 없음 - 무시)"""
+
+    def check_cancelled(self):
+        """취소 확인 (보고 대상 없음 - 무시)"""
+
+
+_NULL_PROGRESS = _NullProgress()
+
+
+class ProgressReporter:
+    """단계별 처리 항목 수를 모아 전체 진행률로 보고"""
+
+    def __init__(self, callback: Optional[Callable[[Dict], None]] = None,
+                 cancel_event: Optional[threading.Event] = None,
+                 weights: Optional[Dict[str, float]] = None, min_interval: float = DEFAULT_MIN_INTERVAL):
+        """
+        Args:
+            callback: 진행 상황 콜백 - {'stage', 'label', 'done', 'total', 'stage_percent', 'percent'}
+            cancel_event: 설정되면 다음 advance()/check_cancelled()에서 OperationCancelled 발생
+            weights: 단계별 전체 진행률 비중 (기본값: STAGE_WEIGHTS)
+            min_interval: 콜백 최소 호출 간격 (초)
+        """
+        self.callback = callback
+        self.cancel_event = cancel_event or threading.Event()
+        self.weights = dict(weights or STAGE_WEIGHTS)
+        self.min_interval = min_interval
+        # 단계 → [처리 수, 전체 수]
+        self.stages: Dict[str, list] = {}
+        self.stage = None
+        self._last_report = 0.0
+        self._lock = threading.Lock()
+
+    def cancel(self):
+        """취소 요청"""
+        self.cancel_event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self.cancel_event.is_set()
+
+    def check_cancelled(self):
+        """취소 요청이 있으면 OperationCancelled 발생"""
+        if self.cancel_event.is_set():
+            raise OperationCancelled("작업이 취소되었습니다")
+
+    def start(self, stage: str, total: int):
+        """
+        단계 시작 (같은 단계를 다시 시작하면 처음부터 다시 셈)
+
+        Args:
+            stage: 단계 이름 (STAGE_WEIGHTS 키, 그 외 이름은 전체 진행률에 반영되지 않음)
+            total: 처리할 항목 수
+        """
+        self.check_cancelled()
+        with self._lock:
+            self.stage = stage
+            self.stages[stage] = [0, max(0, total)]
+        self._report(force=True)
+
+    def advance(self, count: int = 1, stage: Optional[str] = None):
+        """
+        항목 count개 처리 (취소 요청 확인 포함)
+
+        Args:
+            stage: 처리한 단계 (None이면 현재 단계) - 그리기와 인코딩이 번갈아 진행될 때 지정,
+                   지정한 단계가 현재 단계가 됨
+        """
+        self.check_cancelled()
+        with self._lock:
+            if stage is not None:
+                self.stage = stage
+            counts = self.stages.get(self.stage)
+            if counts is None:
+                return
+            counts[0] = min(counts[0] + count, counts[1])
+            finished = counts[0] >= counts[1]
+        self._report(force=finished)
+
+    def skip(self, *stages: str):
+        """단계를 처리 없이 완료로 표시 (미리보기에서 계산한 레이아웃 재사용 등)"""
+        with self._lock:
+            for stage in stages:
+                self.stages[stage] = [0, 0]
+        self._report(force=True)
+
+    def complete(self):
+        """모든 단계 완료 처리 (캐시 사용 등으로 건너뛴 단계 포함)"""
+        with self._lock:
+            for stage in self.weights:
+                total = self.stages.get(stage, [0, 0])[1]
+                self.stages[stage] = [total, total]
+        self._report(force=True)
+
+    def get_percent(self) -> float:
+        """전체 진행률 (0~100, 단계별 비중 적용)"""
+        total_weight = sum(self.weights.values())
+        if not total_weight:
+            return 0.0
+        with self._lock:
+            done = sum(weight * self._stage_fraction(stage) for stage, weight in self.weights.items())
+        return done / total_weight * 100
+
+    def _stage_fraction(self, stage: str) -> float:
+        counts = self.stages.get(stage)
+        if counts is None:
+            return 0.0
+        done, total = counts
+        return done / total if total else 1.0
+
+    def snapshot(self) -> Dict:
+        """현재 진행 상황"""
+        percent = self.get_percent()
+        with self._lock:
+            stage = self.stage
+            done, total = self.stages.get(stage, [0, 0])
+            stage_percent = self._stage_fraction(stage) * 100 if stage else 0.0
+        return {
+            'stage': stage,
+            'label': STAGE_LABELS.get(stage, stage),
+            'done': done,
+            'total': total,
+            'stage_percent': stage_percent,
+            'percent': percent
+        }
+
+    def _report(self, force: bool = False):
+        if self.callback is None:
+            return
+        now = time.perf_counter()
+        if not force and now - self._last_report < self.min_interval:
+            return
+        self._last_report = now
+        self.callback(self.snapshot())
+
+
+def get_progress():
+    """현재 스레드의 진행률 보고 대상 (없으면 공용 빈 객체)"""
+    return getattr(_local, 'reporter', None) or _NULL_PROGRESS
+
+
+@contextmanager
+def use_progress(reporter: Optional[ProgressReporter]):
+    """with 블록 동안 현재 스레드의 진행률 보고 대상 지정"""
+    previous = getattr(_local, 'reporter', None)
+    _local.reporter = reporter
+    try:
+        yield reporter
+    finally:
+        _local.reporter = previous
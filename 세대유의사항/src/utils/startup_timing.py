@@ -0,0 +1,103 @@
+"""
+시작 시간 측정 모듈
+모듈 임포트 시간과 첫 창 표시까지의 시간을 기록하고 예산(budget)과 비교합니다.
+
+GUI 시작 시 무거운 라이브러리(PIL, openpyxl 등)가 첫 화면 전에
+로딩되지 않는지 확인하는 용도입니다.
+"""
+
+import importlib
+import os
+import sys
+import threading
+import time
+from typing import Dict, List, Optional
+
+# 첫 창 표시까지의 기본 예산 (초) - 환경 변수로 변경 가능
+DEFAULT_BUDGET_SECONDS = 1.0
+BUDGET_ENV_VAR = 'IMAGE_GENERATOR_STARTUP_BUDGET'
+
+# 첫 창 표시 시점 이름
+FIRST_WINDOW_MARK = 'first_window'
+
+
+class StartupTimer:
+    """시작 단계별 시간 측정"""
+
+    def __init__(self, budget_seconds: Optional[float] = None, origin: Optional[float] = None):
+        """
+        Args:
+            budget_seconds: 첫 창 표시 예산 (None이면 환경 변수 또는 기본값)
+            origin: 측정 기준 시각 (time.perf_counter 값, None이면 생성 시각)
+        """
+        if budget_seconds is None:
+            budget_seconds = float(os.environ.get(BUDGET_ENV_VAR, DEFAULT_BUDGET_SECONDS))
+        self.budget_seconds = budget_seconds
+        self.origin = origin if origin is not None else time.perf_counter()
+        self.marks: Dict[str, float] = {}
+        self.imports: List[Dict] = []
+        self._lock = threading.Lock()
+
+    def elapsed(self) -> float:
+        """기준 시각 이후 경과 시간 (초)"""
+        return time.perf_counter() - self.origin
+
+    def mark(self, name: str) -> float:
+        """시점 기록 (같은 이름은 처음 기록만 유지)"""
+        elapsed = self.elapsed()
+        with self._lock:
+            self.marks.setdefault(name, elapsed)
+            return self.marks[name]
+
+    def timed_import(self, module_name: str, phase: str = 'startup'):
+        """
+        모듈 임포트 후 소요 시간 기록
+
+        Args:
+            module_name: 임포트할 모듈 이름
+            phase: 'startup' (첫 창 이전) 또는 'background' (첫 창 이후)
+        """
+        already_loaded = module_name in sys.modules
+        started = time.perf_counter()
+        module = importlib.import_module(module_name)
+        with self._lock:
+            self.imports.append({
+                'module': module_name,
+                'phase': phase,
+                'seconds': time.perf_counter() - started,
+                'cached': already_loaded
+            })
+        return module
+
+    def first_window_seconds(self) -> Optional[float]:
+        """첫 창 표시까지의 시간 (기록 전이면 None)"""
+        return self.marks.get(FIRST_WINDOW_MARK)
+
+    def within_budget(self) -> bool:
+        """첫 창 표시 시간이 예산 이내인지 확인"""
+        first_window = self.first_window_seconds()
+        return first_window is not None and first_window <= self.budget_seconds
+
+    def report(self) -> str:
+        """임포트 내역과 시점별 시간 보고서"""
+        lines = ["시작 시간 보고서"]
+        for phase, title in (('startup', '첫 창 이전 임포트'), ('background', '백그라운드 임포트')):
+            records = [record for record in self.imports if record['phase'] == phase]
+            if not records:
+                continue
+            lines.append(f"  [{title}]")
+            for record in records:
+                cached = " (이미 로딩됨)" if record['cached'] else ""
+                lines.append(f"    {record['module']:<32} {record['seconds'] * 1000:8.1f} ms{cached}")
+
+        lines.append("  [시점]")
+        for name, seconds in sorted(self.marks.items(), key=lambda item: item[1]):
+            lines.append(f"    {name:<32} {seconds * 1000:8.1f} ms")
+
+        first_window = self.first_window_seconds()
+        if first_window is None:
+            lines.append("  첫 창 표시 기록 없음")
+        else:
+            status = "통과" if self.within_budget() else "초과"
+            lines.append(f"  첫 창 표시 {first_window:.3f}초 / 예산 {self.budget_seconds:.3f}초 → {status}")
+        return "\n".join(lines)
@@ -0,0 +1,164 @@
+"""
+텍스트 측정 엔진 모듈
+폰트별 글자/단어 advance 폭을 캐시하여 줄바꿈 계산 시 반복되는 셰이핑 작업을 제거합니다.
+
+줄 너비는 캐시된 advance 값을 더해서 추정하고, 추정값이 최대 너비 근처에 있을 때만
+실제 draw.textbbox로 다시 측정(커닝/글리프 돌출 보정)하므로 줄바꿈 결과는
+textbbox만 사용하던 기존 방식과 동일합니다.
+"""
+
+import threading
+import weakref
+from typing import Iterable
+
+
+class FontMetrics:
+    """단일 폰트에 대한 advance 폭 테이블과 정확 측정 캐시"""
+
+    # 캐시 최대 보관 수 (초과 시 해당 캐시 전체 비움)
+    MAX_WORD_ENTRIES = 65536
+    MAX_EXACT_ENTRIES = 8192
+
+    def __init__(self, font):
+        """
+        Args:
+            font: ImageFont 객체
+        """
+        # 폰트를 약한 참조로 보관 (TextMeasurer의 WeakKeyDictionary 키가 해제될 수 있도록)
+        try:
+            self._font_ref = weakref.ref(font)
+        except TypeError:
+            self._font_ref = lambda: font
+        size = getattr(font, 'size', None) or 10
+        # 추정값과 textbbox 너비의 허용 오차 (커닝, 첫 글자 왼쪽 베어링, 마지막 글자 돌출)
+        self.tolerance = max(2.0, size * 0.5)
+        self._glyph_advances = {}
+        self._word_advances = {}
+        self._exact_widths = {}
+        self._space_advance = None
+        # getlength를 지원하지 않는 폰트는 항상 정확 측정
+        self.supports_advance = hasattr(font, 'getlength')
+
+    @property
+    def font(self):
+        """측정 대상 ImageFont 객체"""
+        return self._font_ref()
+
+    def glyph_advance(self, char: str) -> float:
+        """글자 하나의 advance 폭 (캐시)"""
+        advance = self._glyph_advances.get(char)
+        if advance is None:
+            advance = self.font.getlength(char)
+            self._glyph_advances[char] = advance
+        return advance
+
+    def word_advance(self, word: str) -> float:
+        """단어의 advance 폭 (단어 내부 커닝 포함, 캐시)"""
+        advance = self._word_advances.get(word)
+        if advance is None:
+            advance = self.font.getlength(word)
+            if len(self._word_advances) >= self.MAX_WORD_ENTRIES:
+                self._word_advances.clear()
+            self._word_advances[word] = advance
+        return advance
+
+    def space_advance(self) -> float:
+        """공백 문자의 advance 폭"""
+        if self._space_advance is None:
+            self._space_advance = self.glyph_advance(' ')
+        return self._space_advance
+
+    def words_advance(self, words: Iterable[str]) -> float:
+        """공백 하나로 연결된 단어 목록의 advance 폭 합계"""
+        total = 0.0
+        count = 0
+        for word in words:
+            total += self.word_advance(word)
+            count += 1
+        if count > 1:
+            total += self.space_advance() * (count - 1)
+        return total
+
+    def text_advance(self, text: str) -> float:
+        """임의 텍스트의 advance 폭 추정 (공백 기준 단어 합산)"""
+        return self.words_advance(text.split(' '))
+
+    def exact_width(self, draw, text: str) -> int:
+        """
+        draw.textbbox 기반 실제 너비 (캐시)
+
+        textbbox 실패 시 예외를 그대로 전달합니다 (호출부에서 기존 fallback 처리).
+        """
+        key = (getattr(draw, 'fontmode', None), text)
+        width = self._exact_widths.get(key)
+        if width is None:
+            bbox = draw.textbbox((0, 0), text, font=self.font)
+            width = bbox[2] - bbox[0]
+            if len(self._exact_widths) >= self.MAX_EXACT_ENTRIES:
+                self._exact_widths.clear()
+            self._exact_widths[key] = width
+        return width
+
+    def fits(self, draw, text: str, max_width: int, estimate: float = None) -> bool:
+        """
+        텍스트가 최대 너비 안에 들어가는지 확인
+
+        Args:
+            draw: ImageDraw 객체
+            text: 확인할 텍스트
+            max_width: 최대 너비
+            estimate: 미리 계산된 advance 합계 (없으면 계산)
+
+        Returns:
+            textbbox 너비 <= max_width 여부
+        """
+        if self.supports_advance:
+            try:
+                if estimate is None:
+                    estimate = self.text_advance(text)
+                if estimate + self.tolerance < max_width:
+                    return True
+                if estimate - self.tolerance > max_width:
+                    return False
+            except Exception:
+                pass  # advance 계산 실패 시 정확 측정으로 진행
+        return self.exact_width(draw, text) <= max_width
+
+
+class TextMeasurer:
+    """폰트별 FontMetrics를 프로세스 전역으로 관리하는 클래스"""
+
+    # 폰트 객체가 해제되면 측정 테이블도 함께 해제됨 (FontCache 제거와 연동)
+    _metrics = weakref.WeakKeyDictionary()
+    _lock = threading.Lock()
+
+    @classmethod
+    def for_font(cls, font) -> FontMetrics:
+        """
+        폰트에 대한 측정 테이블 반환
+
+        Args:
+            font: ImageFont 객체
+
+        Returns:
+            FontMetrics 객체
+        """
+        try:
+            metrics = cls._metrics.get(font)
+        except TypeError:
+            # weakref를 지원하지 않는 폰트는 캐시 없이 사용
+            return FontMetrics(font)
+
+        if metrics is None:
+            with cls._lock:
+                metrics = cls._metrics.get(font)
+                if metrics is None:
+                    metrics = FontMetrics(font)
+                    cls._metrics[font] = metrics
+        return metrics
+
+    @classmethod
+    def clear(cls):
+        """모든 측정 테이블 비우기"""
+        with cls._lock:
+            cls._metrics.clear()
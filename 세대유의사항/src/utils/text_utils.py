@@ -4,6 +4,8 @@
 """
 
 import os
+import threading
+from collections import OrderedDict
 from typing import Optional
 
 # PIL 선택적 임포트 - 없어도 fallback 계산으로 작동
@@ -14,6 +16,152 @@ except ImportError:
     PIL_AVAILABLE = False
     Image = ImageDraw = ImageFont = None
 
+from .line_estimator import LineEstimator
+from .tracing import span
+from .text_measure import TextMeasurer
+
+# 측정 전용 ImageDraw 객체 보관 (스레드별)
+_measure_local = threading.local()
+
+# 기본 폰트 경로 (프로젝트 루트/assets/fonts)
+DEFAULT_FONTS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'assets', 'fonts')
+
+
+class FontCache:
+    """
+    프로세스 전역 폰트 캐시
+    
+    Noto CJK 폰트는 파일 하나가 15MB 이상이라 ImageFont.truetype 호출 비용이 큽니다.
+    (실제 경로, 크기, 굵기) 단위로 로딩된 폰트를 보관하여 TextUtils, PositionSettings,
+    JsonToImage 인스턴스가 모두 같은 폰트 객체를 재사용하도록 합니다.
+    """
+    
+    # 최대 보관 폰트 수 (초과 시 가장 오래 사용하지 않은 폰트부터 제거)
+    MAX_SIZE = 32
+    
+    _fonts = OrderedDict()
+    _lock = threading.Lock()
+    _hits = 0
+    _misses = 0
+    
+    @classmethod
+    def get(cls, font_path: str, size: int, weight: str = 'normal'):
+        """
+        캐시된 폰트 반환 (없으면 로딩 후 저장)
+        
+        Args:
+            font_path: 폰트 파일 경로
+            size: 폰트 크기
+            weight: 폰트 굵기 ('normal', 'bold')
+            
+        Returns:
+            ImageFont 객체 (로딩 실패 시 예외 발생)
+        """
+        key = (os.path.realpath(font_path), int(size), weight)
+        
+        with cls._lock:
+            font = cls._fonts.get(key)
+            if font is not None:
+                cls._fonts.move_to_end(key)
+                cls._hits += 1
+                return font
+        
+        # 폰트 파싱은 락 밖에서 수행 (다른 스레드의 캐시 조회를 막지 않도록)
+        with span('font.load', size=key[1], weight=weight):
+            font = ImageFont.truetype(key[0], key[1])
+        
+        with cls._lock:
+            cls._misses += 1
+            existing = cls._fonts.get(key)
+            if existing is not None:
+                # 다른 스레드가 먼저 로딩한 경우 기존 객체 사용
+                cls._fonts.move_to_end(key)
+                return existing
+            cls._fonts[key] = font
+            while len(cls._fonts) > cls.MAX_SIZE:
+                cls._fonts.popitem(last=False)
+        return font
+    
+    @classmethod
+    def clear(cls):
+        """캐시 비우기"""
+        with cls._lock:
+            cls._fonts.clear()
+            cls._hits = 0
+            cls._misses = 0
+    
+    @classmethod
+    def get_stats(cls) -> dict:
+        """캐시 통계 반환"""
+        with cls._lock:
+            return {
+                'size': len(cls._fonts),
+                'max_size': cls.MAX_SIZE,
+                'hits': cls._hits,
+                'misses': cls._misses
+            }
+
+
+class FontRegistry:
+    """
+    프로세스 전역 폰트 파일 위치 관리
+
+    폰트를 작업마다 임시 폴더로 복사하지 않고 설치 위치(assets/fonts)에서 바로 사용합니다.
+    (폰트 폴더, 굵기)별로 존재하는 후보 파일을 한 번만 확인하며, 지정한 폴더에
+    폰트가 없으면 기본 폰트 폴더에서 찾습니다. 같은 파일은 FontCache에서 한 번만 로딩됩니다.
+    """
+
+    # 굵기별 후보 파일 (앞쪽 우선)
+    FONT_CANDIDATES = {
+        'bold': ['NotoSansCJKkr-Bold.otf', 'NotoSansCJKkr-Bold.ttf', 'NotoSansKR-Bold.ttf', 'malgunbd.ttf', 'malgun.ttf'],
+        'normal': ['NotoSansCJKkr-Regular.otf', 'NotoSansCJKkr-Regular.ttf', 'NotoSansKR-Regular.ttf', 'malgun.ttf'],
+    }
+
+    _resolved = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def resolve(cls, weight: str = 'normal', fonts_path: Optional[str] = None) -> list:
+        """
+        굵기에 맞는 폰트 파일 경로 목록 반환 (존재하는 파일만, 우선순위 순)
+
+        Args:
+            weight: 폰트 굵기 ('normal', 'bold')
+            fonts_path: 우선 검색할 폰트 폴더 (None이면 기본 폰트 폴더)
+        """
+        weight = 'bold' if weight == 'bold' else 'normal'
+        key = (fonts_path or DEFAULT_FONTS_PATH, weight)
+
+        with cls._lock:
+            paths = cls._resolved.get(key)
+        if paths is not None:
+            return paths
+
+        paths = []
+        for directory in dict.fromkeys([fonts_path or DEFAULT_FONTS_PATH, DEFAULT_FONTS_PATH]):
+            paths = [os.path.realpath(os.path.join(directory, name)) for name in cls.FONT_CANDIDATES[weight]
+                     if os.path.exists(os.path.join(directory, name))]
+            if paths:
+                break
+
+        with cls._lock:
+            cls._resolved[key] = paths
+        return paths
+
+    @classmethod
+    def resolve_all(cls, fonts_path: Optional[str] = None) -> list:
+        """
+        굵은/보통 폰트 파일 경로 목록 (폰트 폴더 비교용 - 다른 폴더라도 같은 파일을 쓰면 같은 결과,
+        빈 목록이면 기본 비트맵 폰트 사용)
+        """
+        return cls.resolve('bold', fonts_path) + cls.resolve('normal', fonts_path)
+
+    @classmethod
+    def clear(cls):
+        """확인 결과 비우기 (폰트 파일을 추가/교체한 경우)"""
+        with cls._lock:
+            cls._resolved.clear()
+
 
 class TextUtils:
     """텍스트 처리를 위한 유틸리티 클래스"""
@@ -23,13 +171,8 @@ class TextUtils:
         Args:
             fonts_path: 폰트 파일이 위치한 경로
         """
-        if fonts_path is None:
-            # 기본 폰트 경로 설정 (프로젝트 루트/assets/fonts)
-            self.fonts_path = os.path.join(
-                os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'assets', 'fonts'
-            )
-        else:
-            self.fonts_path = fonts_path
+        # 기본 폰트 경로 설정 (프로젝트 루트/assets/fonts)
+        self.fonts_path = fonts_path or DEFAULT_FONTS_PATH
     
     @staticmethod
     def clean_text_newlines(text) -> str:
@@ -60,6 +203,8 @@ class TextUtils:
         """
         폰트 로딩 (position_settings.py와 json_to_image.py 로직 통합)
         
+        로딩된 폰트는 FontCache에 보관되어 프로세스 전체에서 재사용됩니다.
+        
         Args:
             size: 폰트 크기
             weight: 폰트 굵기 ('normal', 'bold')
@@ -71,30 +216,18 @@ class TextUtils:
         if not PIL_AVAILABLE:
             return None
             
-        # 제목/번호용 또는 Bold 폰트 - Bold 우선
+        # 제목/번호용 또는 Bold 폰트 - Bold 우선, 내용용 폰트 - Regular 우선
         if font_type in ['title', 'number'] or weight == 'bold':
-            font_paths = [
-                os.path.join(self.fonts_path, 'NotoSansCJKkr-Bold.otf'),
-                os.path.join(self.fonts_path, 'NotoSansCJKkr-Bold.ttf'),
-                os.path.join(self.fonts_path, 'NotoSansKR-Bold.ttf'),
-                os.path.join(self.fonts_path, 'malgunbd.ttf'),
-                os.path.join(self.fonts_path, 'malgun.ttf')
-            ]
+            resolved_weight = 'bold'
         else:
-            # 내용용 폰트 - Regular 우선
-            font_paths = [
-                os.path.join(self.fonts_path, 'NotoSansCJKkr-Regular.otf'),
-                os.path.join(self.fonts_path, 'NotoSansCJKkr-Regular.ttf'),
-                os.path.join(self.fonts_path, 'NotoSansKR-Regular.ttf'),
-                os.path.join(self.fonts_path, 'malgun.ttf')
-            ]
+            resolved_weight = 'normal'
 
-        for font_path in font_paths:
-            if os.path.exists(font_path):
-                try:
-                    return ImageFont.truetype(font_path, size)
-                except Exception:
-                    continue
+        # 폰트 파일은 설치 위치에서 바로 사용 (복사 없음)
+        for font_path in FontRegistry.resolve(resolved_weight, self.fonts_path):
+            try:
+                return FontCache.get(font_path, size, resolved_weight)
+            except Exception:
+                continue
                     
         return ImageFont.load_default() if ImageFont else None
     
@@ -115,13 +248,13 @@ class TextUtils:
         if not PIL_AVAILABLE or draw is None or font is None:
             return self._wrap_text_fallback(text, max_width)
             
+        # 글자/단어 advance 캐시 기반 측정 (최대 너비 근처에서만 textbbox 사용)
+        metrics = TextMeasurer.for_font(font)
+        
         # 먼저 전체 텍스트 크기 확인
         try:
-            full_bbox = draw.textbbox((0, 0), text, font=font)
-            full_width = full_bbox[2] - full_bbox[0]
-            
             # 전체 텍스트가 max_width에 맞으면 1줄로 반환
-            if full_width <= max_width:
+            if metrics.fits(draw, text, max_width):
                 return [text]
                 
         except Exception:
@@ -140,13 +273,12 @@ class TextUtils:
             test_text = ' '.join(test_line)
             
             try:
-                bbox = draw.textbbox((0, 0), test_text, font=font)
-                text_width = bbox[2] - bbox[0]
+                fits = metrics.fits(draw, test_text, max_width)
             except Exception:
                 # textbbox 실패 시 fallback 계산
-                text_width = len(test_text) * 20  # 대략적인 추정
+                fits = len(test_text) * 20 <= max_width  # 대략적인 추정
             
-            if text_width <= max_width:
+            if fits:
                 current_line = test_line
             else:
                 if current_line:
@@ -177,100 +309,56 @@ class TextUtils:
         if len(word) <= 1:
             return [word]
             
-        # 문자 단위로 나누어 max_width에 맞게 분할
+        # 문자 단위로 나누어 max_width에 맞게 분할 (글자별 advance 누적으로 추정)
+        metrics = TextMeasurer.for_font(font)
         result = []
         current_part = ""
+        current_advance = 0.0
         
         for char in word:
             test_text = current_part + char
+            test_advance = self._extend_advance(metrics, current_advance, char)
             try:
-                bbox = draw.textbbox((0, 0), test_text, font=font)
-                text_width = bbox[2] - bbox[0]
+                fits = metrics.fits(draw, test_text, max_width, test_advance)
             except Exception:
-                text_width = len(test_text) * 20
+                fits = len(test_text) * 20 <= max_width
                 
-            if text_width <= max_width:
+            if fits:
                 current_part = test_text
+                current_advance = test_advance
             else:
                 if current_part:
                     result.append(current_part)
                     current_part = char
+                    current_advance = self._extend_advance(metrics, 0.0, char)
                 else:
                     # 단일 문자도 넘치는 경우
                     result.append(char)
                     current_part = ""
+                    current_advance = 0.0
         
         if current_part:
             result.append(current_part)
             
         return result if result else [word]
     
+    @staticmethod
+    def _extend_advance(metrics, current_advance, char):
+        """누적 advance에 글자 하나를 더함 (측정 불가 시 None → 정확 측정 사용)"""
+        if current_advance is None:
+            return None
+        try:
+            return current_advance + metrics.glyph_advance(char)
+        except Exception:
+            return None
+    
     def _wrap_text_fallback(self, text: str, max_width: int) -> list:
-        """PIL 없이 텍스트 줄바꿈 (fallback, 개선된 한글 처리)"""
-        # 너무 긴 단어는 강제로 분할 (한글의 경우)
-        words = self._split_long_words(text.split(), max_width)
-        lines = []
-        current_line = []
-        current_width = 0
-        
-        if not words:
-            return ['']
-        
-        for word in words:
-            # 한글과 영어/숫자를 구분하여 너비 추정
-            korean_chars = sum(1 for c in word if ord(c) >= 0xAC00 and ord(c) <= 0xD7A3)
-            other_chars = len(word) - korean_chars
-            word_width = korean_chars * 30 + other_chars * 18
-            
-            # 공백 포함 계산
-            space_width = 18 if current_line else 0
-            total_width = current_width + space_width + word_width
-            
-            if total_width <= max_width:
-                current_line.append(word)
-                current_width += space_width + word_width
-            else:
-                if current_line:
-                    lines.append(' '.join(current_line))
-                    current_line = [word]
-                    current_width = word_width
-                else:
-                    # 단일 단어가 너무 긴 경우 (이미 분할되었어야 함)
-                    lines.append(word)
-                    current_line = []
-                    current_width = 0
-        
-        if current_line:
-            lines.append(' '.join(current_line))
-        
-        return lines if lines else [text]
+        """PIL 없이 텍스트 줄바꿈 (fallback, 개선된 한글 처리 - LineEstimator 단어 폭 표 사용)"""
+        return LineEstimator.wrap(text, max_width)
     
     def _split_long_words(self, words: list, max_width: int) -> list:
         """너무 긴 단어를 적절히 분할"""
-        result = []
-        max_chars_per_word = max_width // 25  # 대략적인 문자 수 제한
-        
-        for word in words:
-            if len(word) <= max_chars_per_word:
-                result.append(word)
-            else:
-                # 긴 단어를 적절한 크기로 분할
-                while len(word) > max_chars_per_word:
-                    # 한글 단어의 경우 의미 단위로 분할 시도
-                    split_pos = max_chars_per_word
-                    # 쉼표나 구두점이 있으면 그 지점에서 분할
-                    for i, char in enumerate(word[:max_chars_per_word]):
-                        if char in ',，.。;；:：':
-                            split_pos = i + 1
-                            break
-                    
-                    result.append(word[:split_pos])
-                    word = word[split_pos:]
-                
-                if word:  # 남은 부분 추가
-                    result.append(word)
-        
-        return result
+        return LineEstimator.split_long_words(words, max_width)
     
     def calculate_text_lines_accurate(self, text: str, max_width: int, font_size: int, 
                                     font_type: str = 'content', font_weight: str = 'normal') -> int:
@@ -287,42 +375,80 @@ class TextUtils:
         Returns:
             필요한 라인 수
         """
+        line_count, _ = self.measure_text_lines(text, max_width, font_size, font_type, font_weight)
+        return line_count
+    
+    def measure_text_lines(self, text: str, max_width: int, font_size: int,
+                           font_type: str = 'content', font_weight: str = 'normal') -> tuple:
+        """
+        실제 폰트를 사용하여 줄바꿈하고 라인 수와 실제 라인 문자열을 함께 반환
+        
+        레이아웃 계산 결과(줄 수)와 렌더링에 사용할 줄바꿈 결과를 한 번의 측정으로 얻기 위해 사용합니다.
+        
+        Args:
+            text: 계산할 텍스트
+            max_width: 최대 너비
+            font_size: 폰트 크기
+            font_type: 폰트 타입 ('title', 'number', 'content')
+            font_weight: 폰트 굵기 ('normal', 'bold')
+            
+        Returns:
+            (라인 수, 줄바꿈된 라인 리스트)
+        """
         
         # 개행문자 전처리
         cleaned_text = self.clean_text_newlines(text)
         
         # 빈 텍스트 처리
         if not cleaned_text.strip():
-            return 1
+            return 1, ['']
         
         # PIL 사용 불가능한 경우 바로 fallback 사용
         if not PIL_AVAILABLE:
-            return self._calculate_text_lines_fallback(cleaned_text, max_width)
+            return self._measure_text_lines_fallback(cleaned_text, max_width)
             
         try:
-            # 임시 이미지 생성하여 실제 폰트로 측정
-            temp_img = Image.new('RGB', (1, 1))
-            temp_draw = ImageDraw.Draw(temp_img)
+            # 측정용 Draw 객체로 실제 폰트 측정
+            temp_draw = self._get_measure_draw()
             
             font = self.get_font(font_size, font_weight, font_type)
             if font is None:
-                return self._calculate_text_lines_fallback(cleaned_text, max_width)
+                return self._measure_text_lines_fallback(cleaned_text, max_width)
             
             # 실제 줄바꿈 계산
             lines = self.wrap_text_to_fit(temp_draw, cleaned_text, font, max_width)
-            actual_lines = len(lines)
-            
             
-            return max(1, actual_lines)
+            return max(1, len(lines)), lines
             
         except Exception as e:
             # 폰트 로딩 실패 시 기본 계산 방식 사용
-            return self._calculate_text_lines_fallback(cleaned_text, max_width)
+            return self._measure_text_lines_fallback(cleaned_text, max_width)
+    
+    def _measure_text_lines_fallback(self, text: str, max_width: int) -> tuple:
+        """
+        PIL 없이 라인 수와 추정 줄바꿈 결과 반환
+
+        줄 수는 줄바꿈 결과에서 구함 (박스 높이와 그릴 줄이 같은 계산에서 나오도록 - 개수만 따로 추정하면 어긋남)
+        """
+        lines = self._wrap_text_fallback(text, max_width)
+        return max(1, len(lines)), lines
+    
+    @staticmethod
+    def _get_measure_draw():
+        """측정 전용 1x1 ImageDraw 객체 (스레드별로 재사용)"""
+        draw = getattr(_measure_local, 'draw', None)
+        if draw is None:
+            draw = ImageDraw.Draw(Image.new('RGB', (1, 1)))
+            _measure_local.draw = draw
+        return draw
     
     def _calculate_text_lines_fallback(self, text: str, max_width: int) -> int:
         """
         폰트 로딩 실패 시 사용하는 대체 계산 방식 (개선된 한글 추정)
         
+        한글 약 30px, 영어/숫자 약 18px(36pt 폰트 기준)로 단어 폭을 추정합니다.
+        단어 폭은 LineEstimator 표에 한 번만 계산해 두고 재사용합니다.
+        
         Args:
             text: 계산할 텍스트
             max_width: 최대 너비
@@ -330,52 +456,7 @@ class TextUtils:
         Returns:
             추정 라인 수
         """
-        
-        # 한글과 영어/숫자를 구분하여 더 정확한 추정
-        korean_chars = sum(1 for c in text if ord(c) >= 0xAC00 and ord(c) <= 0xD7A3)
-        other_chars = len(text) - korean_chars
-        
-        # 한글: 약 30px, 영어/숫자: 약 18px로 추정 (36pt 폰트 기준)
-        estimated_width = korean_chars * 30 + other_chars * 18
-        
-        if estimated_width <= max_width:
-            total_lines = 1
-        else:
-            # 단어 단위로 줄바꿈을 고려한 더 정확한 계산
-            words = text.split()
-            lines = []
-            current_line = []
-            current_width = 0
-            
-            for word in words:
-                word_korean_chars = sum(1 for c in word if ord(c) >= 0xAC00 and ord(c) <= 0xD7A3)
-                word_other_chars = len(word) - word_korean_chars
-                word_width = word_korean_chars * 30 + word_other_chars * 18
-                
-                # 공백 포함 계산
-                if current_line:
-                    word_width += 18  # 공백 너비
-                
-                if current_width + word_width <= max_width:
-                    current_line.append(word)
-                    current_width += word_width
-                else:
-                    if current_line:
-                        lines.append(' '.join(current_line))
-                        current_line = [word]
-                        current_width = word_width - (18 if len(current_line) > 1 else 0)  # 공백 제거
-                    else:
-                        # 단일 단어가 너무 긴 경우
-                        lines.append(word)
-                        current_line = []
-                        current_width = 0
-            
-            if current_line:
-                lines.append(' '.join(current_line))
-            
-            total_lines = len(lines) if lines else 1
-        
-        return max(1, total_lines)
+        return LineEstimator.count_lines(text, max_width)
     
     def get_text_actual_height(self, text: str, font_size: int, max_width: int,
                               font_type: str = 'content', font_weight: str = 'normal',
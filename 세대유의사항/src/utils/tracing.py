@@ -0,0 +1,286 @@
+"""
+단계별 시간 측정(추적) 모듈
+이름 있는 구간(span)으로 엑셀 읽기, 헤더 감지, 레이아웃, 폰트 로딩, 그리기, 인코딩, 저장 시간을 기록합니다.
+
+    with span('draw', band_top=0):
+        ...
+
+- 기본값은 꺼짐: span()은 전역 추적기가 없으면 공용 빈 객체를 그대로 반환 (거의 비용 없음)
+- 구간은 스레드별로 중첩되며 (depth, parent) 기록 - 인코딩 스레드의 구간은 별도 스레드로 표시
+- 기록 방식(sink)은 교체 가능: GUI 로그(LogSink), JSON Lines(JsonLinesSink), Chrome 추적 형식(ChromeTraceSink)
+
+Chrome 추적 파일은 chrome://tracing 또는 https://ui.perfetto.dev 에서 열 수 있습니다.
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional
+
+# 전역 추적기 (None이면 추적 꺼짐)
+_tracer: Optional['Tracer'] = None
+
+
+class _NullSpan:
+    """추적이 꺼져 있을 때 사용하는 빈 구간"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def set(self, **attrs):
+        """구간 속성 추가 (추적 꺼짐 - 무시)"""
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Span:
+    """추적 구간 (with 문으로 사용)"""
+
+    __slots__ = ('tracer', 'name', 'attrs', 'start', 'depth', 'parent')
+
+    def __init__(self, tracer: 'Tracer', name: str, attrs: Dict):
+        self.tracer = tracer
+        self.name = name
+        self.attrs = attrs
+        self.start = 0.0
+        self.depth = 0
+        self.parent = None
+
+    def set(self, **attrs):
+        """구간 속성 추가 (결과 크기 등 끝날 때 알 수 있는 값)"""
+        self.attrs.update(attrs)
+
+    def __enter__(self):
+        stack = self.tracer._get_stack()
+        if stack:
+            self.parent = stack[-1].name
+        self.depth = len(stack)
+        stack.append(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        duration = time.perf_counter() - self.start
+        stack = self.tracer._get_stack()
+        if stack and stack[-1] is self:
+            stack.pop()
+        if exc_type is not None:
+            self.attrs['error'] = exc_type.__name__
+        self.tracer.emit({
+            'name': self.name,
+            'start': self.start - self.tracer.origin,
+            'duration': duration,
+            'depth': self.depth,
+            'parent': self.parent,
+            'pid': os.getpid(),
+            'thread': threading.get_ident(),
+            'thread_name': threading.current_thread().name,
+            'attrs': self.attrs
+        })
+        return False
+
+
+class TraceSink:
+    """추적 기록 방식 기본 클래스"""
+
+    def emit(self, record: Dict):
+        """
+        끝난 구간 기록
+
+        Args:
+            record: {'name', 'start', 'duration', 'depth', 'parent', 'pid', 'thread', 'thread_name', 'attrs'}
+                    (start는 추적 시작 이후 초, duration은 초)
+        """
+        raise NotImplementedError
+
+    def close(self):
+        """기록 마무리 (파일 닫기 등)"""
+
+
+class LogSink(TraceSink):
+    """구간을 로그 함수(GUI 로그 창, print 등)로 한 줄씩 출력"""
+
+    def __init__(self, log_func: Callable[[str], None] = print, min_seconds: float = 0.0,
+                 max_depth: Optional[int] = None, names: Optional[Iterable[str]] = None):
+        """
+        Args:
+            log_func: 메시지 출력 함수
+            min_seconds: 이보다 짧은 구간은 출력하지 않음
+            max_depth: 이보다 깊게 중첩된 구간은 출력하지 않음 (None이면 모두)
+            names: 출력할 구간 이름 (None이면 모두 - 청크별 구간이 많을 때 주요 단계만 출력)
+        """
+        self.log_func = log_func
+        self.min_seconds = min_seconds
+        self.max_depth = max_depth
+        self.names = frozenset(names) if names is not None else None
+
+    def emit(self, record: Dict):
+        if self.names is not None and record['name'] not in self.names:
+            return
+        if record['duration'] < self.min_seconds:
+            return
+        if self.max_depth is not None and record['depth'] > self.max_depth:
+            return
+        attrs = ' '.join(f"{key}={value}" for key, value in record['attrs'].items())
+        indent = '  ' * record['depth']
+        self.log_func(f"⏱️ {indent}{record['name']} {record['duration'] * 1000:.1f}ms {attrs}".rstrip())
+
+
+class JsonLinesSink(TraceSink):
+    """구간을 JSON Lines 파일에 한 줄씩 기록"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'w', encoding='utf-8')
+        self._lock = threading.Lock()
+
+    def emit(self, record: Dict):
+        line = json.dumps(record, ensure_ascii=False, default=str)
+        with self._lock:
+            if self._file is not None:
+                self._file.write(line + '\n')
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class ChromeTraceSink(TraceSink):
+    """구간을 Chrome 추적 형식(Trace Event Format) 파일로 저장 (close()에서 기록)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._events: List[Dict] = []
+        self._thread_names: Dict = {}
+        self._lock = threading.Lock()
+
+    def emit(self, record: Dict):
+        event = {
+            'name': record['name'],
+            'cat': record['parent'] or 'root',
+            'ph': 'X',
+            'ts': record['start'] * 1e6,
+            'dur': record['duration'] * 1e6,
+            'pid': record['pid'],
+            'tid': record['thread'],
+            'args': record['attrs']
+        }
+        with self._lock:
+            self._events.append(event)
+            self._thread_names[(record['pid'], record['thread'])] = record['thread_name']
+
+    def close(self):
+        with self._lock:
+            events = list(self._events)
+            for (pid, tid), name in self._thread_names.items():
+                events.append({'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid, 'args': {'name': name}})
+            self._events = []
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f, ensure_ascii=False, default=str)
+
+
+class Tracer:
+    """구간 기록 관리 (등록된 sink로 전달하고 이름별 합계 보관)"""
+
+    def __init__(self, sinks: List[TraceSink]):
+        self.sinks = list(sinks)
+        self.origin = time.perf_counter()
+        # 이름 → [횟수, 합계 초]
+        self.totals: Dict[str, List] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _get_stack(self) -> List[Span]:
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def span(self, name: str, attrs: Dict) -> Span:
+        return Span(self, name, attrs)
+
+    def emit(self, record: Dict):
+        with self._lock:
+            total = self.totals.setdefault(record['name'], [0, 0.0])
+            total[0] += 1
+            total[1] += record['duration']
+        for sink in self.sinks:
+            sink.emit(record)
+
+    def summary(self) -> str:
+        """구간 이름별 횟수/합계 시간 (긴 순서)"""
+        with self._lock:
+            totals = sorted(self.totals.items(), key=lambda item: item[1][1], reverse=True)
+        lines = ["단계별 시간 합계"]
+        for name, (count, seconds) in totals:
+            lines.append(f"  {name:<20} {seconds * 1000:10.1f} ms  ({count}회)")
+        return "\n".join(lines)
+
+    def close(self):
+        for sink in self.sinks:
+            sink.close()
+
+
+def span(name: str, **attrs):
+    """
+    추적 구간 (with span('encode', profile='default'): ...)
+
+    추적이 꺼져 있으면 공용 빈 구간을 반환합니다.
+    """
+    tracer = _tracer
+    if tracer is None:
+        return _NULL_SPAN
+    return tracer.span(name, attrs)
+
+
+def traced(name: str):
+    """함수 전체를 추적 구간으로 기록하는 데코레이터"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            tracer = _tracer
+            if tracer is None:
+                return func(*args, **kwargs)
+            with tracer.span(name, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def enable_tracing(*sinks: TraceSink) -> Tracer:
+    """추적 켜기 (이미 켜져 있으면 기존 추적기를 닫고 교체)"""
+    global _tracer
+    disable_tracing()
+    _tracer = Tracer(list(sinks))
+    return _tracer
+
+
+def disable_tracing() -> Optional[Tracer]:
+    """추적 끄기 (sink 닫기) - 끈 추적기 반환"""
+    global _tracer
+    tracer, _tracer = _tracer, None
+    if tracer is not None:
+        tracer.close()
+    return tracer
+
+
+def get_tracer() -> Optional[Tracer]:
+    """현재 추적기 (꺼져 있으면 None)"""
+    return _tracer
+
+
+def create_file_sink(path: str) -> TraceSink:
+    """파일 확장자로 기록 방식 선택 (.jsonl → JSON Lines, 그 외 → Chrome 추적 형식)"""
+    if path.lower().endswith('.jsonl'):
+        return JsonLinesSink(path)
+    return ChromeTraceSink(path)
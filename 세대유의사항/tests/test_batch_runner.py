@@ -0,0 +1,61 @@
+"""BatchRunner 병렬 실행 테스트"""
+
+import os
+import tempfile
+import unittest
+from concurrent.futures import Future
+from unittest import mock
+
+from src.core import batch_runner
+from src.core.batch_runner import BatchJob, BatchRunner, get_worker_encode_threads
+
+
+class _InProcessExecutor:
+    """ProcessPoolExecutor 대신 현재 프로세스에서 워커 초기화만 실행 (작업은 실행하지 않음)"""
+
+    def __init__(self, max_workers, initializer, initargs):
+        self.max_workers = max_workers
+        initializer(*initargs)
+
+    def submit(self, fn, *args):
+        future = Future()
+        future.set_exception(RuntimeError("테스트에서는 작업을 실행하지 않음"))
+        return future
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+class WorkerEncodeThreadsTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        template_path = os.path.join(self.temp_dir.name, '테스트_템플릿.png')
+        open(template_path, 'wb').close()
+        self.jobs = [BatchJob(f'{index}.xlsx', '테스트', template_path) for index in range(4)]
+        self.addCleanup(setattr, batch_runner, '_worker_runner', None)
+
+    def run_parallel(self, workers):
+        runner = BatchRunner(os.path.join(self.temp_dir.name, 'out'), log=lambda message: None)
+        with mock.patch.object(batch_runner, 'ProcessPoolExecutor', _InProcessExecutor), \
+                mock.patch('os.cpu_count', return_value=8):
+            runner.run(self.jobs, workers=workers)
+        return batch_runner._worker_runner
+
+    def test_worker_receives_share_of_cpu_cores(self):
+        self.assertEqual(self.run_parallel(2).encode_workers, 4)
+        self.assertEqual(self.run_parallel(3).encode_workers, 2)
+
+    def test_at_least_one_thread_per_worker(self):
+        with mock.patch('os.cpu_count', return_value=2):
+            self.assertEqual(get_worker_encode_threads(4), 1)
+
+    def test_single_process_keeps_default(self):
+        self.assertIsNone(get_worker_encode_threads(1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,31 @@
+"""출력 형식(프로파일) 테스트"""
+
+import io
+import unittest
+
+from PIL import Image
+
+from src.core.output_profiles import get_output_profile
+
+
+class JpegMaxDimensionTest(unittest.TestCase):
+    def setUp(self):
+        self.profile = get_output_profile('jpeg')
+
+    def test_largest_supported_height_saves(self):
+        self.assertTrue(self.profile.supports_size((1, 65500)))
+        data, record = self.profile.encode(Image.new('RGBA', (1, 65500), (255, 255, 255, 255)))
+        self.assertEqual(record['bytes'], len(data))
+        with Image.open(io.BytesIO(data)) as image:
+            self.assertEqual(image.size, (1, 65500))
+
+    def test_boundary_above_libjpeg_limit_is_rejected(self):
+        # libjpeg는 65500px(JPEG_MAX_DIMENSION)보다 큰 이미지를 거부하므로 저장 전에 건너뛰어야 함
+        self.assertFalse(self.profile.supports_size((1, 65501)))
+        self.assertFalse(self.profile.supports_size((65501, 1)))
+        with self.assertRaises(ValueError):
+            self.profile.encode(Image.new('RGBA', (1, 65501)))
+
+
+if __name__ == '__main__':
+    unittest.main()